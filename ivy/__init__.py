@@ -8,6 +8,7 @@ import sys
 
 
 import ivy.utils.backend.handler
+from ivy.utils.context import ContextStack
 from ivy._version import __version__ as __version__
 
 _not_imported_backends = list(ivy.utils.backend.handler._backend_dict.keys())
@@ -436,11 +437,11 @@ class Node(str):
     pass
 
 
-array_significant_figures_stack = list()
-array_decimal_values_stack = list()
-warning_level_stack = list()
-nan_policy_stack = list()
-dynamic_backend_stack = list()
+array_significant_figures_stack = ContextStack("array_significant_figures_stack")
+array_decimal_values_stack = ContextStack("array_decimal_values_stack")
+warning_level_stack = ContextStack("warning_level_stack")
+nan_policy_stack = ContextStack("nan_policy_stack")
+dynamic_backend_stack = ContextStack("dynamic_backend_stack")
 warn_to_regex = {"all": "!.*", "ivy_only": "^(?!.*ivy).*$", "none": ".*"}
 
 
@@ -842,6 +843,10 @@ from .data_classes.container import conversions as cont_conversions
 from .data_classes.container import (
     ContainerBase,
     Container,
+    ContainerPrefetcher,
+    SharedMemoryHandle,
+    to_shared_memory,
+    from_shared_memory,
     add_ivy_container_instance_methods,
 )
 from .nested_array import NestedArray
@@ -860,6 +865,7 @@ from ivy.utils.backend import (
     backend_stack,
     choose_random_backend,
     unset_backend,
+    clear_backend_cache,
 )
 from . import func_wrapper
 from .utils import assertions, exceptions, verbosity
@@ -1023,6 +1029,8 @@ globals_vars = GlobalsDict(
         "array_mode_stack": general.array_mode_stack,
         "shape_array_mode_stack": general.shape_array_mode_stack,
         "nestable_mode_stack": general.nestable_mode_stack,
+        "dispatch_cache_mode_stack": general.dispatch_cache_mode_stack,
+        "raw_mode_stack": general.raw_mode_stack,
         "exception_trace_mode_stack": general.exception_trace_mode_stack,
         "default_dtype_stack": data_type.default_dtype_stack,
         "default_float_dtype_stack": data_type.default_float_dtype_stack,
@@ -1241,26 +1249,51 @@ def get_nan_policy():
     if not nan_policy_stack:
         ret = "nothing"
     else:
-        ret = nan_policy_stack[-1]
+        ret = nan_policy_stack[-1][0]
     return ret
 
 
-def set_nan_policy(warn_level):
+def set_nan_policy(warn_level, *, check="inputs", sample_every=1, sample_rate=1.0):
     """
     Summary.
 
     Parameters
     ----------
-    nan_policy
+    warn_level
         string for the nan policy to be set, one of
         "nothing", "warns", "raise_exception"
+    check
+        which arrays of the functions handling nans are checked, one of "inputs",
+        "outputs" and "all". Default is "inputs".
+    sample_every
+        only check every ``sample_every``-th call of each function, bounding the
+        overhead of the checks. Default is 1, checking every call.
+    sample_rate
+        the probability of each of these calls being checked. Default is 1.0.
+
+    Examples
+    --------
+    >>> ivy.set_nan_policy("warns", check="outputs", sample_every=100)
+    >>> ivy.get_nan_policy()
+    'warns'
+    >>> ivy.unset_nan_policy()
     """
     global nan_policy_stack
     if warn_level not in ["nothing", "warns", "raise_exception"]:
         raise ivy.utils.exceptions.IvyException(
             "nan_policy must be one of 'nothing', 'warns', 'raise_exception'"
         )
-    nan_policy_stack.append(warn_level)
+    if check not in ["inputs", "outputs", "all"]:
+        raise ivy.utils.exceptions.IvyException(
+            "check must be one of 'inputs', 'outputs', 'all'"
+        )
+    if not (isinstance(sample_every, int) and sample_every >= 1):
+        raise ivy.utils.exceptions.IvyException(
+            "sample_every must be a positive integer"
+        )
+    if not 0 < sample_rate <= 1:
+        raise ivy.utils.exceptions.IvyException("sample_rate must be in (0, 1]")
+    nan_policy_stack.append((warn_level, check, sample_every, sample_rate))
 
 
 def unset_nan_policy():
@@ -1275,11 +1308,10 @@ def unset_nan_policy():
 
 def get_dynamic_backend():
     """Return the current dynamic backend setting, with the default being True."""
-    global dynamic_backend_stack
-    if not dynamic_backend_stack:
+    stack = dynamic_backend_stack.get()
+    if not stack:
         return True
-    else:
-        return dynamic_backend_stack[-1]
+    return stack[-1]
 
 
 def set_dynamic_backend(flag):
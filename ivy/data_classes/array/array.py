@@ -29,6 +29,7 @@ from .sorting import _ArrayWithSorting
 from .statistical import _ArrayWithStatistical
 from .utility import _ArrayWithUtility
 from ivy.func_wrapper import handle_view_indexing
+from ivy.utils.backend.handler import _dynamic_backend_objects
 from .experimental import (
     _ArrayWithSearchingExperimental,
     _ArrayWithActivationsExperimental,
@@ -94,53 +95,36 @@ class Array(
     _ArrayWithStatisticalExperimental,
     _ArrayWithUtilityExperimental,
 ):
+    # the core fields are stored in slots, the mixins have no state of their own
+    __slots__ = (
+        "_data",
+        "_dtype",
+        "_device",
+        "_dev_str",
+        "_size",
+        "_itemsize",
+        "_strides",
+        "_post_repr",
+        "_dynamic_backend",
+        "backend",
+        "_base",
+        "_view_refs",
+        "_manipulation_stack",
+        "_torch_base",
+        "_torch_view_refs",
+        "_torch_manipulation",
+    )
+
+    _pre_repr = "ivy.array"
+
     def __init__(self, data, dynamic_backend=None):
-        _ArrayWithActivations.__init__(self)
-        _ArrayWithCreation.__init__(self)
-        _ArrayWithDataTypes.__init__(self)
-        _ArrayWithDevice.__init__(self)
-        _ArrayWithElementwise.__init__(self)
-        _ArrayWithGeneral.__init__(self)
-        _ArrayWithGradients.__init__(self)
-        _ArrayWithImage.__init__(self)
-        _ArrayWithLayers.__init__(self)
-        _ArrayWithLinearAlgebra.__init__(self)
-        _ArrayWithLosses.__init__(self)
-        _ArrayWithManipulation.__init__(self)
-        _ArrayWithNorms.__init__(self)
-        _ArrayWithRandom.__init__(self)
-        _ArrayWithSearching.__init__(self)
-        _ArrayWithSet.__init__(self)
-        _ArrayWithSorting.__init__(self)
-        _ArrayWithStatistical.__init__(self)
-        _ArrayWithUtility.__init__(self)
-        _ArrayWithActivationsExperimental.__init__(self),
-        _ArrayWithConversionsExperimental.__init__(self),
-        _ArrayWithCreationExperimental.__init__(self),
-        _ArrayWithData_typeExperimental.__init__(self),
-        _ArrayWithDeviceExperimental.__init__(self),
-        _ArrayWithElementWiseExperimental.__init__(self),
-        _ArrayWithGeneralExperimental.__init__(self),
-        _ArrayWithGradientsExperimental.__init__(self),
-        _ArrayWithImageExperimental.__init__(self),
-        _ArrayWithLayersExperimental.__init__(self),
-        _ArrayWithLinearAlgebraExperimental.__init__(self),
-        _ArrayWithLossesExperimental.__init__(self),
-        _ArrayWithManipulationExperimental.__init__(self),
-        _ArrayWithNormsExperimental.__init__(self),
-        _ArrayWithRandomExperimental.__init__(self),
-        _ArrayWithSearchingExperimental.__init__(self),
-        _ArrayWithSetExperimental.__init__(self),
-        _ArrayWithSortingExperimental.__init__(self),
-        _ArrayWithStatisticalExperimental.__init__(self),
-        _ArrayWithUtilityExperimental.__init__(self),
         self._init(data, dynamic_backend)
         self._view_attributes(data)
 
     def _init(self, data, dynamic_backend=None):
-        if ivy.is_ivy_array(data):
+        if isinstance(data, ivy.Array):
             self._data = data.data
-        elif ivy.is_native_array(data):
+        elif isinstance(data, ivy.NativeArray) or ivy.is_native_array(data):
             self._data = data
         elif isinstance(data, np.ndarray):
             self._data = ivy.asarray(data)._data
@@ -148,24 +132,24 @@ class Array(
             raise ivy.utils.exceptions.IvyException(
                 "data must be ivy array, native array or ndarray"
             )
-        self._size = (
-            functools.reduce(mul, self._data.shape) if len(self._data.shape) > 0 else 0
-        )
-        self._itemsize = ivy.itemsize(self._data)
-        self._strides = ivy.strides(self._data)
-        self._dtype = ivy.dtype(self._data)
-        self._device = ivy.dev(self._data)
-        self._dev_str = ivy.as_ivy_dev(self._device)
-        self._pre_repr = "ivy.array"
-        if "gpu" in self._dev_str:
-            self._post_repr = ", dev={})".format(self._dev_str)
-        else:
-            self._post_repr = ")"
+        self._reset_metadata()
         self.backend = ivy.current_backend_str()
         if dynamic_backend is not None:
             self._dynamic_backend = dynamic_backend
         else:
             self._dynamic_backend = ivy.get_dynamic_backend()
+        if self._dynamic_backend:
+            _dynamic_backend_objects.add(self)
+
+    def _reset_metadata(self):
+        # the metadata is computed lazily from the native array, on first access
+        self._dtype = None
+        self._device = None
+        self._dev_str = None
+        self._size = None
+        self._itemsize = None
+        self._strides = None
+        self._post_repr = None
 
     def _view_attributes(self, data):
         self._base = None
@@ -175,6 +159,19 @@ class Array(
         self._torch_view_refs = []
         self._torch_manipulation = None
 
+    def _get_dev_str(self):
+        if self._dev_str is None:
+            self._dev_str = ivy.as_ivy_dev(self.device)
+        return self._dev_str
+
+    def _get_post_repr(self):
+        if self._post_repr is None:
+            if "gpu" in self._get_dev_str():
+                self._post_repr = ", dev={})".format(self._dev_str)
+            else:
+                self._post_repr = ")"
+        return self._post_repr
+
     # Properties #
     # ---------- #
 
@@ -207,6 +204,8 @@ class Array(
             else:
                 np_data = to_numpy(self.data)
                 self._data = ivy.array(np_data).data
+            self._reset_metadata()
+            _dynamic_backend_objects.add(self)
 
         self._dynamic_backend = value
 
@@ -218,11 +217,15 @@ class Array(
     @property
     def dtype(self) -> ivy.Dtype:
         """Data type of the array elements."""
+        if self._dtype is None:
+            self._dtype = ivy.dtype(self._data)
         return self._dtype
 
     @property
     def device(self) -> ivy.Device:
         """Hardware device the array data resides on."""
+        if self._device is None:
+            self._device = ivy.dev(self._data)
         return self._device
 
     @property
@@ -254,16 +257,23 @@ class Array(
     @property
     def size(self) -> Optional[int]:
         """Number of elements in the array."""
+        if self._size is None:
+            shape = self._data.shape
+            self._size = functools.reduce(mul, shape) if len(shape) > 0 else 0
         return self._size
 
     @property
     def itemsize(self) -> Optional[int]:
         """Size of array elements in bytes."""
+        if self._itemsize is None:
+            self._itemsize = ivy.itemsize(self._data)
         return self._itemsize
 
     @property
     def strides(self) -> Optional[int]:
         """Get strides across each dimension."""
+        if self._strides is None:
+            self._strides = ivy.strides(self._data)
         return self._strides
 
     @property
@@ -354,13 +364,13 @@ class Array(
             # from the currently set backend
             backend = ivy.with_backend(self.backend, cached=True)
         arr_np = backend.to_numpy(self._data)
-        rep = ivy.vec_sig_fig(arr_np, sig_fig) if self._size > 0 else np.array(arr_np)
+        rep = ivy.vec_sig_fig(arr_np, sig_fig) if self.size > 0 else np.array(arr_np)
         with np.printoptions(precision=dec_vals):
             repr = rep.__repr__()[:-1].partition(", dtype")[0].partition(", dev")[0]
             return (
                 self._pre_repr
                 + repr[repr.find("(") :]
-                + self._post_repr.format(ivy.current_backend_str())
+                + self._get_post_repr().format(ivy.current_backend_str())
             )
 
     def __dir__(self):
@@ -389,7 +399,7 @@ class Array(
             self._data.__setitem__(query, val)
         except:
             self._data = ivy.scatter_nd(query, val, reduction="replace", out=self)._data
-            self._dtype = ivy.dtype(self._data)
+            self._dtype = None
 
     def __contains__(self, key):
         return self._data.__contains__(key)
@@ -419,6 +429,8 @@ class Array(
         ivy_array = ivy.array(state["data"])
         ivy.previous_backend()
 
+        for attr in Array.__slots__:
+            setattr(self, attr, getattr(ivy_array, attr))
         self.__dict__ = ivy_array.__dict__
 
         # TODO: what about placement of the array on the right device ?
@@ -802,6 +802,7 @@ class _ArrayWithLayers(abc.ABC):
         *,
         bias: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
         recurrent_bias: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
+        mask: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
     ) -> Tuple[ivy.Array, ivy.Array]:
         """
         ivy.Array instance method variant of ivy.lstm_update. This method simply wraps
@@ -822,6 +823,9 @@ class _ArrayWithLayers(abc.ABC):
             bias for cell kernel *[4 x out]*. (Default value = None)
         recurrent_bias
             bias for cell recurrent kernel *[4 x out]*. (Default value = None)
+        mask
+            boolean mask of the valid timesteps *[batch_shape, t]*, for sequences of
+            different lengths. (Default value = None)
 
         Returns
         -------
@@ -851,4 +855,5 @@ class _ArrayWithLayers(abc.ABC):
             recurrent_kernel,
             bias=bias,
             recurrent_bias=recurrent_bias,
+            mask=mask,
         )
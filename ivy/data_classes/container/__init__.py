@@ -12,5 +12,11 @@ except ModuleNotFoundError:
 # local
 from .wrapping import add_ivy_container_instance_methods  # noqa
 from .container import ContainerBase, Container  # noqa
+from .prefetch import ContainerPrefetcher  # noqa
+from .shared_memory import (  # noqa
+    SharedMemoryHandle,
+    to_shared_memory,
+    from_shared_memory,
+)
 
 colorama.init(strip=False)
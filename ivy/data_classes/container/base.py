@@ -24,9 +24,11 @@ from operator import mul
 from functools import reduce
 from typing import Union, Tuple
 from builtins import set
+import weakref
 
 # local
 import ivy
+from ivy.utils.backend.handler import _dynamic_backend_objects, _WeakRegistry
 
 
 ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
@@ -47,10 +49,525 @@ def _repr(x):
         return str(x)
 
 
+def _h5_read(dataset, slice_obj=slice(None), mmap=False):
+    # reads the slice of an hdf5 dataset into a numpy array. With mmap=True, datasets
+    # stored contiguously and uncompressed in a file on disk are instead read through a
+    # read-only memory map of the file, so that only the pages used are loaded
+    if (
+        mmap
+        and dataset.chunks is None
+        and dataset.file.driver == "sec2"
+        and dataset.dtype.kind in "biufc"
+    ):
+        offset = dataset.id.get_offset()
+        if offset is not None:
+            array = np.memmap(
+                dataset.file.filename,
+                mode="r",
+                dtype=dataset.dtype,
+                shape=dataset.shape,
+                offset=offset,
+            )
+            return array[slice_obj].view(np.ndarray)
+    return dataset[slice_obj]
+
+
+class H5DatasetProxy:
+    """
+    A dataset of an hdf5 file loaded lazily as a leaf of a container, which only reads
+    the slices it is indexed with from disk.
+
+    Integers, slices and ellipses are read directly from the slice of the dataset
+    along the first axis, while other indices read the whole slice first.
+
+    Parameters
+    ----------
+    dataset
+        The h5py dataset.
+    slice_obj
+        The slice of the dataset along its first axis. Default is ``slice(None)``.
+    mmap
+        Whether to read contiguous datasets through a memory map of the file.
+        Default is ``False``.
+    ivyh
+        Handle to ivy module to use for the returned arrays. Default is ``None``, which
+        results in the global ivy.
+    """
+
+    def __init__(self, dataset, slice_obj=slice(None), mmap=False, ivyh=None):
+        self._dataset = dataset
+        self._rows = range(*slice_obj.indices(dataset.shape[0]))
+        self._mmap = mmap
+        self._ivy = ivy.default(ivyh, ivy)
+
+    @property
+    def shape(self):
+        return (len(self._rows),) + tuple(self._dataset.shape[1:])
+
+    @property
+    def dtype(self):
+        return str(self._dataset.dtype)
+
+    @property
+    def ndim(self):
+        return len(self._dataset.shape)
+
+    def __len__(self):
+        return len(self._rows)
+
+    def __repr__(self):
+        return "H5DatasetProxy({}, shape={}, dtype={})".format(
+            self._dataset.name, self.shape, self.dtype
+        )
+
+    def _read(self, rows, query=()):
+        if isinstance(rows, range):
+            reverse = rows.step < 0
+            if reverse:
+                rows = rows[::-1]
+            if rows:
+                rows = slice(rows.start, rows[-1] + 1, rows.step)
+            else:
+                rows = slice(0, 0)
+            array = _h5_read(self._dataset, rows, self._mmap)
+            if reverse:
+                array = array[::-1]
+            if query:
+                array = array[(slice(None),) + query]
+        else:
+            array = _h5_read(self._dataset, slice(rows, rows + 1), self._mmap)[0]
+            if query:
+                array = array[query]
+        return self._ivy.asarray(array)
+
+    def __getitem__(self, query):
+        query = query if isinstance(query, tuple) else (query,)
+        if not query:
+            return self.to_array()
+        if query[0] is Ellipsis and Ellipsis not in query[1:]:
+            query = (slice(None),) * (self.ndim - len(query) + 1) + query[1:]
+        if isinstance(query[0], (int, np.integer, slice)):
+            return self._read(self._rows[query[0]], query[1:])
+        return self.to_array()[query]
+
+    def to_array(self):
+        """
+        Read the whole slice of the dataset from disk.
+
+        Returns
+        -------
+            The slice of the dataset, as an array.
+        """
+        return self._read(self._rows)
+
+    def __array__(self, dtype=None, copy=None):
+        array = ivy.to_numpy(self.to_array())
+        return array if dtype is None else array.astype(dtype)
+
+
+# the dtypes of the safetensors format, which stores the arrays little-endian
+_SAFETENSORS_DTYPES = {
+    "bool": "BOOL",
+    "uint8": "U8",
+    "int8": "I8",
+    "uint16": "U16",
+    "int16": "I16",
+    "float16": "F16",
+    "uint32": "U32",
+    "int32": "I32",
+    "float32": "F32",
+    "uint64": "U64",
+    "int64": "I64",
+    "float64": "F64",
+}
+_SAFETENSORS_NUMPY_DTYPES = {v: k for k, v in _SAFETENSORS_DTYPES.items()}
+
+
+def _has_key_chain_prefix(key_chain, prefixes):
+    return any(
+        key_chain == prefix or key_chain.startswith(prefix + "/") for prefix in prefixes
+    )
+
+
+def _array_from_numpy(x, ivyh=None):
+    # the array of the backend sharing the memory of the numpy array where possible,
+    # through dlpack for the backends other than numpy, which may need to copy it
+    ivyh = ivy.default(ivyh, ivy)
+    if ivyh.current_backend_str() != "numpy":
+        try:
+            return ivyh.from_dlpack(x)
+        except Exception:
+            pass
+    return ivyh.asarray(x)
+
+
+def _splice_plan(cont_idxs):
+    # groups the indices of the containers in the arguments by the top-level
+    # argument holding them, along with the position of each container's value
+    plan = dict()
+    for i, idx in enumerate(cont_idxs):
+        plan.setdefault(idx[0], []).append((idx[1:], i))
+    return list(plan.items())
+
+
+def _splice(nest, plan, vals):
+    # splices the values into a shallow copy of the arguments, only copying the
+    # top-level arguments which hold the containers within nested structures
+    for key, entries in plan:
+        if not entries[0][0]:
+            nest[key] = vals[entries[0][1]]
+            continue
+        arg = ivy.copy_nest(nest[key], to_mutable=True)
+        ivy.set_nest_at_indices(
+            arg, [idx for idx, _ in entries], [vals[i] for _, i in entries]
+        )
+        nest[key] = arg
+    return nest
+
+
+def _map_stacked_leaves(map_fn, key_chains, columns):
+    # maps the function over the leaves with a single call for each group of leaves
+    # with the same shapes and dtypes, stacked along a new leading axis
+    groups = dict()
+    for i, values in enumerate(zip(*columns)):
+        try:
+            key = tuple((tuple(v.shape), v.dtype) for v in values)
+        except AttributeError:
+            key = i
+        groups.setdefault(key, []).append(i)
+    leaves = [None] * len(key_chains)
+    for idxs in groups.values():
+        if len(idxs) > 1 and all(ivy.is_array(column[idxs[0]]) for column in columns):
+            stacked = list()
+            for column in columns:
+                arrays = [column[i] for i in idxs]
+                arrays = [x.data if isinstance(x, ivy.Array) else x for x in arrays]
+                stacked.append(ivy.current_backend(arrays[0]).stack(arrays))
+            ret = map_fn(stacked, None)
+            if isinstance(ret, ivy.Array) and tuple(ret.shape[:1]) == (len(idxs),):
+                ret = ret.data
+                for i, leaf in zip(idxs, ivy.current_backend(ret).unstack(ret)):
+                    leaves[i] = ivy.Array(leaf)
+                continue
+        for i in idxs:
+            leaves[i] = map_fn([column[i] for column in columns], key_chains[i])
+    return leaves
+
+
+class _ContainerStructure:
+    # the structure of a container, cached until the container or one of its
+    # sub-containers is modified. The tree holds a (config, keys, children, sorted)
+    # node for each container, with None children at the leaves, which are stored
+    # flat in iteration order along with their key-chains
+    __slots__ = ("tree", "key_chains", "leaves", "has_sequences")
+
+    def __init__(self, tree, key_chains, leaves):
+        self.tree = tree
+        self.key_chains = key_chains
+        self.leaves = leaves
+        self.has_sequences = any(isinstance(x, (list, tuple)) for x in leaves)
+
+
+def _cont_structure(cont):
+    """
+    Return the cached structure of a container, walking the container only if it has
+    been modified since the structure was last cached.
+
+    Containers waiting on queues have no fixed structure, and return None.
+    """
+    structure = cont._cont_structure
+    if structure is not None:
+        return structure
+    key_chains = list()
+    leaves = list()
+
+    def _walk(cont, key_chain):
+        if cont._queues is not None:
+            raise ValueError
+        keys = tuple(dict.keys(cont))
+        children = list()
+        for key in keys:
+            value = dict.__getitem__(cont, key)
+            this_key_chain = (
+                key if key_chain == "" else (str(key_chain) + "/" + str(key))
+            )
+            if isinstance(value, ivy.Container):
+                children.append(_walk(value, this_key_chain))
+            else:
+                children.append(None)
+                key_chains.append(this_key_chain)
+                leaves.append(value)
+        try:
+            keys_sorted = list(keys) == sorted(keys)
+        except TypeError:
+            keys_sorted = False
+        return cont._config, keys, tuple(children), keys_sorted
+
+    try:
+        tree = _walk(cont, "")
+    except ValueError:
+        return None
+    finally:
+        # the recursive closure refers to itself, and would otherwise keep the leaves
+        # alive until the next garbage collection
+        del _walk
+    structure = _ContainerStructure(tree, key_chains, leaves)
+    cont._cont_structure = structure
+    return structure
+
+
+def _cont_key_chain_index(cont, cached_only=False):
+    """
+    Return the index of the key-chains of a container, which maps the key-chain of
+    each leaf and sub-container to the container holding it, its key there and the
+    keys along the chain.
+
+    The index is cached on the container until the keys of the container or of one
+    of its sub-containers change. Unlike the structure of the container, it is kept
+    when leaves are replaced by other leaves.
+
+    Parameters
+    ----------
+    cont
+        the container to index.
+    cached_only
+        whether to only return the index if it is cached, rather than walking the
+        container. Default is ``False``.
+
+    Returns
+    -------
+    ret
+        the index, or None for containers waiting on queues, or which are not
+        indexed yet when ``cached_only`` is set.
+    """
+    if cont._cont_index is not None or cached_only:
+        return cont._cont_index
+    index = dict()
+    # the top-level keys are held by None rather than by the container itself, as
+    # the container would otherwise refer to itself through its index
+    nodes = [(cont, None, "", ())]
+    while nodes:
+        node, holder, key_chain, keys = nodes.pop()
+        if node._queues is not None:
+            return None
+        for key, value in dict.items(node):
+            kc = str(key) if key_chain == "" else key_chain + "/" + str(key)
+            index[kc] = (holder, key, keys + (key,))
+            if isinstance(value, ivy.Container):
+                nodes.append((value, value, kc, keys + (key,)))
+    cont._cont_index = index
+    return index
+
+
+class _ContainerSignature:
+    # the signature of the keys of a container, along with the types, shapes and
+    # dtypes of its leaves and the signatures of its sub-containers. Signatures are
+    # interned, so that containers with the same structure share the same signature
+    # and are compared by identity
+    __slots__ = ("descriptor", "__weakref__")
+
+    def __init__(self, descriptor):
+        self.descriptor = descriptor
+
+
+_signatures = weakref.WeakValueDictionary()
+
+
+def _cont_signature(cont):
+    """
+    Return the signature of the structure of a container.
+
+    The signature is cached on the container until the container or one of its
+    sub-containers is modified, which only drops the signatures of the containers
+    holding the modified one, so that computing it again only walks those. Arrays
+    whose shape is changed in place are not tracked.
+
+    Containers waiting on queues have no fixed structure, and return None.
+    """
+    signature = cont._cont_signature
+    if signature is not None:
+        return signature
+    if cont._queues is not None:
+        return None
+    items = list()
+    for key, value in dict.items(cont):
+        if isinstance(value, ivy.Container):
+            child = _cont_signature(value)
+            if child is None:
+                return None
+            items.append((key, child))
+        elif ivy.is_array(value):
+            items.append((key, type(value), tuple(value.shape), str(value.dtype)))
+        else:
+            items.append((key, type(value)))
+    descriptor = tuple(items)
+    try:
+        signature = _signatures.get(descriptor)
+    except TypeError:
+        # unhashable shapes are not interned, and only match themselves
+        signature = None
+        descriptor = None
+    if signature is None:
+        signature = _ContainerSignature(descriptor)
+        if descriptor is not None:
+            _signatures[descriptor] = signature
+    cont._cont_signature = signature
+    return signature
+
+
+def _cont_signatures_identical(containers):
+    # whether all of the inputs are containers with the same keys in the same order,
+    # and with leaves of the same types, shapes and dtypes
+    signature = None
+    for cont in containers:
+        if not isinstance(cont, ivy.Container):
+            return False
+        cont_signature = _cont_signature(cont)
+        if cont_signature is None:
+            return False
+        if signature is None:
+            signature = cont_signature
+        elif cont_signature is not signature:
+            return False
+    return signature is not None
+
+
+def _cont_from_structure(structure, leaves, config=None, prune_empty=False):
+    """
+    Build a new container with the structure of another one and new leaves.
+
+    This matches the containers built key by key through the constructor, but skips
+    its per-key checks. Each node copies the attributes of a prototype container
+    built once for each distinct config. The structure is cached on the new container
+    unless the leaves or the config changed it.
+
+    Parameters
+    ----------
+    structure
+        the structure of the container to follow.
+    leaves
+        the new leaves, in the order of the structure.
+    config
+        the config for all of the new containers. Default is ``None``, in which case
+        each one uses the config of the container it replaces.
+    prune_empty
+        whether to drop the sub-containers without any leaves. Default is ``False``.
+
+    Returns
+    -------
+    ret
+        the new container.
+    """
+    dict_types = tuple([dict] + ivy.container_types())
+    leaves_iter = iter(leaves)
+    protos = list()
+    exact = True
+
+    def _proto(node_config):
+        for proto_config, proto in protos:
+            if proto_config is node_config or proto_config == node_config:
+                return proto
+        proto = ivy.Container(**node_config)
+        protos.append((node_config, proto))
+        return proto
+
+    def _build(node):
+        nonlocal exact
+        node_config, keys, children, keys_sorted = node
+        if config is not None:
+            if config is not node_config and config != node_config:
+                exact = False
+            node_config = config
+        proto = _proto(node_config)
+        nest_types = proto._types_to_iteratively_nest
+        items = list()
+        for key, child in zip(keys, children):
+            if child is None:
+                value = next(leaves_iter)
+                if isinstance(value, dict_types) or isinstance(value, nest_types):
+                    # the constructor nests these as sub-containers
+                    exact = False
+                    if not isinstance(value, ivy.Container) or (
+                        proto._rebuild_child_containers
+                    ):
+                        value = ivy.Container(value, **node_config)
+            else:
+                value = _build(child)
+                if prune_empty and not value:
+                    exact = False
+                    continue
+                if proto._rebuild_child_containers:
+                    exact = False
+                    value = ivy.Container(value, **node_config)
+            items.append((key, value))
+        if proto._alphabetical_keys and not keys_sorted:
+            exact = False
+            items.sort(key=lambda item: item[0])
+        cont = dict.__new__(ivy.Container)
+        cont.__dict__.update(proto.__dict__)
+        # the config of each node is its own, as cont_with_ivy_backend updates it
+        cont._config = dict(proto._config)
+        cont._config_in = dict(proto._config_in)
+        if cont._dynamic_backend:
+            _dynamic_backend_objects.add(cont)
+        dict.update(cont, items)
+        for _, value in items:
+            if isinstance(value, ContainerBase):
+                value._cont_add_parent(cont)
+        return cont
+
+    ret = _build(structure.tree)
+    # breaks the reference cycle of the recursive closure, as in _cont_structure
+    del _build
+    if exact:
+        ret._cont_structure = _ContainerStructure(
+            structure.tree, structure.key_chains, leaves
+        )
+    return ret
+
+
+def _cont_from_nest(nest, config):
+    """
+    Build a new container from a nest of dicts, matching the container built through
+    the constructor with the config, but without its per-key checks.
+    """
+    key_chains = list()
+    leaves = list()
+
+    def _node(nest, key_chain):
+        keys = tuple(nest.keys())
+        children = list()
+        for key, value in nest.items():
+            kc = key if key_chain == "" else (str(key_chain) + "/" + str(key))
+            if type(value) is dict:
+                children.append(_node(value, kc))
+            else:
+                children.append(None)
+                key_chains.append(kc)
+                leaves.append(value)
+        try:
+            keys_sorted = list(keys) == sorted(keys)
+        except TypeError:
+            keys_sorted = False
+        return config, keys, tuple(children), keys_sorted
+
+    tree = _node(nest, "")
+    # breaks the reference cycle of the recursive closure, as in _cont_structure
+    del _node
+    return _cont_from_structure(_ContainerStructure(tree, key_chains, leaves), leaves)
+
+
 # noinspection PyMissingConstructor
 
 
 class ContainerBase(dict, abc.ABC):
+    # the cached structure, key-chain index and signature of the container and the
+    # containers holding it, which are only set once needed
+    _cont_structure = None
+    _cont_index = None
+    _cont_signature = None
+    _cont_parents = None
+
     def __init__(
         self,
         dict_in=None,
@@ -69,6 +586,7 @@ class ContainerBase(dict, abc.ABC):
         types_to_iteratively_nest=None,
         alphabetical_keys=True,
         dynamic_backend=None,
+        queue_cache_size=None,
         **kwargs,
     ):
         """
@@ -119,6 +637,10 @@ class ContainerBase(dict, abc.ABC):
         alphabetical_keys
             Whether to sort the container keys alphabetically, or preserve the dict
             order. Default is ``True``.
+        queue_cache_size
+            The maximum number of containers loaded from the queues to keep, after which
+            the earliest loaded ones are evicted. Default is ``None``, which keeps all
+            of them.
         kwargs
             keyword arguments for dict creation. Default is ``None``.
         """
@@ -133,10 +655,13 @@ class ContainerBase(dict, abc.ABC):
             self._loaded_containers_from_queues = dict()
             self._queue_load_sizes_cum = np.cumsum(queue_load_sizes)
             self._queue_timeout = ivy.default(queue_timeout, ivy.get_queue_timeout())
+            self._queue_cache_size = queue_cache_size
         if dynamic_backend is not None:
             self._dynamic_backend = dynamic_backend
         else:
             self._dynamic_backend = ivy.get_dynamic_backend()
+        if self._dynamic_backend:
+            _dynamic_backend_objects.add(self)
         if dict_in is None:
             if kwargs:
                 dict_in = dict(**kwargs)
@@ -173,8 +698,47 @@ class ContainerBase(dict, abc.ABC):
         prune_unapplied=False,
         map_sequences=None,
         out=None,
+        stack_leaves=False,
         **kwargs,
     ) -> Union[Tuple[ivy.Container, ivy.Container], ivy.Container]:
+        """
+        Apply a function to the leaves of the containers passed in its arguments.
+
+        The positions of the containers within the arguments are found once, and the
+        function is then called for each leaf with the values of the containers
+        spliced into those positions.
+
+        Parameters
+        ----------
+        fn
+            Function to apply, or the name of an ivy function.
+        args
+            The positional arguments of the function, containing the containers.
+        key_chains
+            The key-chains to apply or not apply the method to. Default is ``None``.
+        to_apply
+            If True, the method will be applied to key_chains, otherwise key_chains will
+            be skipped. Default is ``True``.
+        prune_unapplied
+            Whether to prune key_chains for which the function was not applied.
+            Default is ``False``.
+        map_sequences
+            Whether to also map method to sequences (lists, tuples).
+            Default is ``False``.
+        out
+            optional output container, for writing the result to.
+        stack_leaves
+            Whether to call the function once for each group of leaves with the same
+            shapes and dtypes, stacked along a new leading axis. Only valid for
+            functions which treat the leading axis as a batch axis, such as the
+            elementwise functions. Default is ``False``.
+        kwargs
+            The keyword arguments of the function, which can also contain containers.
+
+        Returns
+        -------
+            The container of the function's return values.
+        """
         inspect_fn = fn
         if isinstance(fn, str):
             inspect_fn = ivy.__dict__[fn]
@@ -220,33 +784,44 @@ class ContainerBase(dict, abc.ABC):
         # Get the function with the name fn_name, enabling containers to specify
         # their backends irrespective of global ivy's backend
 
+        arg_plan = _splice_plan(arg_cont_idxs)
+        kwarg_plan = _splice_plan(kwarg_cont_idxs)
+
         def map_fn(vals, _):
             if with_out:
                 out = vals[-num_out_conts:]
                 del vals[-num_out_conts:]
-            arg_vals = vals[:num_arg_conts]
-            a = ivy.copy_nest(args, to_mutable=True)
-            ivy.set_nest_at_indices(a, arg_cont_idxs, arg_vals)
-            kwarg_vals = vals[num_arg_conts:]
-            kw = ivy.copy_nest(kwargs, to_mutable=True)
-            ivy.set_nest_at_indices(kw, kwarg_cont_idxs, kwarg_vals)
+            a = _splice(list(args), arg_plan, vals[:num_arg_conts])
+            kw = _splice(dict(kwargs), kwarg_plan, vals[num_arg_conts:])
             if with_out:
                 out = out[0] if len(out) == 1 else out
                 return fn(*a, out=out, **kw)
             else:
                 return fn(*a, **kw)
 
-        # Replace each container in arg and kwarg with the arrays at the leaf
-        # levels of that container using map_fn and call fn using those arrays
-        # as inputs
-        ret = ivy.Container.cont_multi_map(
-            map_fn,
-            conts,
-            key_chains,
-            to_apply,
-            prune_unapplied,
-            map_nests=map_sequences,
-        )
+        columns = None
+        if stack_leaves and not with_out and key_chains is None:
+            columns = ivy.Container._cont_flat_columns(conts, map_sequences)
+        if columns is not None:
+            structure, columns = columns
+            ret = _cont_from_structure(
+                structure,
+                _map_stacked_leaves(map_fn, structure.key_chains, columns),
+                config=cont0.cont_config,
+                prune_empty=True,
+            )
+        else:
+            # Replace each container in arg and kwarg with the arrays at the leaf
+            # levels of that container using map_fn and call fn using those arrays
+            # as inputs
+            ret = ivy.Container.cont_multi_map(
+                map_fn,
+                conts,
+                key_chains,
+                to_apply,
+                prune_unapplied,
+                map_nests=map_sequences,
+            )
 
         # Multiple containers for functions returning multiple arrays
         if ivy.is_ivy_container(ret):
@@ -507,6 +1082,13 @@ class ContainerBase(dict, abc.ABC):
             config = (
                 container0.cont_config if isinstance(container0, ivy.Container) else {}
             )
+        if (
+            mode == "diff_only"
+            and not detect_value_diffs
+            and _cont_signatures_identical(containers)
+        ):
+            # containers with the same structure have no structural differences
+            return ivy.Container(**config)
         if not isinstance(container0, dict):
             equal_mat = ivy.all_equal(*containers, equality_matrix=True)
             if not detect_value_diffs:
@@ -709,6 +1291,18 @@ class ContainerBase(dict, abc.ABC):
             config = (
                 container0.cont_config if isinstance(container0, ivy.Container) else {}
             )
+        if key_chains is None and key_chain == "":
+            # containers with the same leaves are mapped through their flat leaves
+            columns = ivy.Container._cont_flat_columns(containers, map_nests)
+            if columns is not None:
+                structure, columns = columns
+                leaves = [
+                    func(list(values), kc)
+                    for kc, values in zip(structure.key_chains, zip(*columns))
+                ]
+                return _cont_from_structure(
+                    structure, leaves, config=config, prune_empty=True
+                )
         return_dict = dict()
 
         for key in keys:
@@ -779,6 +1373,28 @@ class ContainerBase(dict, abc.ABC):
             # noinspection PyProtectedMember
         return ivy.Container(return_dict, **config)
 
+    @staticmethod
+    def _cont_flat_columns(containers, map_nests=False):
+        # the cached structure of the first container and the flat leaves of each
+        # one, or None unless all of the inputs are containers with the same leaves,
+        # as other inputs are passed to the function along with whole sub-containers
+        structure = None
+        columns = list()
+        for cont in containers:
+            if not isinstance(cont, ivy.Container):
+                return None
+            cont_structure = _cont_structure(cont)
+            if cont_structure is None or (map_nests and cont_structure.has_sequences):
+                return None
+            if structure is None:
+                structure = cont_structure
+            elif cont_structure.tree is not structure.tree and (
+                cont_structure.key_chains != structure.key_chains
+            ):
+                return None
+            columns.append(cont_structure.leaves)
+        return structure, columns
+
     @staticmethod
     def cont_common_key_chains(containers):
         """
@@ -844,6 +1460,13 @@ class ContainerBase(dict, abc.ABC):
         -------
         Boolean
         """
+        if (
+            not same_arrays
+            and not arrays_equal
+            and not partial
+            and _cont_signatures_identical(containers)
+        ):
+            return True
         if partial:
             common_key_chains = ivy.Container.cont_common_key_chains(containers)
             if not common_key_chains:
@@ -933,21 +1556,22 @@ class ContainerBase(dict, abc.ABC):
             Whether to also check for partially complete sub-containers.
             Default is ``False``.
         """
-        ivy.utils.assertions.check_true(
-            ivy.Container.cont_identical(
-                containers,
-                check_types,
-                check_shapes,
-                same_arrays,
-                arrays_equal,
-                key_chains,
-                to_apply,
-                partial,
-            ),
-            "Containers were not identical:\n\n{}".format(
-                ivy.Container.cont_diff(*containers)
-            ),
-        )
+        if not ivy.Container.cont_identical(
+            containers,
+            check_types,
+            check_shapes,
+            same_arrays,
+            arrays_equal,
+            key_chains,
+            to_apply,
+            partial,
+        ):
+            # the diff is only computed for the error message
+            raise ivy.utils.exceptions.IvyException(
+                "Containers were not identical:\n\n{}".format(
+                    ivy.Container.cont_diff(*containers)
+                )
+            )
 
     @staticmethod
     def cont_identical_structure(
@@ -1032,14 +1656,15 @@ class ContainerBase(dict, abc.ABC):
             Whether to also check for partially complete sub-containers.
             Default is ``False``.
         """
-        ivy.utils.assertions.check_true(
-            ivy.Container.cont_identical_structure(
-                containers, check_types, check_shapes, key_chains, to_apply, partial
-            ),
-            "Containers did not have identical structure:\n\n{}".format(
-                ivy.Container.cont_structural_diff(*containers)
-            ),
-        )
+        if not ivy.Container.cont_identical_structure(
+            containers, check_types, check_shapes, key_chains, to_apply, partial
+        ):
+            # the diff is only computed for the error message
+            raise ivy.utils.exceptions.IvyException(
+                "Containers did not have identical structure:\n\n{}".format(
+                    ivy.Container.cont_structural_diff(*containers)
+                )
+            )
 
     @staticmethod
     def cont_identical_configs(containers):
@@ -1095,7 +1720,12 @@ class ContainerBase(dict, abc.ABC):
 
     @staticmethod
     def cont_from_disk_as_hdf5(
-        h5_obj_or_filepath, slice_obj=slice(None), alphabetical_keys=True, ivyh=None
+        h5_obj_or_filepath,
+        slice_obj=slice(None),
+        alphabetical_keys=True,
+        ivyh=None,
+        lazy=False,
+        mmap=False,
     ):
         """
         Load container object from disk, as an h5py file, at the specified hdf5
@@ -1113,6 +1743,14 @@ class ContainerBase(dict, abc.ABC):
         ivyh
             Handle to ivy module to use for the calculations. Default is ``None``, which
             results in the global ivy.
+        lazy
+            Whether to load the datasets lazily as :class:`H5DatasetProxy` leaves,
+            which only read the slices they are indexed with from disk, in which case
+            the file is kept open. Default is ``False``.
+        mmap
+            Whether to read datasets which are stored contiguously and uncompressed
+            through a read-only memory map of the file, rather than copying them into
+            memory. Default is ``False``.
 
         Returns
         -------
@@ -1125,27 +1763,97 @@ class ContainerBase(dict, abc.ABC):
                 "files from disk into a container."
             ),
         )
-        container_dict = dict()
         if type(h5_obj_or_filepath) is str:
             h5_obj = h5py.File(h5_obj_or_filepath, "r")
-        else:
-            h5_obj = h5_obj_or_filepath
+            if lazy:
+                return ivy.Container.cont_from_disk_as_hdf5(
+                    h5_obj, slice_obj, alphabetical_keys, ivyh, lazy, mmap
+                )
+            with h5_obj:
+                return ivy.Container.cont_from_disk_as_hdf5(
+                    h5_obj, slice_obj, alphabetical_keys, ivyh, lazy, mmap
+                )
+        h5_obj = h5_obj_or_filepath
+        container_dict = dict()
         items = sorted(h5_obj.items()) if alphabetical_keys else h5_obj.items()
         for key, value in items:
             if isinstance(value, h5py.Group):
                 container_dict[key] = ivy.Container.cont_from_disk_as_hdf5(
-                    value, slice_obj, ivyh
+                    value, slice_obj, alphabetical_keys, ivyh, lazy, mmap
                 )
             elif isinstance(value, h5py.Dataset):
-                container_dict[key] = ivy.default(ivyh, ivy).array(
-                    list(value[slice_obj]), dtype=str(value[slice_obj].dtype)
-                )
+                if lazy:
+                    container_dict[key] = H5DatasetProxy(value, slice_obj, mmap, ivyh)
+                else:
+                    container_dict[key] = ivy.default(ivyh, ivy).asarray(
+                        _h5_read(value, slice_obj, mmap)
+                    )
             else:
                 raise ivy.utils.exceptions.IvyException(
                     "Item found inside h5_obj which was neither a Group nor a Dataset."
                 )
         return ivy.Container(container_dict, ivyh=ivyh)
 
+    @staticmethod
+    def cont_batches_from_disk_as_hdf5(
+        h5_obj_or_filepath,
+        batch_size,
+        slice_obj=slice(None),
+        alphabetical_keys=True,
+        ivyh=None,
+        mmap=False,
+    ):
+        """
+        Iterate over consecutive batches of the datasets of an h5py file along their
+        first axis, reading only one batch from disk at a time.
+
+        Parameters
+        ----------
+        h5_obj_or_filepath
+            Filepath where the container object is saved to disk, or h5 object.
+        batch_size
+            The number of entries of each batch. The last batch may be smaller.
+        slice_obj
+            slice object to slice all h5 elements before batching them.
+            (Default value = slice(None))
+        alphabetical_keys
+            Whether to sort the container keys alphabetically, or preserve the dict
+            order. Default is ``True``.
+        ivyh
+            Handle to ivy module to use for the calculations. Default is ``None``, which
+            results in the global ivy.
+        mmap
+            Whether to read datasets which are stored contiguously and uncompressed
+            through a read-only memory map of the file. Default is ``False``.
+
+        Yields
+        ------
+            Containers of the consecutive batches, up to the length of the shortest
+            dataset.
+        """
+        ivy.utils.assertions.check_exists(
+            h5py,
+            message=(
+                "You must install python package h5py in order to load hdf5 "
+                "files from disk into a container."
+            ),
+        )
+        if type(h5_obj_or_filepath) is str:
+            h5_obj = h5py.File(h5_obj_or_filepath, "r")
+        else:
+            h5_obj = h5_obj_or_filepath
+        try:
+            datasets = ivy.Container.cont_from_disk_as_hdf5(
+                h5_obj, slice_obj, alphabetical_keys, ivyh, lazy=True, mmap=mmap
+            )
+            size = min((len(x) for x in datasets.cont_to_flat_list()), default=0)
+            for start in range(0, size, batch_size):
+                stop = min(start + batch_size, size)
+                yield datasets.cont_map(lambda x, kc: x[start:stop])
+        finally:
+            if h5_obj is not h5_obj_or_filepath:
+                h5_obj.close()
+
     @staticmethod
     def cont_from_disk_as_pickled(pickle_filepath, ivyh=None):
         """
@@ -1190,6 +1898,68 @@ class ContainerBase(dict, abc.ABC):
         with open(json_filepath) as json_data_file:
             return ivy.Container(json.load(json_data_file), ivyh=ivyh)
 
+    @staticmethod
+    def cont_from_disk_as_safetensors(filepath, prefixes=None, mmap=True, ivyh=None):
+        """
+        Load container object from disk at the specified safetensors filepath.
+
+        Only the header of the file and the arrays at the key-chains loaded are read,
+        so that the time taken is proportional to the arrays loaded rather than the
+        size of the file.
+
+        Parameters
+        ----------
+        filepath
+            Filepath where the container object is saved to disk.
+        prefixes
+            Key-chain prefix, or list of prefixes, of the arrays to load. Default is
+            ``None``, which loads all of the arrays.
+        mmap
+            Whether to load the arrays through a copy-on-write memory map of the file,
+            which only reads them from disk once they are used and shares their memory
+            with the backend arrays where possible. Otherwise the arrays are read into
+            memory. Default is ``True``.
+        ivyh
+            Handle to ivy module to use for the calculations. Default is ``None``, which
+            results in the global ivy.
+
+        Returns
+        -------
+            Container loaded from disk
+        """
+        with open(filepath, "rb") as f:
+            header_size = int.from_bytes(f.read(8), "little")
+            header = json.loads(f.read(header_size))
+            header.pop("__metadata__", None)
+            if prefixes is not None:
+                prefixes = [prefixes] if isinstance(prefixes, str) else prefixes
+                header = {
+                    key_chain: info
+                    for key_chain, info in header.items()
+                    if _has_key_chain_prefix(key_chain, prefixes)
+                }
+            start = 8 + header_size
+            buffer = None
+            if mmap and any(info["data_offsets"][1] for info in header.values()):
+                buffer = np.memmap(f, dtype=np.uint8, mode="c", offset=start)
+            container_dict = dict()
+            for key_chain, info in header.items():
+                dtype = np.dtype(_SAFETENSORS_NUMPY_DTYPES[info["dtype"]])
+                dtype = dtype.newbyteorder("<")
+                begin, end = info["data_offsets"]
+                if buffer is None:
+                    f.seek(start + begin)
+                    count = (end - begin) // dtype.itemsize
+                    x = np.fromfile(f, dtype=dtype, count=count)
+                else:
+                    x = buffer[begin:end].view(np.ndarray).view(dtype)
+                *keys, key = key_chain.split("/")
+                sub_dict = container_dict
+                for k in keys:
+                    sub_dict = sub_dict.setdefault(k, dict())
+                sub_dict[key] = _array_from_numpy(x.reshape(info["shape"]), ivyh)
+        return ivy.Container(container_dict, ivyh=ivyh)
+
     @staticmethod
     def h5_file_size(h5_obj_or_filepath):
         """
@@ -1500,6 +2270,24 @@ class ContainerBase(dict, abc.ABC):
         return None
 
     def _cont_at_key_chains_input_as_seq(self, key_chains, ignore_key_errors=False):
+        index = _cont_key_chain_index(self)
+        if index is not None:
+            return_dict = dict()
+            for kc in key_chains:
+                entry = index.get(kc.replace(".", "/"))
+                if entry is None:
+                    # raises the key error, unless ignoring it
+                    self.cont_at_key_chain(kc, ignore_key_errors=ignore_key_errors)
+                    continue
+                holder, key, keys = entry
+                val = dict.__getitem__(self if holder is None else holder, key)
+                if ignore_key_errors and not ivy.exists(val):
+                    continue
+                sub_dict = return_dict
+                for k in keys[:-1]:
+                    sub_dict = sub_dict.setdefault(k, dict())
+                sub_dict[keys[-1]] = val
+            return _cont_from_nest(return_dict, self._config)
         return_cont = ivy.Container(dict(), **self._config)
         for kc in key_chains:
             val = self.cont_at_key_chain(kc, ignore_key_errors=ignore_key_errors)
@@ -1531,10 +2319,36 @@ class ContainerBase(dict, abc.ABC):
         return ivy.Container(return_dict, **self._config)
 
     def _cont_prune_key_chains_input_as_seq(self, key_chains):
-        return_cont = self.cont_copy()
+        if not key_chains:
+            return self.cont_copy()
+        key_chains = set(kc.replace(".", "/") for kc in key_chains)
+        # the sub-containers holding the key chains, which are the only ones to walk
+        holders = set()
         for kc in key_chains:
-            return_cont = return_cont.cont_prune_key_chain(kc)
-        return return_cont
+            while "/" in kc:
+                kc = kc.rsplit("/", 1)[0]
+                holders.add(kc)
+
+        def _prune(cont, key_chain):
+            out_dict = dict()
+            for key, value in cont.items():
+                kc = str(key) if key_chain == "" else key_chain + "/" + str(key)
+                if kc in key_chains:
+                    continue
+                if isinstance(value, ivy.Container):
+                    if kc in holders:
+                        value = _prune(value, kc)
+                    # sub-containers left without any keys are pruned too
+                    if len(value) == 0:
+                        continue
+                out_dict[key] = value
+            return ivy.Container(out_dict, **self._config)
+
+        try:
+            return _prune(self, "")
+        finally:
+            # breaks the reference cycle of the recursive closure
+            del _prune
 
     def _cont_prune_key_chains_input_as_dict(self, key_chains, return_cont=None):
         if return_cont is None:
@@ -1587,6 +2401,7 @@ class ContainerBase(dict, abc.ABC):
                 self.__setattr__(att_name, v)
 
         self._config = new_config
+        self._cont_invalidate_structure()
 
     def cont_inplace_update(
         self, dict_in: Union[ivy.Container, dict], **config
@@ -1949,11 +2764,23 @@ class ContainerBase(dict, abc.ABC):
         )
 
     def cont_to_disk_as_hdf5(
-        self, h5_obj_or_filepath, starting_index=0, mode="a", max_batch_size=None
+        self,
+        h5_obj_or_filepath,
+        starting_index=0,
+        mode="a",
+        max_batch_size=None,
+        chunks=None,
+        compression=None,
+        compression_opts=None,
     ):
         """
         Save container object to disk, as an h5py file, at the specified filepath.
 
+        Datasets which already exist are written from the starting index onwards,
+        and are resized along their first axis to fit the entries written when no
+        maximum batch size is given, so that large containers can be streamed to disk
+        one batch at a time.
+
         Parameters
         ----------
         h5_obj_or_filepath
@@ -1967,6 +2794,19 @@ class ContainerBase(dict, abc.ABC):
         max_batch_size
             Maximum batch size for the container on disk, this is useful if later
             appending to file. (Default value = None)
+        chunks
+            The chunk shape of the new datasets, either ``True`` for chunk shapes
+            guessed by h5py, a tuple for all of the datasets, or a container of chunk
+            shapes at the key-chains of the leaves. ``False`` stores the datasets
+            contiguously with a fixed size, which can then be read through a memory
+            map, but cannot be appended to past their end. Default is ``None``, which
+            leaves the chunk shapes to h5py.
+        compression
+            The compression filter of the new datasets, such as ``"gzip"`` or
+            ``"lzf"``. Default is ``None``.
+        compression_opts
+            The options of the compression filter, such as the gzip level.
+            Default is ``None``.
         """
         ivy.utils.assertions.check_exists(
             h5py,
@@ -1976,36 +2816,134 @@ class ContainerBase(dict, abc.ABC):
             ),
         )
         if type(h5_obj_or_filepath) is str:
-            h5_obj = h5py.File(h5_obj_or_filepath, mode)
-        else:
-            h5_obj = h5_obj_or_filepath
+            with h5py.File(h5_obj_or_filepath, mode) as h5_obj:
+                return self.cont_to_disk_as_hdf5(
+                    h5_obj,
+                    starting_index,
+                    mode,
+                    max_batch_size,
+                    chunks,
+                    compression,
+                    compression_opts,
+                )
+        h5_obj = h5_obj_or_filepath
         for key, value in self.items():
+            value_chunks = chunks
+            if isinstance(chunks, ivy.Container):
+                value_chunks = chunks[key] if key in chunks else None
             if isinstance(value, ivy.Container):
                 if key not in h5_obj.keys():
                     h5_group = h5_obj.create_group(key)
                 else:
                     h5_group = h5_obj[key]
                 value.cont_to_disk_as_hdf5(
-                    h5_group, starting_index, mode, max_batch_size
+                    h5_group,
+                    starting_index,
+                    mode,
+                    max_batch_size,
+                    value_chunks,
+                    compression,
+                    compression_opts,
                 )
             else:
                 value_as_np = self._cont_ivy.to_numpy(value)
                 value_shape = value_as_np.shape
                 this_batch_size = value_shape[0]
+                batch_size = max_batch_size
                 if not max_batch_size:
-                    max_batch_size = starting_index + this_batch_size
+                    batch_size = starting_index + this_batch_size
                 if key not in h5_obj.keys():
-                    dataset_shape = [max_batch_size] + list(value_shape[1:])
+                    dataset_shape = [batch_size] + list(value_shape[1:])
                     maxshape = [None for _ in dataset_shape]
+                    if value_chunks is False:
+                        # fixed size datasets can be stored contiguously
+                        maxshape, value_chunks = None, None
                     h5_obj.create_dataset(
-                        key, dataset_shape, dtype=value_as_np.dtype, maxshape=maxshape
+                        key,
+                        dataset_shape,
+                        dtype=value_as_np.dtype,
+                        maxshape=maxshape,
+                        chunks=value_chunks,
+                        compression=compression,
+                        compression_opts=compression_opts,
                     )
-                space_left = max_batch_size - starting_index
+                elif not max_batch_size and h5_obj[key].shape[0] < batch_size:
+                    max_size = h5_obj[key].maxshape[0]
+                    if h5_obj[key].chunks is None or (
+                        max_size is not None and max_size < batch_size
+                    ):
+                        raise ivy.utils.exceptions.IvyException(
+                            "The dataset {} holds at most {} entries, and cannot be "
+                            "resized to the {} entries written. Datasets saved with "
+                            "chunks=False have a fixed size.".format(
+                                h5_obj[key].name,
+                                h5_obj[key].shape[0] if max_size is None else max_size,
+                                batch_size,
+                            )
+                        )
+                    h5_obj[key].resize(batch_size, axis=0)
+                space_left = batch_size - starting_index
                 amount_to_write = min(this_batch_size, space_left)
                 h5_obj[key][starting_index : starting_index + amount_to_write] = (
                     value_as_np[0:amount_to_write]
                 )
 
+    def cont_to_disk_as_safetensors(self, filepath, metadata=None):
+        """
+        Save container object to disk in the safetensors format, at the specified
+        filepath.
+
+        The file holds a json header with the dtype, shape and byte offsets of the
+        array at each key-chain, followed by the bytes of all of the arrays in one
+        contiguous buffer, so that it can be memory-mapped and partially loaded.
+
+        Parameters
+        ----------
+        filepath
+            Filepath for where to save the container to disk.
+        metadata
+            Dict of strings to store in the header of the file. Default is ``None``.
+        """
+        key_chains = list()
+        leaves = list()
+        for key_chain, value in self.cont_to_iterator():
+            if not ivy.is_array(value):
+                raise ivy.utils.exceptions.IvyException(
+                    "Only containers of arrays can be saved in the safetensors format, "
+                    "but found {} at {}.".format(type(value), key_chain)
+                )
+            key_chains.append(key_chain)
+            leaves.append(value)
+        header = dict()
+        offset = 0
+        for key_chain, value in zip(key_chains, leaves):
+            dtype = str(ivy.dtype(value))
+            if dtype not in _SAFETENSORS_DTYPES:
+                raise ivy.utils.exceptions.IvyException(
+                    "The safetensors format does not support arrays of dtype {}, "
+                    "found at {}.".format(dtype, key_chain)
+                )
+            shape = [int(d) for d in ivy.shape(value)]
+            size = reduce(mul, shape, 1) * np.dtype(dtype).itemsize
+            header[key_chain] = {
+                "dtype": _SAFETENSORS_DTYPES[dtype],
+                "shape": shape,
+                "data_offsets": [offset, offset + size],
+            }
+            offset += size
+        if metadata:
+            header["__metadata__"] = {str(k): str(v) for k, v in metadata.items()}
+        header = json.dumps(header, separators=(",", ":")).encode()
+        # pads the header so that the buffer starts aligned to 8 bytes
+        header += b" " * (-len(header) % 8)
+        with open(filepath, "wb") as f:
+            f.write(len(header).to_bytes(8, "little"))
+            f.write(header)
+            # the arrays are converted one at a time, rather than all at once
+            for value in leaves:
+                value = np.ascontiguousarray(self._cont_ivy.to_numpy(value))
+                f.write(value.astype(value.dtype.newbyteorder("<"), copy=False).data)
+
     def cont_to_disk_as_pickled(self, pickle_filepath):
         """
         Save container object to disk, as an pickled file, at the specified filepath.
@@ -2186,6 +3124,9 @@ class ContainerBase(dict, abc.ABC):
         ret
             Container as flat list.
         """
+        structure = _cont_structure(self)
+        if structure is not None:
+            return list(structure.leaves)
         return list([item for key, item in self.cont_to_iterator()])
 
     def cont_from_flat_list(self, flat_list):
@@ -2202,6 +3143,13 @@ class ContainerBase(dict, abc.ABC):
         -------
             Container.
         """
+        structure = _cont_structure(self)
+        if structure is not None and len(flat_list) >= len(structure.leaves):
+            num_leaves = len(structure.leaves)
+            leaves = list(flat_list[:num_leaves])
+            # the values are consumed from the list, as in the nested case below
+            del flat_list[:num_leaves]
+            return _cont_from_structure(structure, leaves)
         new_dict = dict()
         for key, value in self.items():
             if isinstance(value, ivy.Container):
@@ -2260,6 +3208,9 @@ class ContainerBase(dict, abc.ABC):
         ret
             Boolean
         """
+        index = _cont_key_chain_index(self, cached_only=True)
+        if index is not None and key_chain.replace(".", "/") in index:
+            return True
         keys = re.split("[/.]", key_chain)
         ret = self
         for key in keys:
@@ -2523,6 +3474,12 @@ class ContainerBase(dict, abc.ABC):
         ret
             sub-container or value at specified key chain
         """
+        index = _cont_key_chain_index(self, cached_only=True)
+        if index is not None:
+            entry = index.get(key_chain.replace(".", "/"))
+            if entry is not None:
+                holder, key, _ = entry
+                return dict.__getitem__(self if holder is None else holder, key)
         keys = re.split("[/.]", key_chain)
         ret = self
         for key in keys:
@@ -2581,6 +3538,10 @@ class ContainerBase(dict, abc.ABC):
             Default value = False)
 
         """
+        if not include_empty:
+            structure = _cont_structure(self)
+            if structure is not None:
+                return list(structure.key_chains)
         return [kc for kc, v in self.cont_to_iterator(include_empty=include_empty)]
 
     def cont_key_chains_containing(self, sub_str, include_empty=False):
@@ -2723,12 +3684,45 @@ class ContainerBase(dict, abc.ABC):
                 return_dict = self
             else:
                 return_dict = self.cont_copy()
-        for k, v in target_dict.items():
-            if isinstance(v, dict):
-                return_dict[k] = self.cont_set_at_key_chains(v, return_dict[k], inplace)
-            else:
-                return_dict[k] = v
-        return ivy.Container(return_dict, **self._config)
+        index = _cont_key_chain_index(return_dict)
+        # the containers holding the leaves which were replaced, whose structures are
+        # dropped once all of the values are set
+        modified = dict()
+
+        def _set(target, cont, key_chain):
+            # key_chain is None below keys which are not strings, whose values are
+            # looked up and set through the container instead of the index. Either
+            # of "/" and "." separate the keys of the strings, as in __setitem__
+            nonlocal index
+            for k, v in target.items():
+                kc = None
+                if key_chain is not None and isinstance(k, str):
+                    kc = k.replace(".", "/")
+                    kc = kc if key_chain == "" else key_chain + "/" + kc
+                if isinstance(v, dict):
+                    # raises a KeyError for the missing sub-containers
+                    _set(v, cont[k], kc)
+                    continue
+                entry = index.get(kc) if index is not None and kc else None
+                if entry is not None:
+                    holder, key, _ = entry
+                    holder = return_dict if holder is None else holder
+                    if not isinstance(dict.__getitem__(holder, key), ivy.Container):
+                        # replacing a leaf keeps the index valid
+                        dict.__setitem__(holder, key, v)
+                        modified[id(holder)] = holder
+                        continue
+                # the other keys are added or replace sub-containers, which changes
+                # the keys of the container
+                cont[k] = v
+                index = _cont_key_chain_index(return_dict, cached_only=True)
+
+        _set(target_dict, return_dict, "")
+        # breaks the reference cycle of the recursive closure
+        del _set
+        for holder in modified.values():
+            holder._cont_invalidate_structure(keep_index=True)
+        return return_dict
 
     def cont_overwrite_at_key_chains(
         self, target_dict, return_dict=None, inplace=False
@@ -3171,6 +4165,19 @@ class ContainerBase(dict, abc.ABC):
         -------
             New container following the function mapped to each sub-array.
         """
+        if key_chains is None and not inplace and key_chain == "":
+            # leaf-wise maps go through the flat leaves of the cached structure
+            structure = _cont_structure(self)
+            if structure is not None and not (
+                map_sequences and structure.has_sequences
+            ):
+                leaves = [
+                    func(value, kc)
+                    for kc, value in zip(structure.key_chains, structure.leaves)
+                ]
+                return _cont_from_structure(
+                    structure, leaves, prune_empty=prune_unapplied
+                )
         return_dict = self if inplace else dict()
         for key, value in self.items():
             this_key_chain = (
@@ -4001,6 +5008,12 @@ class ContainerBase(dict, abc.ABC):
                     self._queues[i].get(timeout=self._queue_timeout), **self._config
                 ).to_ivy()
                 self._loaded_containers_from_queues[i] = cont
+                if self._queue_cache_size is not None:
+                    loaded = self._loaded_containers_from_queues
+                    while len(loaded) > max(self._queue_cache_size, len(queue_idxs)):
+                        # the containers needed for this query are kept
+                        evicted = next(k for k in loaded if k not in queue_idxs)
+                        del loaded[evicted]
             else:
                 cont = self._loaded_containers_from_queues[i]
             conts.append(cont)
@@ -4119,6 +5132,8 @@ class ContainerBase(dict, abc.ABC):
             def _set_dyn_backend(obj, val):
                 if isinstance(obj, ivy.Array):
                     obj._dynamic_backend = val
+                    if val:
+                        _dynamic_backend_objects.add(obj)
                     return
 
                 if isinstance(obj, ivy.Container):
@@ -4126,6 +5141,8 @@ class ContainerBase(dict, abc.ABC):
                         _set_dyn_backend(item, val)
 
                     obj._dynamic_backend = val
+                    if val:
+                        _dynamic_backend_objects.add(obj)
 
             _set_dyn_backend(self, val)
             return
@@ -4133,8 +5150,74 @@ class ContainerBase(dict, abc.ABC):
         if isinstance(query, str) and ("/" in query or "." in query):
             return self.cont_set_at_key_chain(query, val, inplace=True)
         else:
+            if (
+                self._cont_structure is not None
+                or self._cont_index is not None
+                or self._cont_signature is not None
+                or self._cont_parents is not None
+            ):
+                # replacing a leaf by another leaf keeps the keys of the containers
+                self._cont_invalidate_structure(
+                    keep_index=not isinstance(val, ContainerBase)
+                    and not isinstance(dict.get(self, query), ContainerBase)
+                    and dict.__contains__(self, query)
+                )
+            if isinstance(val, ContainerBase):
+                val._cont_add_parent(self)
             return dict.__setitem__(self, query, val)
 
+    # the remaining dict methods which modify the container also drop its structure
+
+    def __delitem__(self, key):
+        self._cont_invalidate_structure()
+        return dict.__delitem__(self, key)
+
+    def pop(self, *args):
+        self._cont_invalidate_structure()
+        return dict.pop(self, *args)
+
+    def popitem(self):
+        self._cont_invalidate_structure()
+        return dict.popitem(self)
+
+    def clear(self):
+        self._cont_invalidate_structure()
+        return dict.clear(self)
+
+    def setdefault(self, key, default=None):
+        self._cont_invalidate_structure()
+        if isinstance(default, ContainerBase):
+            default._cont_add_parent(self)
+        return dict.setdefault(self, key, default)
+
+    def update(self, *args, **kwargs):
+        self._cont_invalidate_structure()
+        items = dict(*args, **kwargs)
+        dict.update(self, items)
+        for value in items.values():
+            if isinstance(value, ContainerBase):
+                value._cont_add_parent(self)
+
+    def _cont_add_parent(self, parent):
+        if self._cont_parents is None:
+            self._cont_parents = _WeakRegistry(prune_size=8)
+        self._cont_parents.add(parent)
+
+    def _cont_invalidate_structure(self, keep_index=False):
+        # the structures cached by the containers holding this one are dropped too,
+        # along with their key-chain indices unless the keys are unchanged
+        conts = [self]
+        while conts:
+            cont = conts.pop()
+            if cont._cont_structure is not None:
+                cont._cont_structure = None
+            if cont._cont_index is not None and not keep_index:
+                cont._cont_index = None
+            if cont._cont_signature is not None:
+                cont._cont_signature = None
+            if cont._cont_parents is not None:
+                conts.extend(cont._cont_parents.objects())
+
     def __contains__(self, key):
         if isinstance(key, str) and ("/" in key or "." in key):
             return self.cont_has_key_chain(key)
@@ -4145,6 +5228,10 @@ class ContainerBase(dict, abc.ABC):
 
     def __getstate__(self):
         state_dict = copy.copy(self.__dict__)
+        state_dict.pop("_cont_structure", None)
+        state_dict.pop("_cont_index", None)
+        state_dict.pop("_cont_signature", None)
+        state_dict.pop("_cont_parents", None)
         state_dict["_local_ivy"] = (
             state_dict["_local_ivy"].current_backend_str()
             if state_dict["_local_ivy"] is not None
@@ -4269,3 +5356,5 @@ class ContainerBase(dict, abc.ABC):
     @dynamic_backend.setter
     def dynamic_backend(self, value):
         self._dynamic_backend = value
+        if value:
+            _dynamic_backend_objects.add(self)
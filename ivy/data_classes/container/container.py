@@ -108,6 +108,7 @@ class Container(
         types_to_iteratively_nest=None,
         alphabetical_keys=True,
         dynamic_backend=None,
+        queue_cache_size=None,
         **kwargs
     ):
         ContainerBase.__init__(
@@ -128,6 +129,7 @@ class Container(
             types_to_iteratively_nest,
             alphabetical_keys,
             dynamic_backend,
+            queue_cache_size,
             **kwargs
         )
 
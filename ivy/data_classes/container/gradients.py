@@ -1,3 +1,5 @@
+# global
+import math
 from typing import Optional, Union, List, Dict
 
 # local
@@ -5,6 +7,127 @@ import ivy
 from ivy.data_classes.container.base import ContainerBase
 
 
+def _leaf_key(x):
+    return x.dtype, x.device, tuple(x.shape)
+
+
+def _multi_tensor_columns(containers, lr):
+    # the flat leaves of the containers, or None unless the containers have the same
+    # structure with floating point array leaves of the same shape, dtype and device
+    # and the learning rate is a scalar, in which case the updates can be applied to
+    # flat buffers
+    if not all(isinstance(cont, ivy.Container) for cont in containers):
+        return None
+    if isinstance(lr, ivy.Container) or (
+        not isinstance(lr, (int, float)) and ivy.get_num_dims(lr) > 0
+    ):
+        return None
+    columns = ContainerBase._cont_flat_columns(containers)
+    if columns is None:
+        return None
+    columns = [
+        [x if isinstance(x, ivy.Array) else ivy.to_ivy(x) for x in column]
+        for column in columns[1]
+    ]
+    dtypes = set()
+    for values in zip(*columns):
+        if not all(isinstance(x, ivy.Array) for x in values):
+            return None
+        key = _leaf_key(values[0])
+        if any(_leaf_key(x) != key for x in values[1:]):
+            return None
+        dtypes.add(values[0].dtype)
+    if not all(ivy.is_float_dtype(dtype) for dtype in dtypes):
+        return None
+    return columns
+
+
+class _FlatLayout:
+    # the layout of the leaves of containers with the same structure in flat buffers,
+    # one for each combination of the dtypes and devices of the leaves
+
+    def __init__(self, leaves):
+        self.signature = [_leaf_key(x) for x in leaves]
+        groups = dict()
+        for i, key in enumerate(self.signature):
+            groups.setdefault(key[:2], []).append(i)
+        self.groups = list(groups.values())
+        self._segment_ids = None
+
+    def matches(self, columns):
+        # whether the leaves of each of the columns have this layout
+        return all(
+            len(leaves) == len(self.signature)
+            and all(_leaf_key(x) == key for x, key in zip(leaves, self.signature))
+            for leaves in columns
+        )
+
+    def _sizes(self, idxs):
+        return [math.prod(self.signature[i][2]) for i in idxs]
+
+    def flatten(self, leaves):
+        buffers = list()
+        for idxs in self.groups:
+            arrays = [leaves[i] for i in idxs]
+            arrays = [x.data if isinstance(x, ivy.Array) else x for x in arrays]
+            backend = ivy.current_backend(arrays[0])
+            buffers.append(ivy.Array(backend.concat(arrays, axis=None)))
+        return buffers
+
+    def unflatten(self, buffers, stop_gradients=False, like=None):
+        # with stop_gradients, the gradients of the buffers are stopped, and the
+        # leaves are variables in the groups where the leaves of like are variables
+        gradients = ivy.functional.ivy.gradients
+        leaves = [None] * len(self.signature)
+        for idxs, buffer in zip(self.groups, buffers):
+            is_variable = False
+            if stop_gradients:
+                buffer = ivy.stop_gradient(buffer, preserve_type=False)
+                is_variable = like is not None and gradients._is_variable(like[idxs[0]])
+            buffer = buffer.data if isinstance(buffer, ivy.Array) else buffer
+            backend = ivy.current_backend(buffer)
+            pieces = backend.split(buffer, num_or_size_splits=self._sizes(idxs))
+            for i, x in zip(idxs, pieces):
+                x = ivy.Array(backend.reshape(x, self.signature[i][2]))
+                leaves[i] = gradients._variable(x) if is_variable else x
+        return leaves
+
+    def segment_ids(self):
+        # the index of the leaf which each element of the buffers belongs to
+        if self._segment_ids is None:
+            self._segment_ids = [
+                ivy.repeat(
+                    ivy.arange(len(idxs), device=self.signature[idxs[0]][1]),
+                    self._sizes(idxs),
+                )
+                for idxs in self.groups
+            ]
+        return self._segment_ids
+
+
+def _multi_tensor_update(update_fn, columns, stop_gradients, segmented=False):
+    # applies update_fn to the leaves of each column concatenated into flat buffers,
+    # and splits each of the returned buffers back into leaves. With segmented=True,
+    # update_fn is also passed the segment ids of the buffers
+    layout = _FlatLayout(columns[0])
+    buffers = [layout.flatten(column) for column in columns]
+    if segmented:
+        buffers.append(layout.segment_ids())
+    rets = [update_fn(*group_buffers) for group_buffers in zip(*buffers)]
+    return [
+        layout.unflatten(
+            ret_buffers, stop_gradients=stop_gradients and k == 0, like=columns[0]
+        )
+        for k, ret_buffers in enumerate(zip(*rets))
+    ]
+
+
+def _segment_norms(x, segment_ids):
+    # the vector norm of each segment of x, gathered back to each of its elements
+    norms = ivy.bincount(segment_ids, weights=x * x) ** 0.5
+    return ivy.gather(norms, segment_ids)
+
+
 # noinspection PyMissingConstructor
 class _ContainerWithGradients(ContainerBase):
     @staticmethod
@@ -342,6 +465,86 @@ class _ContainerWithGradients(ContainerBase):
             self, effective_grad, lr, stop_gradients=stop_gradients, out=out
         )
 
+    @staticmethod
+    def _static_gradient_descent_update(
+        w: Union[ivy.Array, ivy.NativeArray, ivy.Container],
+        dcdw: Union[ivy.Array, ivy.NativeArray, ivy.Container],
+        lr: Union[float, ivy.Array, ivy.NativeArray, ivy.Container],
+        /,
+        *,
+        stop_gradients: bool = True,
+        key_chains: Optional[Union[List[str], Dict[str, str]]] = None,
+        to_apply: bool = True,
+        prune_unapplied: bool = False,
+        map_sequences: bool = False,
+        out: Optional[ivy.Container] = None,
+    ) -> ivy.Container:
+        """
+        ivy.Container static method variant of ivy.gradient_descent_update. This method
+        simply wraps the function, and so the docstring for ivy.gradient_descent_update
+        also applies to this method with minimal changes.
+
+        If the weights and gradients are containers with the same structure and the
+        learning rate is a scalar, the leaves of each dtype and device are
+        concatenated into flat buffers and updated with a single call.
+
+        Parameters
+        ----------
+        w
+            Weights of the function to be updated.
+        dcdw
+            Derivates of the cost c with respect to the weights ws, [dc/dw for w in ws].
+        lr
+            Learning rate(s), the rate(s) at which the weights should be updated
+            relative to the gradient.
+        stop_gradients
+            Whether to stop the gradients of the variables after each gradient step.
+            Default is ``True``.
+        key_chains
+            The key-chains to apply or not apply the method to. Default is ``None``.
+        to_apply
+            If True, the method will be applied to key_chains, otherwise key_chains
+            will be skipped. Default is ``True``.
+        prune_unapplied
+            Whether to prune key_chains for which the function was not applied.
+            Default is ``False``.
+        map_sequences
+            Whether to also map method to sequences (lists, tuples).
+            Default is ``False``.
+        out
+            optional output container, for writing the result to. It must have a shape
+            that the inputs broadcast to.
+
+        Returns
+        -------
+        ret
+            The new weights, following the gradient descent updates.
+        """
+        columns = None
+        if key_chains is None and out is None:
+            columns = _multi_tensor_columns([w, dcdw], lr)
+        if columns is None:
+            return ContainerBase.cont_multi_map_in_function(
+                "gradient_descent_update",
+                w,
+                dcdw,
+                lr,
+                stop_gradients=stop_gradients,
+                key_chains=key_chains,
+                to_apply=to_apply,
+                prune_unapplied=prune_unapplied,
+                map_sequences=map_sequences,
+                out=out,
+            )
+        (new_w,) = _multi_tensor_update(
+            lambda w, dcdw: (
+                ivy.gradient_descent_update(w, dcdw, lr, stop_gradients=False),
+            ),
+            columns,
+            stop_gradients,
+        )
+        return w.cont_from_flat_list(new_w)
+
     def gradient_descent_update(
         self: ivy.Container,
         dcdw: Union[ivy.Array, ivy.NativeArray, ivy.Container],
@@ -425,6 +628,95 @@ class _ContainerWithGradients(ContainerBase):
             out=out,
         )
 
+    @staticmethod
+    def _static_lars_update(
+        w: Union[ivy.Array, ivy.NativeArray, ivy.Container],
+        dcdw: Union[ivy.Array, ivy.NativeArray, ivy.Container],
+        lr: Union[float, ivy.Array, ivy.NativeArray, ivy.Container],
+        /,
+        *,
+        decay_lambda: float = 0,
+        stop_gradients: bool = True,
+        key_chains: Optional[Union[List[str], Dict[str, str]]] = None,
+        to_apply: bool = True,
+        prune_unapplied: bool = False,
+        map_sequences: bool = False,
+        out: Optional[ivy.Container] = None,
+    ) -> ivy.Container:
+        """
+        ivy.Container static method variant of ivy.lars_update. This method simply
+        wraps the function, and so the docstring for ivy.lars_update also applies to
+        this method with minimal changes.
+
+        If the weights and gradients are containers with the same structure, the
+        learning rate is a scalar and the gradients are stopped, the leaves of each
+        dtype and device are concatenated into flat buffers and updated together,
+        with the norm of each leaf computed as a segment sum over the buffers.
+
+        Parameters
+        ----------
+        w
+            Weights of the function to be updated.
+        dcdw
+            Derivates of the cost c with respect to the weights ws, [dc/dw for w in ws].
+        lr
+            Learning rate, the rate at which the weights should be updated relative to
+            the gradient.
+        decay_lambda
+            The factor used for weight decay. Default is zero.
+        stop_gradients
+            Whether to stop the gradients of the variables after each gradient step.
+            Default is ``True``.
+        key_chains
+            The key-chains to apply or not apply the method to. Default is ``None``.
+        to_apply
+            If True, the method will be applied to key_chains, otherwise key_chains
+            will be skipped. Default is ``True``.
+        prune_unapplied
+            Whether to prune key_chains for which the function was not applied.
+            Default is ``False``.
+        map_sequences
+            Whether to also map method to sequences (lists, tuples).
+            Default is ``False``.
+        out
+            optional output container, for writing the result to. It must have a shape
+            that the inputs broadcast to.
+
+        Returns
+        -------
+        ret
+            The new function weights ws_new, following the LARS updates.
+        """
+        columns = None
+        if key_chains is None and out is None and stop_gradients:
+            columns = _multi_tensor_columns([w, dcdw], lr)
+        if columns is None:
+            return ContainerBase.cont_multi_map_in_function(
+                "lars_update",
+                w,
+                dcdw,
+                lr,
+                decay_lambda=decay_lambda,
+                stop_gradients=stop_gradients,
+                key_chains=key_chains,
+                to_apply=to_apply,
+                prune_unapplied=prune_unapplied,
+                map_sequences=map_sequences,
+                out=out,
+            )
+
+        def _lars_update(w, dcdw, segment_ids):
+            w_norm = _segment_norms(w, segment_ids)
+            w_lr = ivy.stable_divide(w_norm * lr, _segment_norms(dcdw, segment_ids))
+            if decay_lambda > 0:
+                w_lr /= w_norm * decay_lambda
+            return (ivy.gradient_descent_update(w, dcdw, w_lr, stop_gradients=False),)
+
+        (new_w,) = _multi_tensor_update(
+            _lars_update, columns, stop_gradients, segmented=True
+        )
+        return w.cont_from_flat_list(new_w)
+
     def lars_update(
         self: ivy.Container,
         dcdw: Union[ivy.Array, ivy.NativeArray, ivy.Container],
@@ -472,6 +764,122 @@ class _ContainerWithGradients(ContainerBase):
             out=out,
         )
 
+    @staticmethod
+    def _static_adam_update(
+        w: Union[ivy.Array, ivy.NativeArray, ivy.Container],
+        dcdw: Union[ivy.Array, ivy.NativeArray, ivy.Container],
+        lr: Union[float, ivy.Array, ivy.NativeArray, ivy.Container],
+        mw_tm1: Union[ivy.Array, ivy.NativeArray, ivy.Container],
+        vw_tm1: Union[ivy.Array, ivy.NativeArray, ivy.Container],
+        step: int,
+        /,
+        *,
+        beta1: float = 0.9,
+        beta2: float = 0.999,
+        epsilon: float = 1e-7,
+        stop_gradients: bool = True,
+        key_chains: Optional[Union[List[str], Dict[str, str]]] = None,
+        to_apply: bool = True,
+        prune_unapplied: bool = False,
+        map_sequences: bool = False,
+        out: Optional[ivy.Container] = None,
+    ) -> List[ivy.Container]:
+        """
+        ivy.Container static method variant of ivy.adam_update. This method simply
+        wraps the function, and so the docstring for ivy.adam_update also applies to
+        this method with minimal changes.
+
+        If the weights, gradients and moments are containers with the same structure
+        and the learning rate is a scalar, the leaves of each dtype and device are
+        concatenated into flat buffers and updated with a single call.
+
+        Parameters
+        ----------
+        w
+            Weights of the function to be updated.
+        dcdw
+            Derivates of the cost c with respect to the weights ws, [dc/dw for w in ws].
+        lr
+            Learning rate(s), the rate(s) at which the weights should be updated
+            relative to the gradient.
+        mw_tm1
+            running average of the gradients, from the previous time-step.
+        vw_tm1
+            running average of second moments of the gradients, from the previous
+            time-step.
+        step
+            training step.
+        beta1
+            gradient forgetting factor (Default value = 0.9).
+        beta2
+            second moment of gradient forgetting factor (Default value = 0.999).
+        epsilon
+            divisor during adam update, preventing division by zero
+            (Default value = 1e-7).
+        stop_gradients
+            Whether to stop the gradients of the variables after each gradient step.
+            Default is ``True``.
+        key_chains
+            The key-chains to apply or not apply the method to. Default is ``None``.
+        to_apply
+            If True, the method will be applied to key_chains, otherwise key_chains
+            will be skipped. Default is ``True``.
+        prune_unapplied
+            Whether to prune key_chains for which the function was not applied.
+            Default is ``False``.
+        map_sequences
+            Whether to also map method to sequences (lists, tuples).
+            Default is ``False``.
+        out
+            optional output container, for writing the new function weights ws_new to.
+            It must have a shape that the inputs broadcast to.
+
+        Returns
+        -------
+        ret
+            The new function weights ws_new, and also new mw and vw, following the adam
+            updates.
+        """
+        columns = None
+        if key_chains is None and out is None:
+            columns = _multi_tensor_columns([w, dcdw, mw_tm1, vw_tm1], lr)
+        if columns is None:
+            return ContainerBase.cont_multi_map_in_function(
+                "adam_update",
+                w,
+                dcdw,
+                lr,
+                mw_tm1,
+                vw_tm1,
+                step,
+                beta1=beta1,
+                beta2=beta2,
+                epsilon=epsilon,
+                stop_gradients=stop_gradients,
+                key_chains=key_chains,
+                to_apply=to_apply,
+                prune_unapplied=prune_unapplied,
+                map_sequences=map_sequences,
+                out=out,
+            )
+        rets = _multi_tensor_update(
+            lambda w, dcdw, mw, vw: ivy.adam_update(
+                w,
+                dcdw,
+                lr,
+                mw,
+                vw,
+                step,
+                beta1=beta1,
+                beta2=beta2,
+                epsilon=epsilon,
+                stop_gradients=False,
+            ),
+            columns,
+            stop_gradients,
+        )
+        return [w.cont_from_flat_list(ret) for ret in rets]
+
     def adam_update(
         self: ivy.Container,
         dcdw: Union[ivy.Array, ivy.NativeArray, ivy.Container],
@@ -591,6 +999,136 @@ class _ContainerWithGradients(ContainerBase):
             out=out,
         )
 
+    @staticmethod
+    def _static_lamb_update(
+        w: Union[ivy.Array, ivy.NativeArray, ivy.Container],
+        dcdw: Union[ivy.Array, ivy.NativeArray, ivy.Container],
+        lr: Union[float, ivy.Array, ivy.NativeArray, ivy.Container],
+        mw_tm1: Union[ivy.Array, ivy.NativeArray, ivy.Container],
+        vw_tm1: Union[ivy.Array, ivy.NativeArray, ivy.Container],
+        step: int,
+        /,
+        *,
+        beta1: float = 0.9,
+        beta2: float = 0.999,
+        epsilon: float = 1e-7,
+        max_trust_ratio: Union[int, float] = 10,
+        decay_lambda: float = 0,
+        stop_gradients: bool = True,
+        key_chains: Optional[Union[List[str], Dict[str, str]]] = None,
+        to_apply: bool = True,
+        prune_unapplied: bool = False,
+        map_sequences: bool = False,
+        out: Optional[ivy.Container] = None,
+    ) -> List[ivy.Container]:
+        """
+        ivy.Container static method variant of ivy.lamb_update. This method simply
+        wraps the function, and so the docstring for ivy.lamb_update also applies to
+        this method with minimal changes.
+
+        If the weights, gradients and moments are containers with the same
+        structure, the learning rate is a scalar and the gradients are stopped, the
+        leaves of each dtype and device are concatenated into flat buffers and
+        updated together, with the norm of each leaf computed as a segment sum over
+        the buffers.
+
+        Parameters
+        ----------
+        w
+            Weights of the function to be updated.
+        dcdw
+            Derivates of the cost c with respect to the weights ws, [dc/dw for w in ws].
+        lr
+            Learning rate(s), the rate(s) at which the weights should be updated
+            relative to the gradient.
+        mw_tm1
+            running average of the gradients, from the previous time-step.
+        vw_tm1
+            running average of second moments of the gradients, from the previous
+            time-step.
+        step
+            training step.
+        beta1
+            gradient forgetting factor (Default value = 0.9).
+        beta2
+            second moment of gradient forgetting factor (Default value = 0.999).
+        epsilon
+            divisor during adam update, preventing division by zero
+            (Default value = 1e-7).
+        max_trust_ratio
+            The maximum value for the trust ratio. (Default value = 10)
+        decay_lambda
+            The factor used for weight decay. (Default value = 0).
+        stop_gradients
+            Whether to stop the gradients of the variables after each gradient step.
+            Default is ``True``.
+        key_chains
+            The key-chains to apply or not apply the method to. Default is ``None``.
+        to_apply
+            If True, the method will be applied to key_chains, otherwise key_chains
+            will be skipped. Default is ``True``.
+        prune_unapplied
+            Whether to prune key_chains for which the function was not applied.
+            Default is ``False``.
+        map_sequences
+            Whether to also map method to sequences (lists, tuples).
+            Default is ``False``.
+        out
+            optional output container, for writing the new function weights ws_new to.
+            It must have a shape that the inputs broadcast to.
+
+        Returns
+        -------
+        ret
+            The new function weights ws_new, following the LAMB updates.
+        """
+        columns = None
+        if key_chains is None and out is None and stop_gradients:
+            columns = _multi_tensor_columns([w, dcdw, mw_tm1, vw_tm1], lr)
+        if columns is None:
+            return ContainerBase.cont_multi_map_in_function(
+                "lamb_update",
+                w,
+                dcdw,
+                lr,
+                mw_tm1,
+                vw_tm1,
+                step,
+                beta1=beta1,
+                beta2=beta2,
+                epsilon=epsilon,
+                max_trust_ratio=max_trust_ratio,
+                decay_lambda=decay_lambda,
+                stop_gradients=stop_gradients,
+                key_chains=key_chains,
+                to_apply=to_apply,
+                prune_unapplied=prune_unapplied,
+                map_sequences=map_sequences,
+                out=out,
+            )
+
+        def _lamb_update(w, dcdw, mw, vw, segment_ids):
+            eff_grads, mw, vw = ivy.adam_step(
+                dcdw, mw, vw, step, beta1=beta1, beta2=beta2, epsilon=epsilon
+            )
+            r1 = _segment_norms(w, segment_ids)
+            if decay_lambda > 0:
+                r2 = _segment_norms(eff_grads + decay_lambda * w, segment_ids)
+            else:
+                r2 = _segment_norms(eff_grads, segment_ids)
+            r = ivy.stable_divide(r1, r2)
+            r = ivy.minimum(r, ivy.array(max_trust_ratio, dtype=r.dtype))
+            return (
+                ivy.optimizer_update(w, eff_grads, r * lr, stop_gradients=False),
+                mw,
+                vw,
+            )
+
+        rets = _multi_tensor_update(
+            _lamb_update, columns, stop_gradients, segmented=True
+        )
+        return [w.cont_from_flat_list(ret) for ret in rets]
+
     def lamb_update(
         self: ivy.Container,
         dcdw: Union[ivy.Array, ivy.NativeArray, ivy.Container],
@@ -2105,6 +2105,7 @@ class _ContainerWithLayers(ContainerBase):
         recurrent_bias: Optional[
             Union[ivy.Array, ivy.NativeArray, ivy.Container]
         ] = None,
+        mask: Optional[Union[ivy.Array, ivy.NativeArray, ivy.Container]] = None,
         key_chains: Optional[Union[List[str], Dict[str, str]]] = None,
         to_apply: bool = True,
         prune_unapplied: bool = False,
@@ -2119,6 +2120,7 @@ class _ContainerWithLayers(ContainerBase):
             recurrent_kernel,
             bias=bias,
             recurrent_bias=recurrent_bias,
+            mask=mask,
             key_chains=key_chains,
             to_apply=to_apply,
             prune_unapplied=prune_unapplied,
@@ -2137,6 +2139,7 @@ class _ContainerWithLayers(ContainerBase):
         recurrent_bias: Optional[
             Union[ivy.Array, ivy.NativeArray, ivy.Container]
         ] = None,
+        mask: Optional[Union[ivy.Array, ivy.NativeArray, ivy.Container]] = None,
         key_chains: Optional[Union[List[str], Dict[str, str]]] = None,
         to_apply: bool = True,
         prune_unapplied: bool = False,
@@ -2161,6 +2164,9 @@ class _ContainerWithLayers(ContainerBase):
             bias for cell kernel *[4 x out]*. (Default value = None)
         recurrent_bias
             bias for cell recurrent kernel *[4 x out]*. (Default value = None)
+        mask
+            boolean mask of the valid timesteps *[batch_shape, t]*, for sequences of
+            different lengths. (Default value = None)
 
         Returns
         -------
@@ -2193,6 +2199,7 @@ class _ContainerWithLayers(ContainerBase):
             recurrent_kernel,
             bias=bias,
             recurrent_bias=recurrent_bias,
+            mask=mask,
             key_chains=key_chains,
             to_apply=to_apply,
             prune_unapplied=prune_unapplied,
@@ -0,0 +1,249 @@
+"""Background prefetching of batches of containers ahead of their use."""
+
+# global
+import multiprocessing
+import queue
+import threading
+import time
+
+import numpy as np
+
+# local
+import ivy
+from .base import _array_from_numpy
+from .shared_memory import to_shared_memory, from_shared_memory
+
+
+def _map_leaves(nest, fn):
+    if isinstance(nest, dict):
+        return {k: _map_leaves(v, fn) for k, v in nest.items()}
+    return fn(nest)
+
+
+def _to_numpy(x):
+    return ivy.to_numpy(x) if ivy.is_array(x) else np.asarray(x)
+
+
+def _load(load_fn, index, in_process, use_shared_memory):
+    # loads a batch, returning the batch, the time taken and the exception raised
+    start = time.perf_counter()
+    try:
+        batch = load_fn(index)
+        if in_process:
+            if isinstance(batch, ivy.Container):
+                batch = batch.cont_to_dict()
+            batch = _map_leaves(batch, _to_numpy)
+            if use_shared_memory:
+                batch = to_shared_memory(batch)
+        return batch, time.perf_counter() - start, None
+    except BaseException as e:
+        return None, time.perf_counter() - start, e
+
+
+def _worker(load_fn, indices, results, in_process, use_shared_memory):
+    while True:
+        index = indices.get()
+        if index is None:
+            return
+        results.put((index, *_load(load_fn, index, in_process, use_shared_memory)))
+
+
+class ContainerPrefetcher:
+    """
+    Iterate over batches of containers, which are loaded by background workers ahead
+    of their use.
+
+    The workers load the batches into a bounded buffer, holding at most
+    ``buffer_size`` batches which are loading or waiting to be used. The batches are
+    returned in order and are dropped from the buffer once they are returned, which
+    frees space for the next batch to be loaded.
+
+    Parameters
+    ----------
+    load_fn
+        Function which loads the batch at an index, returning a container or a dict of
+        arrays, or raising ``StopIteration`` once there are no more batches. With
+        processes, it must be picklable for the multiprocessing start method.
+    num_batches
+        The number of batches. Default is ``None``, in which case batches are loaded
+        until ``load_fn`` raises ``StopIteration``.
+    num_workers
+        The number of workers loading batches. Default is ``1``.
+    buffer_size
+        The maximum number of batches loading or waiting to be used. Default is ``2``.
+    use_processes
+        Whether the workers are processes rather than threads, for loading functions
+        which hold the GIL. The leaves are then returned as numpy arrays, and
+        converted to arrays of the backend. Default is ``False``.
+    use_shared_memory
+        Whether processes return the leaves through shared memory, with
+        :func:`ivy.to_shared_memory`, rather than pickling them through a pipe, in
+        which case the arrays returned are views of the shared memory. Default is
+        ``False``.
+    timeout
+        The timeout when waiting for a batch, after which ``queue.Empty`` is raised.
+        Default is global.
+
+    Examples
+    --------
+    >>> def load_fn(i):
+    ...     return {"x": ivy.ones((2, 3)) * i, "y": ivy.array([i, i])}
+    >>> prefetcher = ivy.ContainerPrefetcher(load_fn, num_batches=3)
+    >>> [int(batch.y[0]) for batch in prefetcher]
+    [0, 1, 2]
+    >>> prefetcher.stats["batches"]
+    3
+    """
+
+    def __init__(
+        self,
+        load_fn,
+        num_batches=None,
+        *,
+        num_workers=1,
+        buffer_size=2,
+        use_processes=False,
+        use_shared_memory=False,
+        timeout=None,
+    ):
+        self._num_batches = num_batches
+        self._buffer_size = max(buffer_size, 1)
+        self._use_processes = use_processes
+        self._use_shared_memory = use_processes and use_shared_memory
+        self._timeout = ivy.default(timeout, ivy.get_queue_timeout())
+        if use_processes:
+            self._indices = multiprocessing.Queue()
+            self._results = multiprocessing.Queue()
+            worker_cls = multiprocessing.Process
+        else:
+            self._indices = queue.Queue()
+            self._results = queue.Queue()
+            worker_cls = threading.Thread
+        self._workers = [
+            worker_cls(
+                target=_worker,
+                args=(
+                    load_fn,
+                    self._indices,
+                    self._results,
+                    use_processes,
+                    self._use_shared_memory,
+                ),
+                daemon=True,
+            )
+            for _ in range(max(num_workers, 1))
+        ]
+        for worker in self._workers:
+            worker.start()
+        # the batches which have been loaded out of order, until they are returned
+        self._loaded = dict()
+        self._next_index = 0
+        self._next_to_load = 0
+        self._stopped = False
+        self._closed = False
+        self._start_time = None
+        self._num_returned = 0
+        self._stall_time = 0.0
+        self._load_time = 0.0
+        self._fill()
+
+    def _fill(self):
+        # requests batches until the buffer is full
+        while self._next_to_load - self._next_index < self._buffer_size and (
+            self._num_batches is None or self._next_to_load < self._num_batches
+        ):
+            self._indices.put(self._next_to_load)
+            self._next_to_load += 1
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._closed or self._stopped or (
+            self._num_batches is not None and self._next_index >= self._num_batches
+        ):
+            raise StopIteration
+        if self._start_time is None:
+            self._start_time = time.perf_counter()
+        start = time.perf_counter()
+        while self._next_index not in self._loaded:
+            index, batch, load_time, exception = self._results.get(
+                timeout=self._timeout
+            )
+            self._load_time += load_time
+            self._loaded[index] = (batch, exception)
+        self._stall_time += time.perf_counter() - start
+        batch, exception = self._loaded.pop(self._next_index)
+        self._next_index += 1
+        if isinstance(exception, StopIteration):
+            self._stopped = True
+            raise StopIteration
+        self._fill()
+        if exception is not None:
+            raise exception
+        self._num_returned += 1
+        if self._use_shared_memory:
+            batch = from_shared_memory(batch)
+        elif self._use_processes:
+            batch = _map_leaves(batch, _array_from_numpy)
+        return batch if isinstance(batch, ivy.Container) else ivy.Container(batch)
+
+    @property
+    def stats(self):
+        """
+        The throughput of the batches returned so far.
+
+        Returns
+        -------
+        ret
+            Dict with the number of ``batches`` returned, the ``batches_per_second``
+            since the first batch was requested, the total ``stall_time`` spent waiting
+            for batches to load, and the total ``load_time`` of the workers, in seconds.
+        """
+        elapsed = 0.0
+        if self._start_time is not None:
+            elapsed = time.perf_counter() - self._start_time
+        return {
+            "batches": self._num_returned,
+            "batches_per_second": self._num_returned / elapsed if elapsed else 0.0,
+            "stall_time": self._stall_time,
+            "load_time": self._load_time,
+        }
+
+    def close(self):
+        """Stop the workers, and free the batches which have not been returned."""
+        if self._closed:
+            return
+        self._closed = True
+        for _ in self._workers:
+            self._indices.put(None)
+        if self._use_processes:
+            # processes only exit once the batches they loaded have been received
+            pending = self._next_to_load - self._next_index - len(self._loaded)
+            for _ in range(pending):
+                try:
+                    index, batch, _, exception = self._results.get(
+                        timeout=self._timeout
+                    )
+                except queue.Empty:
+                    break
+                self._loaded[index] = (batch, exception)
+            if self._use_shared_memory:
+                for batch, exception in self._loaded.values():
+                    if exception is None:
+                        batch.free()
+            for worker in self._workers:
+                worker.join(timeout=self._timeout)
+        self._loaded.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
@@ -0,0 +1,188 @@
+"""Transport of arrays and containers between processes through shared memory."""
+
+# global
+from multiprocessing import resource_tracker, shared_memory
+import weakref
+
+import numpy as np
+
+# local
+import ivy
+from .base import _array_from_numpy
+
+# the offsets of the arrays in a block are aligned as for SIMD loads
+_ALIGNMENT = 64
+
+
+def _is_array(x):
+    return ivy.is_array(x) or isinstance(x, np.ndarray)
+
+
+def _to_numpy(x):
+    return np.ascontiguousarray(ivy.to_numpy(x) if ivy.is_array(x) else x)
+
+
+def _attach(name, unlink):
+    # the block of another process, which is unlinked straight away, or otherwise not
+    # registered to the resource tracker of this process, which would unlink it once
+    # this process exits
+    block = shared_memory.SharedMemory(name=name)
+    if unlink:
+        # the mapping of the block stays valid until it is closed
+        block.unlink()
+    else:
+        resource_tracker.unregister(block._name, "shared_memory")
+    return block
+
+
+def _nest_at_key_chains(leaves):
+    nest = dict()
+    for key_chain, leaf in leaves.items():
+        *keys, last = key_chain.split("/")
+        sub_nest = nest
+        for key in keys:
+            sub_nest = sub_nest.setdefault(key, dict())
+        sub_nest[last] = leaf
+    return nest
+
+
+class SharedMemoryHandle:
+    """
+    Picklable handle of arrays written to a shared memory block.
+
+    The handle holds the name of the block, along with the key chain, dtype, shape and
+    offset of each array and the key chains of all of the leaves in order, so that
+    sending it to another process only pickles this header rather than the arrays. It
+    is returned by :func:`ivy.to_shared_memory`, and the arrays are read with
+    :func:`ivy.from_shared_memory`.
+
+    The block is owned by the handle rather than by the process which wrote it, and is
+    freed either when the arrays are read with ``unlink=True``, or by calling
+    :meth:`free` for handles which are never read.
+    """
+
+    def __init__(self, name, nbytes, arrays, values, key_chains):
+        self.name = name
+        self.nbytes = nbytes
+        self.arrays = arrays
+        self.values = values
+        self.key_chains = key_chains
+
+    def free(self):
+        """Unlink the shared memory block, if it has not been unlinked already."""
+        try:
+            block = _attach(self.name, True)
+        except FileNotFoundError:
+            return
+        block.close()
+
+    def __repr__(self):
+        return "SharedMemoryHandle(name={}, nbytes={}, arrays={})".format(
+            self.name, self.nbytes, len(self.arrays)
+        )
+
+
+def to_shared_memory(x, /):
+    """
+    Write an array, or the leaves of a container, to a new shared memory block.
+
+    All of the arrays are copied into a single block, and the leaves which are not
+    arrays are kept in the handle, which can be sent to another process for
+    :func:`ivy.from_shared_memory` to read the arrays without copying them again.
+
+    Parameters
+    ----------
+    x
+        Array or container to write, or a dict which is written as a container.
+
+    Returns
+    -------
+    ret
+        The handle of the shared memory block.
+
+    Examples
+    --------
+    >>> x = ivy.Container(a=ivy.array([1., 2.]), b={"c": ivy.array([3, 4, 5])})
+    >>> handle = ivy.to_shared_memory(x)
+    >>> y = ivy.from_shared_memory(handle)
+    >>> print(y)
+    {
+        a: ivy.array([1., 2.]),
+        b: {
+            c: ivy.array([3, 4, 5])
+        }
+    }
+    """
+    is_container = not _is_array(x)
+    if isinstance(x, dict) and not isinstance(x, ivy.Container):
+        x = ivy.Container(x)
+    leaves = list(x.cont_to_iterator()) if is_container else [(None, x)]
+    arrays = list()
+    values = dict()
+    nbytes = 0
+    for key_chain, leaf in leaves:
+        if not _is_array(leaf):
+            values[key_chain] = leaf
+            continue
+        leaf = _to_numpy(leaf)
+        arrays.append((key_chain, leaf, nbytes))
+        nbytes += -(-leaf.nbytes // _ALIGNMENT) * _ALIGNMENT
+    block = shared_memory.SharedMemory(create=True, size=max(nbytes, 1))
+    for _, leaf, offset in arrays:
+        view = np.ndarray(leaf.shape, leaf.dtype, buffer=block.buf, offset=offset)
+        view[...] = leaf
+        del view
+    # the handle owns the block, rather than the resource tracker of this process
+    resource_tracker.unregister(block._name, "shared_memory")
+    block.close()
+    return SharedMemoryHandle(
+        block.name,
+        nbytes,
+        [(kc, leaf.dtype.str, leaf.shape, offset) for kc, leaf, offset in arrays],
+        values,
+        [kc for kc, _ in leaves] if is_container else None,
+    )
+
+
+def from_shared_memory(handle, /, *, unlink=True, copy=False, ivyh=None):
+    """
+    Read the array or container written to a shared memory block.
+
+    The arrays are numpy views of the block rather than copies, which are converted to
+    arrays of the backend through dlpack where the backend supports it. The block stays
+    mapped until all of the arrays are released.
+
+    Parameters
+    ----------
+    handle
+        The handle returned by :func:`ivy.to_shared_memory`.
+    unlink
+        Whether to unlink the block once it is mapped, freeing its memory once the
+        arrays are released. Must be ``False`` for all but the last of the reads of
+        handles which are read more than once. Default is ``True``.
+    copy
+        Whether to copy the arrays out of the block, rather than keeping it mapped.
+        Default is ``False``.
+    ivyh
+        Handle to ivy module to use for the arrays. Default is ``None``.
+
+    Returns
+    -------
+    ret
+        The array or container written to the block.
+    """
+    block = _attach(handle.name, unlink)
+    # the arrays are views of one array of the whole block, which closes the block
+    # once it is released along with all of the arrays
+    buffer = np.ndarray((block.size,), np.uint8, buffer=block.buf)
+    weakref.finalize(buffer, block.close)
+    leaves = dict(handle.values)
+    for key_chain, dtype, shape, offset in handle.arrays:
+        leaf = np.ndarray(shape, dtype, buffer=buffer, offset=offset)
+        leaves[key_chain] = _array_from_numpy(np.copy(leaf) if copy else leaf, ivyh)
+    del buffer
+    if handle.key_chains is None:
+        return leaves[None]
+    return ivy.Container(
+        _nest_at_key_chains({kc: leaves[kc] for kc in handle.key_chains}), ivyh=ivyh
+    )
@@ -5,8 +5,11 @@ import logging
 import weakref
 import warnings
 import copy as python_copy
+import random as python_random
+import threading
+from time import perf_counter as _perf_counter
 from types import FunctionType
-from typing import Callable
+from typing import Callable, Optional
 import inspect
 
 
@@ -352,42 +355,58 @@ def handle_array_function(fn):
     return _handle_array_function
 
 
+_NOT_INSPECTED = object()
+
+
+def _get_array_like_positions(fn):
+    """
+    Return the indices of the positional parameters of `fn` which are annotated as
+    (non-sequence) arrays, or None if the signature of `fn` cannot be inspected.
+    """
+    try:
+        type_hints = inspect.signature(fn).parameters
+    except (TypeError, ValueError):
+        return None
+    positions = []
+    for i, (parameter, param) in enumerate(type_hints.items()):
+        annotation_str = str(param.annotation)
+        if (
+            ("rray" in annotation_str or "Tensor" in annotation_str)
+            and parameter != "out"
+            and all(
+                sq not in annotation_str
+                for sq in ["Sequence", "List", "Tuple", "float", "int", "bool"]
+            )
+        ):
+            positions.append(i)
+    return positions
+
+
 def handle_array_like_without_promotion(fn: Callable) -> Callable:
+    # the array-like parameters of `fn` are inspected lazily, on the first call
+    positions = _NOT_INSPECTED
+
     @functools.wraps(fn)
     def _handle_array_like_without_promotion(*args, **kwargs):
+        nonlocal positions
         args = list(args)
         num_args = len(args)
-        try:
-            type_hints = inspect.signature(fn).parameters
-        except (TypeError, ValueError):
+        if positions is _NOT_INSPECTED:
+            positions = _get_array_like_positions(fn)
+        if positions is None:
             return fn(*args, **kwargs)
-        parameters = list(type_hints.keys())
-        annotations = [param.annotation for param in type_hints.values()]
 
-        for i, (annotation, parameter, arg) in enumerate(
-            zip(annotations, parameters, args)
-        ):
-            annotation_str = str(annotation)
-            if (
-                ("rray" in annotation_str or "Tensor" in annotation_str)
-                and parameter != "out"
-                and all(
-                    sq not in annotation_str
-                    for sq in ["Sequence", "List", "Tuple", "float", "int", "bool"]
-                )
-            ):
-                if i < num_args:
-                    # Fix for ellipsis, slices for numpy's __getitem__
-                    # No need to try and convert them into arrays
-                    # since asarray throws unpredictable bugs
-                    if _check_in_nested_sequence(arg, value=Ellipsis, _type=slice):
-                        continue
-                    if not ivy.is_array(arg):
-                        args[i] = ivy.array(arg)
-                elif parameters in kwargs:
-                    kwarg = kwargs[parameter]
-                    if not ivy.is_array(kwarg):
-                        kwargs[parameter] = ivy.array(kwarg)
+        for i in positions:
+            if i >= num_args:
+                break
+            arg = args[i]
+            # Fix for ellipsis, slices for numpy's __getitem__
+            # No need to try and convert them into arrays
+            # since asarray throws unpredictable bugs
+            if _check_in_nested_sequence(arg, value=Ellipsis, _type=slice):
+                continue
+            if not ivy.is_array(arg):
+                args[i] = ivy.array(arg)
 
         return fn(*args, **kwargs)
 
@@ -914,6 +933,376 @@ def handle_nestable(fn: Callable) -> Callable:
     return _handle_nestable
 
 
+# Dispatch Caching #
+# -----------------#
+
+# decorators which are guaranteed to be no-ops when all arguments are flat
+# (non-nested) arrays or constants
+_DISPATCH_SKIPPED_DECORATORS = (
+    "handle_array_function",
+    "handle_nestable",
+    "inputs_to_native_shapes",
+    "outputs_to_ivy_shapes",
+)
+
+_DISPATCH_CONSTANT_TYPES = (int, float, bool, complex, type(None))
+
+# all functions which currently hold a dispatch cache, used for clearing
+_dispatch_cached_fns = weakref.WeakSet()
+
+
+def _dispatch_signature(args, kwargs):
+    return tuple(map(type, args)), tuple(kwargs), tuple(map(type, kwargs.values()))
+
+
+def _classify_dispatch_type(arg_type):
+    """Classify an argument type as "ivy", "native", "constant" or None if the type
+    could hold nested arrays or containers, in which case no plan can be built."""
+    if arg_type is ivy.Array:
+        return "ivy"
+    if issubclass(arg_type, ivy.NativeArray) and not hasattr(
+        arg_type, "__ivy_array_function__"
+    ):
+        return "native"
+    if arg_type in _DISPATCH_CONSTANT_TYPES or issubclass(arg_type, str):
+        return "constant"
+    return None
+
+
+def _plan_inputs_to_native_arrays(fn, arg_idxs, kwarg_keys):
+    @functools.wraps(fn)
+    def _inputs_to_native_arrays(*args, **kwargs):
+        if not ivy.get_array_mode():
+            return fn(*args, **kwargs)
+        if arg_idxs:
+            args = list(args)
+            for i in arg_idxs:
+                args[i] = args[i].data
+        for k in kwarg_keys:
+            kwargs[k] = kwargs[k].data
+        return fn(*args, **kwargs)
+
+    return _inputs_to_native_arrays
+
+
+def _plan_inputs_to_ivy_arrays(fn, arg_idxs, kwarg_keys):
+    @functools.wraps(fn)
+    def _inputs_to_ivy_arrays(*args, **kwargs):
+        if arg_idxs:
+            args = list(args)
+            for i in arg_idxs:
+                args[i] = ivy.Array(args[i])
+        for k in kwarg_keys:
+            kwargs[k] = ivy.Array(kwargs[k])
+        return fn(*args, **kwargs)
+
+    return _inputs_to_ivy_arrays
+
+
+def _plan_outputs_to_ivy_arrays(fn, native_array_type):
+    @functools.wraps(fn)
+    def _outputs_to_ivy_arrays(*args, **kwargs):
+        ret = fn(*args, **kwargs)
+        if not ivy.get_array_mode():
+            return ret
+        if isinstance(ret, native_array_type):
+            return ivy.Array(ret)
+        return ivy.to_ivy(ret, nested=True, include_derived={tuple: True})
+
+    return _outputs_to_ivy_arrays
+
+
+def _is_raw_dispatchable(args, kwargs):
+    """Check that the call holds at least one native array and no ivy.Array or
+    ivy.Container, looking at the top level and one level into lists and tuples."""
+    ivy_types = (ivy.Array, ivy.Container)
+    native_type = ivy.NativeArray
+    has_native = False
+    for arg in (*args, *kwargs.values()):
+        if isinstance(arg, (list, tuple)):
+            for item in arg:
+                if isinstance(item, ivy_types):
+                    return False
+                has_native = has_native or isinstance(item, native_type)
+        elif isinstance(arg, ivy_types):
+            return False
+        else:
+            has_native = has_native or isinstance(arg, native_type)
+    return has_native
+
+
+def _build_raw_plan(core, original):
+    # dtype and device inference is kept, as the backend implementations
+    # expect them to be passed explicitly
+    plan = core
+    for attr in ("infer_device", "infer_dtype"):
+        if hasattr(original, attr):
+            plan = getattr(ivy, attr)(plan)
+    return plan
+
+
+def _build_dispatch_plan(core, original, signature):
+    """
+    Collapse the decorators of `original` into a single callable for the argument
+    type `signature`, as returned by `_dispatch_signature`, or return None if the
+    signature requires the full wrapping.
+
+    Decorators which are no-ops for the signature are skipped entirely, and the array
+    conversions are replaced by precomputed conversions of the exact argument
+    positions holding arrays.
+    """
+    arg_types, kwarg_keys, kwarg_types = signature
+    arg_kinds = [_classify_dispatch_type(t) for t in arg_types]
+    kwarg_kinds = [_classify_dispatch_type(t) for t in kwarg_types]
+    if None in arg_kinds or None in kwarg_kinds:
+        return None
+    if hasattr(original, "handle_array_like_without_promotion"):
+        positions = _get_array_like_positions(core)
+        if positions is not None and any(
+            i < len(arg_kinds) and arg_kinds[i] == "constant" for i in positions
+        ):
+            # array-likes would be converted, changing the argument types
+            return None
+    has_out = any(
+        k == "out" and t is not type(None) for k, t in zip(kwarg_keys, kwarg_types)
+    )
+
+    def _positions(kind):
+        arg_idxs = [i for i, k in enumerate(arg_kinds) if k == kind]
+        kwarg_idxs = [
+            key
+            for key, k in zip(kwarg_keys, kwarg_kinds)
+            if k == kind and key != "out"
+        ]
+        return arg_idxs, kwarg_idxs
+
+    plan = core
+    for attr in FN_DECORATORS:
+        if not hasattr(original, attr) or attr in _DISPATCH_SKIPPED_DECORATORS:
+            continue
+        if attr == "handle_array_like_without_promotion":
+            continue
+        if attr == "handle_out_argument" and not has_out:
+            continue
+        if attr == "inputs_to_native_arrays":
+            plan = _plan_inputs_to_native_arrays(plan, *_positions("ivy"))
+        elif attr == "inputs_to_ivy_arrays":
+            plan = _plan_inputs_to_ivy_arrays(plan, *_positions("native"))
+        elif attr == "outputs_to_ivy_arrays":
+            plan = _plan_outputs_to_ivy_arrays(plan, ivy.NativeArray)
+        else:
+            plan = getattr(ivy, attr)(plan)
+    return plan
+
+
+def _with_dispatch_cache(
+    fn: Callable,
+    core: Callable,
+    original: Callable,
+    build_profiled: Optional[Callable] = None,
+) -> Callable:
+    """
+    Wrap the fully decorated `fn` with a cache of dispatch plans.
+
+    On the first call with a given argument type signature, a plan is built from
+    `core` (the undecorated backend implementation) containing only the decorators of
+    `original` which are not no-ops for that signature. Later calls with the same
+    signature directly run the cached plan. As `fn` is rewrapped for every backend,
+    the cache is effectively keyed on (function, backend, signature).
+
+    When raw mode is enabled, calls with native arrays and no ivy.Array or
+    ivy.Container arguments bypass all wrapping except dtype and device inference,
+    and go straight to `core`.
+
+    Parameters
+    ----------
+    fn
+        The fully decorated function, used whenever no plan can be built.
+    core
+        The undecorated backend implementation.
+    original
+        The original ivy implementation, whose attributes tell us the decorators.
+    build_profiled
+        Function building the instrumented version of the function, which is called
+        instead while a function profiler is running. Default is ``None``.
+
+    Returns
+    -------
+        The function with dispatch caching.
+    """
+    plans = dict()
+    raw_plan = _build_raw_plan(core, original)
+    profiled = None
+
+    @functools.wraps(fn)
+    def _handle_dispatch_cache(*args, **kwargs):
+        nonlocal profiled
+        if _active_profiler is not None and build_profiled is not None:
+            if profiled is None:
+                profiled = build_profiled()
+            return profiled(*args, **kwargs)
+        if ivy.get_raw_mode() and _is_raw_dispatchable(args, kwargs):
+            return raw_plan(*args, **kwargs)
+        if not ivy.get_dispatch_cache_mode():
+            return fn(*args, **kwargs)
+        signature = _dispatch_signature(args, kwargs)
+        try:
+            plan = plans[signature]
+        except KeyError:
+            plan = plans[signature] = _build_dispatch_plan(core, original, signature)
+        if plan is None:
+            return fn(*args, **kwargs)
+        return plan(*args, **kwargs)
+
+    _handle_dispatch_cache.dispatch_plans = plans
+    if build_profiled is not None:
+        _handle_dispatch_cache._instrumented = True
+    _dispatch_cached_fns.add(_handle_dispatch_cache)
+    return _handle_dispatch_cache
+
+
+def clear_dispatch_cache() -> None:
+    """Clear the dispatch plans cached for all wrapped functions."""
+    for fn in list(_dispatch_cached_fns):
+        fn.dispatch_plans.clear()
+
+
+# Instrumentation #
+# ----------------#
+
+# the ivy.utils.profiler.FunctionProfiler which is running, if any
+_active_profiler = None
+# the calls of the instrumented functions in progress in each thread, each holding
+# the name of the function, the time spent in its backend implementation, and whether
+# the call is within its backend implementation rather than its wrapping
+_profiler_frames = threading.local()
+
+
+def _instrument_backend(fn: Callable, name: str) -> Callable:
+    """
+    Time the backend implementation `fn` of the ivy function `name`, within the call
+    of the instrumented ivy function, when a function profiler is running.
+
+    Parameters
+    ----------
+    fn
+        The undecorated backend implementation.
+    name
+        The name of the ivy function.
+
+    Returns
+    -------
+    ret
+        The backend implementation, timed when a profiler is running.
+    """
+
+    @functools.wraps(fn)
+    def _instrumented_backend(*args, **kwargs):
+        if _active_profiler is None:
+            return fn(*args, **kwargs)
+        frames = getattr(_profiler_frames, "frames", None)
+        if not frames or frames[-1][0] != name:
+            return fn(*args, **kwargs)
+        frame = frames[-1]
+        frame[2] = True
+        start = _perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            frame[1] += _perf_counter() - start
+            frame[2] = False
+
+    return _instrumented_backend
+
+
+def _instrument_function(fn: Callable, name: str, times_backend: bool) -> Callable:
+    """
+    Count and time the calls of the ivy function `fn` when a function profiler is
+    running. Otherwise, the only overhead is the check of whether one is running.
+
+    Parameters
+    ----------
+    fn
+        The fully wrapped function.
+    name
+        The name of the ivy function.
+    times_backend
+        Whether the backend implementation within `fn` is timed separately, in which
+        case the rest of the time is attributed to the wrapping. Otherwise, all of
+        the time is attributed to the function itself.
+
+    Returns
+    -------
+    ret
+        The function, counted and timed when a profiler is running.
+    """
+
+    @functools.wraps(fn)
+    def _instrumented(*args, **kwargs):
+        profiler = _active_profiler
+        if profiler is None:
+            # the profiler was stopped by another thread
+            return fn(*args, **kwargs)
+        frames = getattr(_profiler_frames, "frames", None)
+        if frames is None:
+            frames = _profiler_frames.frames = list()
+        elif frames and not frames[-1][2]:
+            # called by the wrapping of another function, and timed as part of it
+            return fn(*args, **kwargs)
+        frame = [name, 0.0, not times_backend]
+        frames.append(frame)
+        start = _perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            end = _perf_counter()
+            frames.pop()
+            backend_time = frame[1] if times_backend else end - start
+            profiler._record(name, start, end, backend_time, args, kwargs)
+
+    return _instrumented
+
+
+def _with_profiling(fn: Callable, build_profiled: Callable) -> Callable:
+    """
+    Call the instrumented version of `fn` instead while a function profiler is
+    running, building it on its first call. Otherwise, the only overhead is the check
+    of whether one is running.
+
+    Parameters
+    ----------
+    fn
+        The fully wrapped function.
+    build_profiled
+        Function building the instrumented version of the function.
+
+    Returns
+    -------
+    ret
+        The function, counted and timed when a profiler is running.
+    """
+    profiled = None
+
+    @functools.wraps(fn)
+    def _handle_profiling(*args, **kwargs):
+        nonlocal profiled
+        if _active_profiler is None:
+            return fn(*args, **kwargs)
+        if profiled is None:
+            profiled = build_profiled()
+        return profiled(*args, **kwargs)
+
+    _handle_profiling._instrumented = True
+    return _handle_profiling
+
+
+def _apply_decorators(fn: Callable, original: Callable) -> Callable:
+    for attr in FN_DECORATORS:
+        if hasattr(original, attr) and not hasattr(fn, attr):
+            fn = getattr(ivy, attr)(fn)
+    return fn
+
+
 # Functions #
 
 
@@ -987,9 +1376,37 @@ def _wrap_function(
             for attr in to_replace[compositional]:
                 setattr(original, attr, True)
 
-        for attr in FN_DECORATORS:
-            if hasattr(original, attr) and not hasattr(to_wrap, attr):
-                to_wrap = getattr(ivy, attr)(to_wrap)
+        # only undecorated backend implementations can be collapsed into plans
+        core = to_wrap
+        cacheable = not mixed and not any(
+            hasattr(core, attr) for attr in FN_DECORATORS
+        )
+        to_wrap = _apply_decorators(core, original)
+        decorated = to_wrap is not core
+
+        def _build_profiled():
+            # the function wrapped again around the timed backend implementation
+            if not decorated:
+                return _instrument_function(core, key, False)
+            # the decorators are ivy functions too, and their calls while building
+            # are hidden from the profiler as part of the wrapping of the function
+            frames = getattr(_profiler_frames, "frames", None)
+            if frames is None:
+                frames = _profiler_frames.frames = list()
+            frames.append([key, 0.0, False])
+            try:
+                timed_core = _instrument_backend(core, key)
+                profiled = _apply_decorators(timed_core, original)
+                if cacheable:
+                    profiled = _with_dispatch_cache(profiled, timed_core, original)
+            finally:
+                frames.pop()
+            return _instrument_function(profiled, key, True)
+
+        if cacheable and decorated:
+            to_wrap = _with_dispatch_cache(to_wrap, core, original, _build_profiled)
+        elif not hasattr(core, "_instrumented"):
+            to_wrap = _with_profiling(to_wrap, _build_profiled)
     return to_wrap
 
 
@@ -1175,25 +1592,67 @@ def _dtype_device_wrapper_creator(attrib, t):
 # --------------#
 
 
-def _leaf_has_nans(x):
-    if isinstance(x, ivy.Container):
-        return x.has_nans()
-    elif ivy.is_array(x):
-        return ivy.isnan(x).any()
-    elif x is float("nan"):
-        return True
+def _nan_check_arrays(x, backend, arrays):
+    # collects the native float and complex arrays of the nest x, returning whether
+    # any python float in it is nan
+    if isinstance(x, (list, tuple)):
+        return any([_nan_check_arrays(item, backend, arrays) for item in x])
+    elif isinstance(x, dict):
+        # containers are dicts, and their leaves are checked along with the arrays
+        return any([_nan_check_arrays(v, backend, arrays) for v in x.values()])
+    elif isinstance(x, float):
+        return x != x
+    if isinstance(x, ivy.Array):
+        x = x.data
+    elif not backend.is_native_array(x):
+        return False
+    dtype = str(x.dtype)
+    if "float" in dtype or "complex" in dtype:
+        arrays.append(x)
     return False
 
 
 def _nest_has_nans(x):
-    return ivy.nested_any(x, _leaf_has_nans)
+    """
+    Check whether any of the arrays or python floats in the nest ``x`` is nan.
+
+    The check of each array stays on its device, and the checks of all of the arrays
+    are reduced to a single boolean, so that the device is only synchronized once
+    rather than once for each array. Integer and boolean arrays are not checked.
+    """
+    backend = ivy.current_backend()
+    arrays = list()
+    if _nan_check_arrays(x, backend, arrays):
+        return True
+    if not arrays:
+        return False
+    flags = [backend.any(backend.isnan(array)) for array in arrays]
+    if len(flags) == 1:
+        return bool(flags[0])
+    try:
+        return bool(backend.any(backend.stack(flags)))
+    except Exception:
+        # the arrays are on different devices
+        return any(bool(flag) for flag in flags)
+
+
+def _handle_nans_found(warn_level, where):
+    if warn_level == "raise_exception":
+        raise ivy.utils.exceptions.IvyException(
+            "Nans are not allowed in `raise_exception` policy."
+        )
+    elif warn_level == "warns":
+        logging.warning("Nans are present in the {}.".format(where))
 
 
 def handle_nans(fn: Callable) -> Callable:
+    num_calls = 0
+
     @functools.wraps(fn)
     def _handle_nans(*args, **kwargs):
         """
-        Check for the existence of nans in all arrays in the `args` and `kwargs`.
+        Check for the existence of nans in all arrays in the `args` and `kwargs`, or
+        in the return of the function.
 
         The presence of nans is then handled depending on the enabled `nan_policy`.
 
@@ -1202,6 +1661,9 @@ def handle_nans(fn: Callable) -> Callable:
         warns: warns a user in case nans are present
         nothing: does nothing
 
+        The policy also sets whether the inputs, the outputs or both are checked, and
+        whether only a sample of the calls of the function is checked.
+
         Parameters
         ----------
         args
@@ -1214,24 +1676,27 @@ def handle_nans(fn: Callable) -> Callable:
             The return of the function, with handling of inputs based
             on the selected `nan_policy`.
         """
-        nan_policy = ivy.get_nan_policy()
+        nonlocal num_calls
+        policies = ivy.nan_policy_stack.get()
         # skip the check if the current nan policy is `nothing``
-        if nan_policy == "nothing":
+        if not policies or policies[-1][0] == "nothing":
             return fn(*args, **kwargs)
+        warn_level, check, sample_every, sample_rate = policies[-1]
 
-        # check all args and kwards for presence of nans
-        result = _nest_has_nans(args) or _nest_has_nans(kwargs)
-
-        if result:
-            # handle nans based on the selected policy
-            if nan_policy == "raise_exception":
-                raise ivy.utils.exceptions.IvyException(
-                    "Nans are not allowed in `raise_exception` policy."
-                )
-            elif nan_policy == "warns":
-                logging.warning("Nans are present in the input.")
+        # only check a sample of the calls, if sampling is enabled
+        num_calls += 1
+        if (num_calls - 1) % sample_every or (
+            sample_rate < 1 and python_random.random() >= sample_rate
+        ):
+            return fn(*args, **kwargs)
 
-        return fn(*args, **kwargs)
+        # check all args and kwargs for presence of nans
+        if check != "outputs" and (_nest_has_nans(args) or _nest_has_nans(kwargs)):
+            _handle_nans_found(warn_level, "input")
+        ret = fn(*args, **kwargs)
+        if check != "inputs" and _nest_has_nans(ret):
+            _handle_nans_found(warn_level, "output")
+        return ret
 
     _handle_nans.handle_nans = True
     return _handle_nans
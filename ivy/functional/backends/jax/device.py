@@ -125,18 +125,30 @@ def tpu_is_available() -> bool:
 
 # noinspection PyMethodMayBeStatic
 class Profiler(BaseProfiler):
-    def __init__(self, save_dir: str):
-        super(Profiler, self).__init__(save_dir)
+    def __init__(self, save_dir: str, *, sample_interval: float = 0.01):
+        super(Profiler, self).__init__(save_dir, sample_interval=sample_interval)
         self._save_dir = os.path.join(self._save_dir, "profile")
 
+    def _live_memory(self):
+        memory = super(Profiler, self)._live_memory()
+        # the memory stats are only available for the accelerators
+        stats = [device.memory_stats() for device in jax.local_devices()]
+        stats = [s["bytes_in_use"] for s in stats if s and "bytes_in_use" in s]
+        if stats:
+            memory["bytes_in_use"] = sum(stats)
+        return memory
+
     def start(self):
+        self._start_timeline()
         jax.profiler.start_trace(self._save_dir)
 
     def stop(self):
         jax.profiler.stop_trace()
+        self._stop_timeline()
 
     def __enter__(self):
         self.start()
+        return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.stop()
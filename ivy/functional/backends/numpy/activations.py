@@ -22,7 +22,7 @@ relu.support_native_out = True
 def leaky_relu(
     x: np.ndarray, /, *, alpha: float = 0.2, out: Optional[np.ndarray] = None
 ) -> np.ndarray:
-    return np.asarray(np.where(x > 0, x, np.multiply(x, alpha)), x.dtype)
+    return np.asanyarray(np.where(x > 0, x, np.multiply(x, alpha)), x.dtype)
 
 
 @with_unsupported_dtypes({"1.23.0 and below": ("complex",)}, backend_version)
@@ -39,8 +39,8 @@ def gelu(
 
 def sigmoid(x: np.ndarray, /, *, out: Optional[np.ndarray] = None) -> np.ndarray:
     if not ivy.is_array(x):
-        return np.asarray(1 / (1 + np.exp(-x)))
-    return np.asarray(1 / (1 + np.exp(-x))).astype(x.dtype)
+        return np.asanyarray(1 / (1 + np.exp(-x)))
+    return np.asanyarray(1 / (1 + np.exp(-x))).astype(x.dtype)
 
 
 def softmax(
@@ -3,6 +3,8 @@
 # global
 import os
 import time
+import tracemalloc
+import psutil
 import numpy as np
 from typing import Union, Optional, Any
 
@@ -86,22 +88,44 @@ def to_device(
 
 
 class Profiler(BaseProfiler):
-    def __init__(self, save_dir: str):
-        # ToDO: add proper numpy profiler
-        super(Profiler, self).__init__(save_dir)
+    def __init__(self, save_dir: str, *, sample_interval: float = 0.01):
+        super(Profiler, self).__init__(save_dir, sample_interval=sample_interval)
         os.makedirs(save_dir, exist_ok=True)
         self._start_time = None
+        self._started_tracemalloc = False
+
+    def _live_memory(self):
+        return {
+            "traced": tracemalloc.get_traced_memory()[0],
+            "rss": psutil.Process(os.getpid()).memory_info().rss,
+        }
 
     def start(self):
+        # numpy allocates its buffers through the python allocator domain which
+        # tracemalloc traces, so the traced memory includes the live arrays
+        self._started_tracemalloc = not tracemalloc.is_tracing()
+        if self._started_tracemalloc:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        self._start_timeline()
         self._start_time = time.perf_counter()
 
     def stop(self):
         time_taken = time.perf_counter() - self._start_time
+        self._stop_timeline()
+        peak = tracemalloc.get_traced_memory()[1]
+        if self._started_tracemalloc:
+            tracemalloc.stop()
         with open(os.path.join(self._save_dir, "profile.log"), "w+") as f:
-            f.write("took {} seconds to complete".format(time_taken))
+            f.write(
+                "took {} seconds to complete\npeak traced memory: {} bytes".format(
+                    time_taken, peak
+                )
+            )
 
     def __enter__(self):
         self.start()
+        return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.stop()
@@ -237,9 +237,9 @@ def divide(
     x1, x2 = ivy.promote_types_of_inputs(x1, x2)
     ret = np.divide(x1, x2, out=out)
     if ivy.is_float_dtype(x1.dtype) or ivy.is_complex_dtype(x1.dtype):
-        ret = np.asarray(ret, dtype=x1.dtype)
+        ret = np.asanyarray(ret, dtype=x1.dtype)
     else:
-        ret = np.asarray(ret, dtype=ivy.default_float_dtype(as_native=True))
+        ret = np.asanyarray(ret, dtype=ivy.default_float_dtype(as_native=True))
     return ret
 
 
@@ -562,7 +562,7 @@ def remainder(
         res_floored = np.where(res >= 0, np.floor(res), np.ceil(res))
         diff = np.asarray(res - res_floored, dtype=res.dtype)
         diff, x2 = ivy.promote_types_of_inputs(diff, x2)
-        return np.asarray(np.round(diff * x2), dtype=x1.dtype)
+        return np.asanyarray(np.round(diff * x2), dtype=x1.dtype)
     return np.remainder(x1, x2, out=out)
 
 
@@ -4,8 +4,11 @@
 from typing import Optional, Union, Sequence, Callable, Tuple
 import numpy as np
 from operator import mul
+import functools
 from functools import reduce
 import multiprocessing as _multiprocessing
+import threading
+import weakref
 from numbers import Number
 
 # local
@@ -340,16 +343,435 @@ def shape(
         return ivy.Shape(x.shape)
 
 
+class _Unbatchable(Exception):
+    # raised when tracing an operation without a batching rule, in which case vmap
+    # falls back to looping over the mapped axis
+    pass
+
+
+def _raise_unbatchable(*args, **kwargs):
+    raise _Unbatchable()
+
+
+# the buffers of the batched arrays of the trace in progress in each thread, so that
+# plain views of them, such as those returned by np.asarray, are caught. They are
+# held weakly, so that the buffers of the intermediate results can be reused
+_trace_buffers = threading.local()
+
+
+def _buffer(x):
+    while isinstance(x.base, np.ndarray):
+        x = x.base
+    return x
+
+
+def _is_batched(x):
+    return isinstance(x, _BatchedArray)
+
+
+def _raw(x):
+    # the underlying array, with the batch dimension at axis 0
+    return x.view(np.ndarray) if _is_batched(x) else x
+
+
+def _batched(x):
+    buffers = getattr(_trace_buffers, "buffers", None)
+    if buffers is not None:
+        buffer = _buffer(x)
+        buffers[id(buffer)] = buffer
+    return x.view(_BatchedArray)
+
+
+def _check_escaped(operands):
+    # a plain array viewing the buffer of a batched array holds the whole batch as
+    # if it were a single example, so the trace cannot be trusted
+    buffers = getattr(_trace_buffers, "buffers", None)
+    if not buffers:
+        return
+    for x in operands:
+        if isinstance(x, (list, tuple)):
+            _check_escaped(x)
+        elif (
+            isinstance(x, np.ndarray)
+            and not _is_batched(x)
+            and buffers.get(id(_buffer(x))) is _buffer(x)
+        ):
+            raise _Unbatchable()
+
+
+def _ndim(x):
+    return x.ndim if isinstance(x, np.ndarray) else np.ndim(x)
+
+
+def _normalize_axis(axis, ndim):
+    if not -ndim <= axis < ndim:
+        raise _Unbatchable()
+    return axis % ndim + 1
+
+
+def _normalize_axes(axes, ndim):
+    if isinstance(axes, (tuple, list)):
+        return tuple(_normalize_axis(axis, ndim) for axis in axes)
+    return _normalize_axis(axes, ndim)
+
+
+def _align_operands(operands):
+    # batched operands get singleton dimensions after the batch dimension, so that
+    # they broadcast against unbatched operands as their examples would
+    ndim = max(_ndim(x) for x in operands)
+    return [
+        _raw(x).reshape(
+            (_raw(x).shape[0],) + (1,) * (ndim - x.ndim) + _raw(x).shape[1:]
+        )
+        if _is_batched(x)
+        else x
+        for x in operands
+    ]
+
+
+def _batch_matmul(x1, x2, **kwargs):
+    # vectors are promoted to matrices as matmul does for each example, and the
+    # added dimensions are removed from the result
+    squeeze = []
+    if _ndim(x1) == 1:
+        x1 = (
+            _batched(np.expand_dims(_raw(x1), -2))
+            if _is_batched(x1)
+            else np.asarray(x1)[None]
+        )
+        squeeze.append(-2)
+    if _ndim(x2) == 1:
+        x2 = (
+            _batched(np.expand_dims(_raw(x2), -1))
+            if _is_batched(x2)
+            else np.asarray(x2)[:, None]
+        )
+        squeeze.append(-1)
+    ret = np.matmul(*_align_operands([x1, x2]), **kwargs)
+    return _batched(np.squeeze(ret, axis=tuple(squeeze)) if squeeze else ret)
+
+
+def _check_out(kwargs):
+    out = kwargs.pop("out", None)
+    if isinstance(out, tuple):
+        out = out[0] if len(out) == 1 else out
+    if out is not None or kwargs.get("where", True) is not True:
+        raise _Unbatchable()
+
+
+def _batch_reduction(fn, a, axis=None, *args, tuple_axes=True, **kwargs):
+    _check_out(kwargs)
+    if axis is None and tuple_axes:
+        axis = tuple(range(1, a.ndim + 1))
+    elif axis is None:
+        # reduce over the flattened examples
+        a = _batched(_raw(a).reshape(_raw(a).shape[0], -1))
+        axis = 1
+    else:
+        axis = _normalize_axes(axis, a.ndim)
+    return _batched(fn(_raw(a), axis, *args, **kwargs))
+
+
+def _batch_transpose(a, axes=None):
+    if axes is None:
+        axes = tuple(range(a.ndim, 0, -1))
+    else:
+        axes = _normalize_axes(axes, a.ndim)
+    return _batched(np.transpose(_raw(a), (0,) + tuple(axes)))
+
+
+def _batch_reshape(a, shape=None, order="C", **kwargs):
+    shape = kwargs.get("newshape", shape)
+    if order != "C":
+        raise _Unbatchable()
+    shape = (shape,) if isinstance(shape, int) else tuple(shape)
+    return _batched(np.reshape(_raw(a), (_raw(a).shape[0],) + shape))
+
+
+def _batch_squeeze(a, axis=None):
+    if axis is None:
+        axis = tuple(i for i, size in enumerate(a.shape) if size == 1)
+    return _batched(np.squeeze(_raw(a), _normalize_axes(axis, a.ndim)))
+
+
+def _batch_expand_dims(a, axis):
+    axes = axis if isinstance(axis, (tuple, list)) else (axis,)
+    out_ndim = a.ndim + len(axes)
+    axes = tuple(axis % out_ndim + 1 for axis in axes)
+    return _batched(np.expand_dims(_raw(a), axes))
+
+
+def _broadcast_batch(arrays):
+    batch_size = next(_raw(x).shape[0] for x in arrays if _is_batched(x))
+    return [
+        _raw(x)
+        if _is_batched(x)
+        else np.broadcast_to(x, (batch_size,) + np.shape(x))
+        for x in arrays
+    ]
+
+
+def _batch_concatenate(arrays, axis=0, **kwargs):
+    _check_out(kwargs)
+    ndim = _ndim(arrays[0])
+    arrays = _broadcast_batch(arrays)
+    if axis is None:
+        arrays = [x.reshape(x.shape[0], -1) for x in arrays]
+        axis = 1
+    else:
+        axis = _normalize_axis(axis, ndim)
+    return _batched(np.concatenate(arrays, axis, **kwargs))
+
+
+def _batch_stack(arrays, axis=0, **kwargs):
+    _check_out(kwargs)
+    axis = axis % (_ndim(arrays[0]) + 1) + 1
+    return _batched(np.stack(_broadcast_batch(arrays), axis, **kwargs))
+
+
+def _batch_elementwise(fn):
+    def _elementwise(*args, **kwargs):
+        _check_out(kwargs)
+        return _batched(fn(*_align_operands(args), **kwargs))
+
+    return _elementwise
+
+
+def _batch_like(fn):
+    def _like(a, *args, **kwargs):
+        if kwargs.get("shape") is not None:
+            raise _Unbatchable()
+        return _batched(fn(_raw(a), *args, **kwargs))
+
+    return _like
+
+
+_batching_rules = {
+    np.ndim: lambda a: a.ndim,
+    np.shape: lambda a: a.shape,
+    np.size: lambda a, axis=None: a.size if axis is None else a.shape[axis],
+    np.transpose: _batch_transpose,
+    np.reshape: _batch_reshape,
+    np.ravel: lambda a, order="C": _batch_reshape(a, (-1,), order),
+    np.squeeze: _batch_squeeze,
+    np.expand_dims: _batch_expand_dims,
+    np.swapaxes: lambda a, axis1, axis2: _batched(
+        np.swapaxes(
+            _raw(a), _normalize_axis(axis1, a.ndim), _normalize_axis(axis2, a.ndim)
+        )
+    ),
+    np.moveaxis: lambda a, source, destination: _batched(
+        np.moveaxis(
+            _raw(a),
+            _normalize_axes(source, a.ndim),
+            _normalize_axes(destination, a.ndim),
+        )
+    ),
+    np.concatenate: _batch_concatenate,
+    np.stack: _batch_stack,
+    np.where: lambda condition, *args: _batch_elementwise(np.where)(
+        condition, *args
+    )
+    if args
+    else _raise_unbatchable(),
+    np.clip: _batch_elementwise(np.clip),
+    np.isclose: _batch_elementwise(np.isclose),
+    np.round: _batch_like(np.round),
+    np.copy: _batch_like(np.copy),
+    np.zeros_like: _batch_like(np.zeros_like),
+    np.ones_like: _batch_like(np.ones_like),
+    np.empty_like: _batch_like(np.empty_like),
+    np.full_like: _batch_like(np.full_like),
+    np.dot: lambda a, b, out=None: _batch_matmul(a, b)
+    if out is None and _ndim(a) in (1, 2) and _ndim(b) in (1, 2)
+    else _raise_unbatchable(),
+}
+for _fn in (
+    np.sum,
+    np.prod,
+    np.mean,
+    np.std,
+    np.var,
+    np.max,
+    np.min,
+    np.amax,
+    np.amin,
+    np.all,
+    np.any,
+    np.nansum,
+    np.nanmean,
+    np.nanmax,
+    np.nanmin,
+    np.flip,
+):
+    _batching_rules[_fn] = functools.partial(_batch_reduction, _fn)
+for _fn in (np.argmax, np.argmin, np.cumsum, np.cumprod):
+    _batching_rules[_fn] = functools.partial(_batch_reduction, _fn, tuple_axes=False)
+
+
+class _BatchedArray(np.ndarray):
+    """
+    An array traced by vmap, holding the whole batch along axis 0 while presenting
+    the shape of a single example, so that ``func`` is only called once.
+
+    NumPy functions and ufuncs are dispatched to their batched equivalents through
+    the ``__array_function__`` and ``__array_ufunc__`` protocols. Operations without
+    a batching rule, or which need the values of a single example, raise
+    ``_Unbatchable``.
+    """
+
+    @property
+    def shape(self):
+        return self.view(np.ndarray).shape[1:]
+
+    @property
+    def ndim(self):
+        return self.view(np.ndarray).ndim - 1
+
+    @property
+    def size(self):
+        return reduce(mul, self.shape, 1)
+
+    @property
+    def T(self):
+        return _batch_transpose(self)
+
+    def __len__(self):
+        if not self.ndim:
+            raise TypeError("len() of unsized object")
+        return self.shape[0]
+
+    def __getitem__(self, query):
+        query = query if isinstance(query, tuple) else (query,)
+        if not all(
+            q is None or q is Ellipsis or isinstance(q, (int, np.integer, slice))
+            for q in query
+        ):
+            raise _Unbatchable()
+        ret = self.view(np.ndarray)[(slice(None),) + query]
+        return _batched(ret)
+
+    def reshape(self, *shape, order="C"):
+        shape = shape[0] if len(shape) == 1 else shape
+        return _batch_reshape(self, shape, order)
+
+    def transpose(self, *axes):
+        axes = axes[0] if len(axes) == 1 else axes
+        return _batch_transpose(self, axes if axes else None)
+
+    def ravel(self, order="C"):
+        return _batch_reshape(self, (-1,), order)
+
+    def flatten(self, order="C"):
+        return _batch_reshape(self, (-1,), order).copy()
+
+    def squeeze(self, axis=None):
+        return _batch_squeeze(self, axis)
+
+    def swapaxes(self, axis1, axis2):
+        return np.swapaxes(self, axis1, axis2)
+
+    def argmax(self, axis=None, out=None, **kwargs):
+        return np.argmax(self, axis, out, **kwargs)
+
+    def argmin(self, axis=None, out=None, **kwargs):
+        return np.argmin(self, axis, out, **kwargs)
+
+    def cumsum(self, axis=None, dtype=None, out=None):
+        return np.cumsum(self, axis, dtype, out)
+
+    def cumprod(self, axis=None, dtype=None, out=None):
+        return np.cumprod(self, axis, dtype, out)
+
+    # operations on the values of a single example, or in-place operations
+    __setitem__ = __iter__ = __float__ = __int__ = __bool__ = __index__ = (
+        __complex__
+    ) = item = tolist = tobytes = fill = sort = argsort = partition = put = take = (
+        repeat
+    ) = resize = nonzero = diagonal = trace = choose = compress = searchsorted = (
+        dot
+    ) = _raise_unbatchable
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        _check_escaped(inputs)
+        if method == "__call__":
+            _check_out(kwargs)
+            if ufunc is np.matmul:
+                return _batch_matmul(*inputs, **kwargs)
+            if ufunc.signature is not None:
+                raise _Unbatchable()
+            ret = ufunc(*_align_operands(inputs), **kwargs)
+            if isinstance(ret, tuple):
+                return tuple(_batched(r) for r in ret)
+            return _batched(ret)
+        if method in ("reduce", "accumulate") and _is_batched(inputs[0]):
+            # the axis of the ufunc methods defaults to 0 rather than None
+            return _batch_reduction(
+                getattr(ufunc, method),
+                inputs[0],
+                kwargs.pop("axis", 0),
+                tuple_axes=method == "reduce",
+                **kwargs,
+            )
+        raise _Unbatchable()
+
+    def __array_function__(self, func, types, args, kwargs):
+        if func not in _batching_rules:
+            raise _Unbatchable()
+        _check_escaped(args)
+        _check_escaped(kwargs.values())
+        return _batching_rules[func](*args, **kwargs)
+
+
+def _loop_vmap(func, args):
+    # apply func to each example in turn, used when func cannot be traced
+    return np.stack([func(*arrays) for arrays in zip(*args)])
+
+
+def _traced_vmap(func, args, mapped):
+    # trace func once with the mapped arguments holding the whole batch, without
+    # printing the traces of the exceptions raised by operations without a rule
+    previous_buffers = getattr(_trace_buffers, "buffers", None)
+    _trace_buffers.buffers = weakref.WeakValueDictionary()
+    ivy.set_exception_trace_mode("none")
+    try:
+        ret = func(
+            *[
+                _batched(arg) if is_mapped else arg
+                for arg, is_mapped in zip(args, mapped)
+            ]
+        )
+        ret = ret.data if isinstance(ret, ivy.Array) else ret
+        # an unbatched output either does not depend on the mapped arguments, or
+        # lost the batch in an operation converting it to a plain array, such as
+        # np.asarray, and the two cannot be told apart
+        if not _is_batched(ret):
+            raise _Unbatchable()
+    finally:
+        ivy.unset_exception_trace_mode()
+        _trace_buffers.buffers = previous_buffers
+    return np.asarray(_raw(ret))
+
+
 def vmap(
     func: Callable,
     in_axes: Union[int, Sequence[int], Sequence[None]] = 0,
     out_axes: int = 0,
 ) -> Callable:
+    # the signatures of the arguments for which func could not be traced
+    untraceable = set()
+
     @ivy.output_to_native_arrays
     @ivy.inputs_to_native_arrays
     def _vmap(*args):
         # convert args tuple to list to allow mutability using moveaxis ahead.
         args = list(args)
+        traced_args = list(args)
+        mapped = (
+            [axis is not None for axis in in_axes]
+            if isinstance(in_axes, (list, tuple))
+            else [True] * len(args)
+        )
 
         # if in_axis is a non-integer, its length should be equal to pos args.
         if isinstance(in_axes, (list, tuple)):
@@ -406,15 +828,22 @@ def vmap(
             for i in range(len(in_axes)):
                 if in_axes[i] is not None:
                     args[i] = np.moveaxis(args[i], in_axes[i], 0)
+                    traced_args[i] = args[i]
         elif isinstance(in_axes, int):
             args[0] = np.moveaxis(args[0], in_axes, 0)
-
-        # vectorisation. To be optimized.
-        arr_results = []
-        for arrays in zip(*args):
-            single_op = func(*arrays)
-            arr_results.append(single_op)
-        res = np.stack(arr_results)
+            traced_args[0] = args[0]
+
+        # vectorisation, tracing func once with batched arrays when every operation
+        # in it has a batching rule, and looping over the mapped axis otherwise
+        signature = tuple((np.shape(arg), np.result_type(arg)) for arg in args)
+        res = None
+        if signature not in untraceable and len(args[0]):
+            try:
+                res = _traced_vmap(func, traced_args, mapped)
+            except Exception:
+                untraceable.add(signature)
+        if res is None:
+            res = _loop_vmap(func, args)
 
         if out_axes:
             res = np.moveaxis(res, 0, out_axes)
@@ -101,6 +101,130 @@ def _dilate_pad_conv_tranpose(
     return x, filters
 
 
+# the im2col buffer is built in chunks along the first spatial output dimension so
+# that it never takes up more than this many bytes
+_IM2COL_MAX_BYTES = 2**26
+# stride 1 convolutions switch to the FFT engine when the kernel has at least this
+# many spatial elements, and at least twice as many as there are pairs of input and
+# output channels, below which the matrix multiplication of im2col is faster
+_FFT_MIN_KERNEL_SIZE = 64
+
+
+def _conv_output_shape(x, filters, strides, dims):
+    return [
+        (x.shape[i + 1] - filters.shape[i]) // strides[i] + 1 for i in range(dims)
+    ]
+
+
+def _conv_windows(x, filter_shape, strides, output_shape):
+    # B x O1 x ... x Od x K1 x ... x Kd x I, a view of x without any copy
+    dims = len(filter_shape)
+    new_shape = [x.shape[0], *output_shape, *filter_shape, x.shape[-1]]
+    new_strides = (
+        x.strides[0],
+        *[x.strides[i + 1] * strides[i] for i in range(dims)],
+        *x.strides[1:],
+    )
+    return np.lib.stride_tricks.as_strided(x, new_shape, new_strides, writeable=False)
+
+
+def _conv_algorithm(x, filters, strides, dims, feature_group_count, output_shape):
+    if filters.shape[-2] == 1 and feature_group_count > 1:
+        return "direct"
+    if (
+        feature_group_count == 1
+        and min(output_shape) > 0
+        and all(s == 1 for s in strides)
+        and np.issubdtype(x.dtype, np.floating)
+        and np.prod(filters.shape[:dims])
+        >= max(_FFT_MIN_KERNEL_SIZE, 2 * filters.shape[-2] * filters.shape[-1])
+    ):
+        return "fft"
+    return "gemm"
+
+
+def _conv_gemm(x, filters, strides, dims, feature_group_count, output_shape):
+    windows = _conv_windows(x, filters.shape[:dims], strides, output_shape)
+    group_in = filters.shape[-2]
+    group_out = filters.shape[-1] // feature_group_count
+    dtype = np.result_type(x, filters)
+    res = np.empty([x.shape[0], *output_shape, filters.shape[-1]], dtype)
+    axes = (list(range(dims + 1, 2 * dims + 2)), list(range(dims + 1)))
+    # im2col buffer of a single output row
+    row_bytes = windows[:, :1].size // feature_group_count * dtype.itemsize
+    rows = max(1, _IM2COL_MAX_BYTES // max(1, row_bytes))
+    for g in range(feature_group_count):
+        group_windows = windows[..., g * group_in : (g + 1) * group_in]
+        group_filters = filters[..., g * group_out : (g + 1) * group_out]
+        for r in range(0, output_shape[0], rows):
+            res[:, r : r + rows, ..., g * group_out : (g + 1) * group_out] = (
+                np.tensordot(group_windows[:, r : r + rows], group_filters, axes)
+            )
+    return res
+
+
+def _conv_fft(x, filters, dims, output_shape):
+    dtype = np.result_type(x, filters)
+    axes = tuple(range(1, dims + 1))
+    fft_shape = x.shape[1 : dims + 1]
+    # the FFT computes a convolution, so the kernel is flipped for a correlation
+    kernel = np.flip(filters, tuple(range(dims)))
+    x = np.fft.rfftn(x, fft_shape, axes)
+    kernel = np.fft.rfftn(kernel, fft_shape, tuple(range(dims)))
+    # F x B x I @ F x I x O, with F the number of frequencies
+    res = np.matmul(
+        np.moveaxis(x.reshape(x.shape[0], -1, x.shape[-1]), 0, 1),
+        kernel.reshape(-1, *kernel.shape[-2:]),
+    )
+    res = np.moveaxis(res, 0, 1).reshape(*x.shape[:-1], res.shape[-1])
+    res = np.fft.irfftn(res, fft_shape, axes)
+    # only the outputs which did not wrap around the circular convolution are kept
+    valid = tuple(
+        slice(filters.shape[i] - 1, filters.shape[i] - 1 + output_shape[i])
+        for i in range(dims)
+    )
+    return res[(slice(None), *valid)].astype(dtype)
+
+
+def _conv_direct(x, filters, strides, dims, output_shape):
+    # each output channel only sees a single input channel, so the kernel offsets
+    # are accumulated one at a time without building any window buffer
+    multiplier = filters.shape[-1] // x.shape[-1]
+    if multiplier > 1:
+        x = np.repeat(x, multiplier, axis=-1)
+    res = np.zeros(
+        [x.shape[0], *output_shape, filters.shape[-1]], np.result_type(x, filters)
+    )
+    if not res.size:
+        return res
+    for offset in np.ndindex(*filters.shape[:dims]):
+        window = tuple(
+            slice(k, k + (o - 1) * s + 1, s)
+            for k, o, s in zip(offset, output_shape, strides)
+        )
+        res += x[(slice(None), *window)] * filters[offset][0]
+    return res
+
+
+def _conv(x, filters, strides, dims, feature_group_count=1):
+    """
+    Compute the correlation of a padded channel-last input with dilated filters.
+
+    The algorithm is selected from the shapes of the inputs. Depthwise convolutions
+    accumulate the kernel offsets directly, large stride 1 kernels go through the
+    FFT, and everything else is an im2col followed by a matrix multiplication.
+    """
+    output_shape = _conv_output_shape(x, filters, strides, dims)
+    algorithm = _conv_algorithm(
+        x, filters, strides, dims, feature_group_count, output_shape
+    )
+    if algorithm == "direct":
+        return _conv_direct(x, filters, strides, dims, output_shape)
+    if algorithm == "fft":
+        return _conv_fft(x, filters, dims, output_shape)
+    return _conv_gemm(x, filters, strides, dims, feature_group_count, output_shape)
+
+
 def conv1d(
     x: np.ndarray,
     filters: np.ndarray,
@@ -118,33 +242,7 @@ def conv1d(
         x = np.transpose(x, (0, 2, 1))
 
     x, filters = _dilate_pad_conv(x, filters, strides, padding, 1, dilations)
-
-    x_shape = x.shape
-    filter_shape = list(filters.shape[0:1])
-    input_dim = filters.shape[-2]
-    output_dim = filters.shape[-1]
-    new_w = (x_shape[1] - filter_shape[0]) // strides[0] + 1
-    new_shape = [x_shape[0], new_w] + filter_shape + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[1],
-        x.strides[2],
-    )
-    # B x OW x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-    # B x OW x KW x I x O
-    sub_matrices_w_output_dim = np.tile(
-        np.expand_dims(sub_matrices, -1), [1] * 4 + [output_dim]
-    )
-    # B x OW x KW x I x O
-    mult = sub_matrices_w_output_dim * filters.reshape(
-        [1] * 2 + filter_shape + [input_dim, output_dim]
-    )
-    # B x OW x O
-    res = np.sum(mult, (2, 3))
+    res = _conv(x, filters, strides, 1)
 
     if data_format == "NCW":
         res = np.transpose(res, (0, 2, 1))
@@ -195,36 +293,7 @@ def conv2d(
         x = np.transpose(x, (0, 2, 3, 1))
 
     x, filters = _dilate_pad_conv(x, filters, strides, padding, 2, dilations)
-
-    x_shape = x.shape
-    filter_shape = list(filters.shape[0:2])
-    input_dim = filters.shape[-2]
-    output_dim = filters.shape[-1]
-    new_h = (x_shape[1] - filter_shape[0]) // strides[0] + 1
-    new_w = (x_shape[2] - filter_shape[1]) // strides[1] + 1
-    new_shape = [x_shape[0], new_h, new_w] + filter_shape + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[2] * strides[1],
-        x.strides[1],
-        x.strides[2],
-        x.strides[3],
-    )
-    # B x OH x OW x KH x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-    # B x OH x OW x KH x KW x I x O
-    sub_matrices_w_output_dim = np.tile(
-        np.expand_dims(sub_matrices, -1), [1] * 6 + [output_dim]
-    )
-    # B x OH x OW x KH x KW x I x O
-    mult = sub_matrices_w_output_dim * filters.reshape(
-        [1] * 3 + filter_shape + [input_dim, output_dim]
-    )
-    # B x OH x OW x O
-    res = np.sum(mult, (3, 4, 5))
+    res = _conv(x, filters, strides, 2)
 
     if data_format == "NCHW":
         return np.transpose(res, (0, 3, 1, 2))
@@ -271,47 +340,18 @@ def depthwise_conv2d(
 ):
     strides = [strides] * 2 if isinstance(strides, int) else strides
     dilations = [dilations] * 2 if isinstance(dilations, int) else dilations
-    if isinstance(padding, int):
-        padding = [(padding, padding)] * 2
-    if data_format == "NHWC":
-        x = np.transpose(x, (3, 0, 1, 2))
-    else:
-        x = np.transpose(x, (1, 0, 2, 3))
+    if data_format == "NCHW":
+        x = np.transpose(x, (0, 2, 3, 1))
     filters = np.squeeze(filters, 3) if filters.ndim == 4 else filters
-    filters = np.transpose(filters, (2, 0, 1))
-    filters = np.expand_dims(filters, (-1, -2))
-    filter_h = filters.shape[1] + (filters.shape[1] - 1) * (dilations[0] - 1)
-    filter_w = filters.shape[2] + (filters.shape[2] - 1) * (dilations[1] - 1)
-    if isinstance(padding, str):
-        if padding == "VALID":
-            out_height = np.ceil(float(x.shape[2] - filter_h + 1) / float(strides[0]))
-            out_width = np.ceil(float(x.shape[3] - filter_w + 1) / float(strides[1]))
-        else:
-            out_height = np.ceil(float(x.shape[2]) / float(strides[0]))
-            out_width = np.ceil(float(x.shape[3]) / float(strides[1]))
-    else:
-        out_height = np.ceil(
-            float(x.shape[2] - filter_h + padding[0][0] + padding[0][1] + 1)
-            / float(strides[0])
-        )
-        out_width = np.ceil(
-            float(x.shape[3] - filter_w + padding[1][0] + padding[1][1] + 1)
-            / float(strides[1])
-        )
-    if data_format == "NHWC":
-        outputs = np.empty([x.shape[1], int(out_height), int(out_width), 0], x.dtype)
-    else:
-        outputs = np.empty([x.shape[1], 0, int(out_height), int(out_width)], x.dtype)
-    x = np.expand_dims(x, -1)
-    for i in range(x.shape[0]):
-        output = conv2d(
-            x[i], filters[i], strides, padding, data_format="NHWC", dilations=dilations
-        )
-        if data_format == "NHWC":
-            outputs = np.append(outputs, output, axis=-1)
-        else:
-            outputs = np.append(outputs, np.transpose(output, (0, 3, 1, 2)), axis=1)
-    return outputs
+    # KH x KW x 1 x C, a grouped convolution with one group per channel
+    filters = np.expand_dims(filters, -2)
+
+    x, filters = _dilate_pad_conv(x, filters, strides, padding, 2, dilations)
+    res = _conv(x, filters, strides, 2, feature_group_count=x.shape[-1])
+
+    if data_format == "NCHW":
+        return np.transpose(res, (0, 3, 1, 2))
+    return res
 
 
 def conv3d(
@@ -331,39 +371,7 @@ def conv3d(
         x = np.transpose(x, (0, 2, 3, 4, 1))
 
     x, filters = _dilate_pad_conv(x, filters, strides, padding, 3, dilations)
-
-    x_shape = x.shape
-    filter_shape = list(filters.shape[0:3])
-    input_dim = filters.shape[-2]
-    output_dim = filters.shape[-1]
-    new_d = (x_shape[1] - filter_shape[0]) // strides[0] + 1
-    new_h = (x_shape[2] - filter_shape[1]) // strides[1] + 1
-    new_w = (x_shape[3] - filter_shape[2]) // strides[2] + 1
-    new_shape = [x_shape[0], new_d, new_h, new_w] + filter_shape + [x_shape[-1]]
-    new_strides = (
-        x.strides[0],
-        x.strides[1] * strides[0],
-        x.strides[2] * strides[1],
-        x.strides[3] * strides[2],
-        x.strides[1],
-        x.strides[2],
-        x.strides[3],
-        x.strides[4],
-    )
-    # B x OD X OH x OW x KD X KH x KW x I
-    sub_matrices = np.lib.stride_tricks.as_strided(
-        x, new_shape, new_strides, writeable=False
-    )
-    # B x OD X OH x OW x KD X KH x KW x I x O
-    sub_matrices_w_output_dim = np.tile(
-        np.expand_dims(sub_matrices, -1), [1] * 8 + [output_dim]
-    )
-    # B x OD X OH x OW x KD X KH x KW x I x O
-    mult = sub_matrices_w_output_dim * filters.reshape(
-        [1] * 4 + filter_shape + [input_dim, output_dim]
-    )
-    # B x OD X OH x OW x O
-    res = np.sum(mult, (4, 5, 6, 7))
+    res = _conv(x, filters, strides, 3)
 
     if data_format == "NCDHW":
         return np.transpose(res, (0, 4, 1, 2, 3))
@@ -422,47 +430,7 @@ def conv_general_dilated(
         if x_dilations[j] > 1:
             x = _add_dilations(x, x_dilations[j], axis=j + 1)
     x, filters = _dilate_pad_conv(x, filters, strides, padding, dims, dilations)
-
-    x_shape = x.shape
-    filter_shape = list(filters.shape[0:dims])
-    input_dim = filters.shape[-2]
-    output_dim = filters.shape[-1]
-    new_shape = [
-        (x_shape[i + 1] - filter_shape[i]) // strides[i] + 1 for i in range(dims)
-    ]
-    res = []
-    new_shape = [x_shape[0], *new_shape] + filter_shape + [input_dim]
-    for i, j in zip(
-        range(0, x.shape[-1], input_dim),
-        range(0, output_dim, output_dim // feature_group_count),
-    ):
-        sliced_x = x[..., i : i + input_dim]
-        sliced_filters = filters[..., j : j + output_dim // feature_group_count]
-        normal_strides = [sliced_x.strides[i] for i in range(1, dims + 2)]
-        changed_strides = [
-            sliced_x.strides[i] * strides[i - 1] for i in range(1, dims + 1)
-        ]
-        new_strides = (x.strides[0], *changed_strides, *normal_strides)
-        # B x OH x OW x KH x KW x I
-        sub_matrices = np.lib.stride_tricks.as_strided(
-            sliced_x, new_shape, new_strides, writeable=False
-        )
-
-        # B x OH x OW x KH x KW x I x O
-        sub_matrices_w_output_dim = np.tile(
-            np.expand_dims(sub_matrices, -1),
-            [1] * (dims * 2 + 2) + [output_dim // feature_group_count],
-        )
-        # B x OH x OW x KH x KW x I x O
-        mult = sub_matrices_w_output_dim * sliced_filters.reshape(
-            [1] * (dims + 1)
-            + filter_shape
-            + [input_dim, output_dim // feature_group_count]
-        )
-
-        # B x OH x OW x O
-        res.append(np.sum(mult, tuple([i for i in range(dims + 1, dims * 2 + 2)])))
-    res = np.concatenate(res, axis=-1)
+    res = _conv(x, filters, strides, dims, feature_group_count)
     res = np.add(res, bias) if bias is not None else res
 
     if data_format == "channel_first":
@@ -431,7 +431,13 @@ def vector_norm(
     if isinstance(axis, list):
         axis = tuple(axis)
 
-    np_normalized_vector = np.linalg.norm(x, ord, axis, keepdims)
+    if axis is None:
+        # np.linalg.norm computes a matrix norm for 2D inputs when axis is None
+        np_normalized_vector = np.linalg.norm(x.ravel(), ord)
+        if keepdims:
+            np_normalized_vector = np.reshape(np_normalized_vector, [1] * x.ndim)
+    else:
+        np_normalized_vector = np.linalg.norm(x, ord, axis, keepdims)
     if ret_scalar:
         np_normalized_vector = np.squeeze(np_normalized_vector)
     return np_normalized_vector
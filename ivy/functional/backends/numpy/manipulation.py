@@ -37,7 +37,10 @@ def concat(
     ret = np.concatenate(xs, axis, out=out)
     highest_dtype = xs[0].dtype
     for i in xs:
-        highest_dtype = ivy.as_native_dtype(ivy.promote_types(highest_dtype, i.dtype))
+        if i.dtype != highest_dtype:
+            highest_dtype = ivy.as_native_dtype(
+                ivy.promote_types(highest_dtype, i.dtype)
+            )
     return ivy.astype(ret, highest_dtype, copy=False)
 
 
@@ -289,7 +292,7 @@ def clip(
     *,
     out: Optional[np.ndarray] = None,
 ) -> np.ndarray:
-    return np.asarray(np.clip(x, x_min, x_max, out=out), dtype=x.dtype)
+    return np.asanyarray(np.clip(x, x_min, x_max, out=out), dtype=x.dtype)
 
 
 clip.support_native_out = True
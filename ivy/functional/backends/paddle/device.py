@@ -95,22 +95,34 @@ def tpu_is_available() -> bool:
 
 
 class Profiler(BaseProfiler):
-    def __init__(self, save_dir: str):
-        # ToDO: add proper Paddle profiler
-        super(Profiler, self).__init__(save_dir)
+    def __init__(self, save_dir: str, *, sample_interval: float = 0.01):
+        super(Profiler, self).__init__(save_dir, sample_interval=sample_interval)
         os.makedirs(save_dir, exist_ok=True)
         self._start_time = None
+        self._on_gpu = (
+            paddle.device.is_compiled_with_cuda()
+            and paddle.device.cuda.device_count() > 0
+        )
+
+    def _live_memory(self):
+        memory = super(Profiler, self)._live_memory()
+        if self._on_gpu:
+            memory["allocated"] = paddle.device.cuda.memory_allocated()
+        return memory
 
     def start(self):
+        self._start_timeline()
         self._start_time = time.perf_counter()
 
     def stop(self):
         time_taken = time.perf_counter() - self._start_time
+        self._stop_timeline()
         with open(os.path.join(self._save_dir, "profile.log"), "w+") as f:
             f.write("took {} seconds to complete".format(time_taken))
 
     def __enter__(self):
         self.start()
+        return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.stop()
@@ -100,20 +100,36 @@ def tpu_is_available() -> bool:
 
 
 class Profiler(BaseProfiler):
-    def __init__(self, save_dir: str):
-        super(Profiler, self).__init__(save_dir)
+    def __init__(self, save_dir: str, *, sample_interval: float = 0.01):
+        super(Profiler, self).__init__(save_dir, sample_interval=sample_interval)
         self._options = tf.profiler.experimental.ProfilerOptions(
             host_tracer_level=3, python_tracer_level=1, device_tracer_level=1
         )
+        self._gpus = [
+            "GPU:{}".format(i)
+            for i in range(len(tf.config.list_physical_devices("GPU")))
+        ]
+
+    def _live_memory(self):
+        memory = super(Profiler, self)._live_memory()
+        if self._gpus:
+            memory["allocated"] = sum(
+                tf.config.experimental.get_memory_info(gpu)["current"]
+                for gpu in self._gpus
+            )
+        return memory
 
     def start(self):
+        self._start_timeline()
         tf.profiler.experimental.start(self._save_dir, options=self._options)
 
     def stop(self):
         tf.profiler.experimental.stop()
+        self._stop_timeline()
 
     def __enter__(self):
         self.start()
+        return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.stop()
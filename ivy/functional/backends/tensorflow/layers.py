@@ -8,7 +8,7 @@ from tensorflow.python.types.core import Tensor
 
 # local
 import ivy
-from ivy.func_wrapper import with_unsupported_dtypes
+from ivy.func_wrapper import with_unsupported_dtypes, handle_mixed_function
 from . import backend_version
 from ivy.functional.ivy.layers import (
     _deconv_length,
@@ -414,3 +414,50 @@ def conv_general_transpose(
     if data_format == "channel_first":
         res = tf.transpose(res, (0, dims + 1, *range(1, dims + 1)))
     return res
+
+
+def _lstm_block_gates(x):
+    # BlockLSTM orders the gates as (i, g, f, o) rather than (i, f, g, o)
+    i, f, g, o = tf.split(x, 4, axis=-1)
+    return tf.concat([i, g, f, o], axis=-1)
+
+
+@handle_mixed_function(
+    lambda x, init_h, init_c, kernel, recurrent_kernel, **kwargs: (
+        x.ndim == 3
+        and kwargs.get("mask") is None
+        and ivy.as_ivy_dtype(x.dtype) in ("float16", "float32")
+    )
+)
+def lstm_update(
+    x: Union[tf.Tensor, tf.Variable],
+    init_h: Union[tf.Tensor, tf.Variable],
+    init_c: Union[tf.Tensor, tf.Variable],
+    kernel: Union[tf.Tensor, tf.Variable],
+    recurrent_kernel: Union[tf.Tensor, tf.Variable],
+    /,
+    *,
+    bias: Optional[Union[tf.Tensor, tf.Variable]] = None,
+    recurrent_bias: Optional[Union[tf.Tensor, tf.Variable]] = None,
+    mask: Optional[Union[tf.Tensor, tf.Variable]] = None,
+) -> Tuple[Tensor, Tensor]:
+    hidden = init_h.shape[-1]
+    b = tf.zeros([4 * hidden], x.dtype)
+    b = b + bias if bias is not None else b
+    b = b + recurrent_bias if recurrent_bias is not None else b
+    peephole = tf.zeros([hidden], x.dtype)
+    _, cs, _, _, _, _, h = tf.raw_ops.BlockLSTM(
+        seq_len_max=tf.cast(tf.shape(x)[1], tf.int64),
+        x=tf.transpose(x, (1, 0, 2)),
+        cs_prev=init_c,
+        h_prev=init_h,
+        w=_lstm_block_gates(tf.concat([kernel, recurrent_kernel], axis=0)),
+        wci=peephole,
+        wcf=peephole,
+        wco=peephole,
+        b=_lstm_block_gates(b),
+        forget_bias=0.0,
+        cell_clip=-1.0,
+        use_peephole=False,
+    )
+    return tf.transpose(h, (1, 0, 2)), cs[-1]
@@ -88,21 +88,32 @@ def tpu_is_available() -> bool:
 
 
 class Profiler(BaseProfiler):
-    def __init__(self, save_dir: str):
-        super(Profiler, self).__init__(save_dir)
+    def __init__(self, save_dir: str, *, sample_interval: float = 0.01):
+        super(Profiler, self).__init__(save_dir, sample_interval=sample_interval)
         self._prof = profile(
-            activities=[ProfilerActivity.CPU, ProfilerActivity.CUDA], with_stack=True
+            activities=[ProfilerActivity.CPU, ProfilerActivity.CUDA],
+            with_stack=True,
+            profile_memory=True,
         )
 
+    def _live_memory(self):
+        memory = super(Profiler, self)._live_memory()
+        if torch.cuda.is_available():
+            memory["allocated"] = torch.cuda.memory_allocated()
+        return memory
+
     def start(self):
+        self._start_timeline()
         self._prof.__enter__()
 
     def stop(self):
         self._prof.__exit__(None, None, None)
+        self._stop_timeline()
         self._prof.export_chrome_trace(os.path.join(self._save_dir, "trace.json"))
 
     def __enter__(self):
         self.start()
+        return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.stop()
@@ -479,3 +479,42 @@ def conv_general_transpose(
     if data_format == "channel_last":
         res = res.permute(0, *range(2, dims + 2), 1)
     return res
+
+
+@handle_mixed_function(
+    lambda x, init_h, init_c, kernel, recurrent_kernel, **kwargs: (
+        x.ndim == 3 and kwargs.get("mask") is None
+    )
+)
+def lstm_update(
+    x: torch.Tensor,
+    init_h: torch.Tensor,
+    init_c: torch.Tensor,
+    kernel: torch.Tensor,
+    recurrent_kernel: torch.Tensor,
+    /,
+    *,
+    bias: Optional[torch.Tensor] = None,
+    recurrent_bias: Optional[torch.Tensor] = None,
+    mask: Optional[torch.Tensor] = None,
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    # torch orders the gates as (i, f, g, o) too, but stores the kernels transposed
+    params = [kernel.T, recurrent_kernel.T]
+    has_biases = bias is not None or recurrent_bias is not None
+    if has_biases:
+        params += [
+            bias if bias is not None else torch.zeros_like(recurrent_bias),
+            recurrent_bias if recurrent_bias is not None else torch.zeros_like(bias),
+        ]
+    ret, _, c_n = torch.lstm(
+        x,
+        (init_h.unsqueeze(0), init_c.unsqueeze(0)),
+        params,
+        has_biases,
+        1,
+        0.0,
+        False,
+        False,
+        True,
+    )
+    return ret, c_n.squeeze(0)
@@ -1,7 +1,11 @@
 # global
 import ast
 import inspect
+import json
 import math
+import os
+import sys
+import weakref
 from numbers import Number
 from typing import Union, Tuple, List, Optional, Callable, Iterable, Any
 import numpy as np
@@ -10,6 +14,7 @@ import importlib
 # local
 import ivy
 from ivy.utils.backend import current_backend
+from ivy.utils.context import ContextStack
 from ivy.func_wrapper import (
     handle_array_function,
     handle_out_argument,
@@ -173,6 +178,189 @@ def _nested_get(f, base_set, merge_fn, get_fn, wrapper=set):
     return out
 
 
+# The supported and unsupported dtypes and devices of each function, cached for each
+# backend and backend version, along with the frontend versions for the frontend
+# functions. The tables of the functions of ivy are generated offline for each
+# backend with scripts/support_tables/generate.py, and are only used for the
+# backend version they were generated with
+_support_cache = weakref.WeakKeyDictionary()
+_support_tables = dict()
+_SUPPORT_TABLES_DIR = os.path.join(os.path.dirname(__file__), "support_tables")
+_SUPPORT_ATTRIBUTES = (
+    "supported_dtypes",
+    "unsupported_dtypes",
+    "supported_devices",
+    "unsupported_devices",
+)
+
+
+def _backend_version():
+    version = ivy.backend_version
+    return version.get("version") if isinstance(version, dict) else version
+
+
+def _support_table(backend, version):
+    # the table generated for the backend, if it was generated for this version
+    key = (backend, version)
+    if key not in _support_tables:
+        table = None
+        path = os.path.join(_SUPPORT_TABLES_DIR, "{}.json".format(backend))
+        if os.path.exists(path):
+            with open(path) as f:
+                data = json.load(f)
+            if data.get("version") == version:
+                table = data["functions"]
+        _support_tables[key] = table
+    return _support_tables[key]
+
+
+def _from_support_table(entry, attr):
+    if attr.endswith("dtypes"):
+        # the dtype classes of ivy, as returned by _get_dtypes
+        dtypes = {str(dtype): dtype for dtype in ivy.all_dtypes}
+        return tuple(dtypes.get(dtype, dtype) for dtype in entry[attr])
+    return tuple(entry[attr])
+
+
+def _cached_support(fn, attr, recurse, get_fn):
+    """
+    Return the supported or unsupported dtypes or devices of a function, computing
+    them with ``get_fn`` only once for each backend and backend version.
+
+    Parameters
+    ----------
+    fn
+        The function to get the dtypes or devices of.
+    attr
+        One of ``"supported_dtypes"``, ``"unsupported_dtypes"``,
+        ``"supported_devices"`` and ``"unsupported_devices"``.
+    recurse
+        Whether to recurse into used ivy functions.
+    get_fn
+        Function computing the dtypes or devices of the function, without caching.
+
+    Returns
+    -------
+    ret
+        The dtypes or devices of the function.
+    """
+    key = (attr, recurse, ivy.backend, _backend_version())
+    module = getattr(fn, "__module__", None) or ""
+    if "frontend" in module and "ivy.functional.frontends" in sys.modules:
+        key += tuple(sys.modules["ivy.functional.frontends"].versions.items())
+    try:
+        fn_cache = _support_cache.get(fn)
+        if fn_cache is None:
+            fn_cache = _support_cache[fn] = dict()
+    except TypeError:
+        # functions which cannot be weakly referenced are not cached
+        return get_fn(fn, recurse)
+    if key in fn_cache:
+        return fn_cache[key]
+    ret = None
+    if recurse:
+        table = _support_table(ivy.backend, key[3])
+        name = getattr(fn, "__name__", None)
+        if table is not None and name in table and getattr(ivy, name, None) is fn:
+            ret = _from_support_table(table[name], attr)
+    if ret is None:
+        ret = get_fn(fn, recurse)
+    fn_cache[key] = ret
+    return ret
+
+
+def _generate_support_table(names=None):
+    """
+    Compute the supported and unsupported dtypes and devices of the functions of
+    ivy with the current backend, in the format of the tables loaded by
+    _cached_support.
+
+    Parameters
+    ----------
+    names
+        The names of the functions. Default is ``None``, in which case all of the
+        functions of ivy are included.
+
+    Returns
+    -------
+    ret
+        The table, along with the backend and backend version it is valid for.
+    """
+    if names is None:
+        names = [
+            name
+            for name, fn in ivy.__dict__.items()
+            if inspect.isfunction(fn)
+            and (getattr(fn, "__module__", None) or "").startswith("ivy.functional")
+        ]
+    get_fns = {
+        "supported_dtypes": _function_supported_dtypes,
+        "unsupported_dtypes": _function_unsupported_dtypes,
+        "supported_devices": ivy.functional.device._function_supported_devices,
+        "unsupported_devices": ivy.functional.device._function_unsupported_devices,
+    }
+    functions = dict()
+    for name in sorted(names):
+        fn = getattr(ivy, name)
+        try:
+            functions[name] = {
+                attr: sorted(str(x) for x in get_fns[attr](fn, True))
+                for attr in _SUPPORT_ATTRIBUTES
+            }
+        except Exception:
+            # the functions which cannot be parsed are computed when first used
+            continue
+    return {
+        "backend": ivy.backend,
+        "version": _backend_version(),
+        "functions": functions,
+    }
+
+
+# The native dtypes which pairs of native dtypes promote to, and the native dtypes
+# which python scalars are converted to alongside native arrays of each native dtype,
+# cached for each backend
+_promotion_cache = dict()
+_PYTHON_SCALARS = (bool, int, float, complex)
+
+
+def _promote_native_dtypes(backend, dtype1, dtype2, array_api_promotion):
+    key = (backend.backend, dtype1, dtype2, array_api_promotion)
+    try:
+        return _promotion_cache[key]
+    except KeyError:
+        pass
+    ret = ivy.as_native_dtype(
+        promote_types(dtype1, dtype2, array_api_promotion=array_api_promotion)
+    )
+    _promotion_cache[key] = ret
+    return ret
+
+
+def _scalar_to_native_array(backend, scalar, x):
+    # converts a python scalar to a native array to promote alongside the native
+    # array x, calling the asarray of the backend without the wrappers of ivy.asarray
+    key = (backend.backend, type(scalar), x.dtype)
+    try:
+        dtype = _promotion_cache[key]
+    except KeyError:
+        if x.dtype == bool and not isinstance(scalar, bool):
+            dtype = None
+        elif isinstance(scalar, float) and "int" in str(x.dtype):
+            dtype = ivy.as_native_dtype("float64")
+        else:
+            dtype = x.dtype
+        _promotion_cache[key] = dtype
+    asarray = inspect.unwrap(backend.asarray)
+    return asarray(scalar, dtype=dtype, device=backend.dev(x, as_native=True))
+
+
+def _astype_native(backend, x, dtype):
+    if not backend.is_native_array(x):
+        return ivy.astype(x, dtype, copy=False)
+    return x if x.dtype == dtype else backend.astype(x, dtype, copy=False)
+
+
 # Get the list of dtypes supported by the function
 # by default returns the supported dtypes
 def _get_dtypes(fn, complement=True):
@@ -774,11 +962,11 @@ def result_type(
 # Extra #
 # ------#
 
-default_dtype_stack = list()
-default_float_dtype_stack = list()
-default_int_dtype_stack = list()
-default_uint_dtype_stack = list()
-default_complex_dtype_stack = list()
+default_dtype_stack = ContextStack("default_dtype_stack")
+default_float_dtype_stack = ContextStack("default_float_dtype_stack")
+default_int_dtype_stack = ContextStack("default_int_dtype_stack")
+default_uint_dtype_stack = ContextStack("default_uint_dtype_stack")
+default_complex_dtype_stack = ContextStack("default_complex_dtype_stack")
 
 
 class DefaultDtype:
@@ -1586,20 +1774,9 @@ def function_supported_dtypes(fn: Callable, recurse: bool = True) -> Tuple:
     ('bool', 'float64', 'int64', 'uint8', 'int8', 'float32', 'int32', 'int16', \
     'bfloat16')
     """
-    ivy.utils.assertions.check_true(
-        _is_valid_dtypes_attributes(fn),
-        (
-            "supported_dtypes and unsupported_dtypes attributes cannot both exist "
-            "in a particular backend"
-        ),
+    return _cached_support(
+        fn, "supported_dtypes", recurse, _function_supported_dtypes
     )
-    supported_dtypes = set(_get_dtypes(fn, complement=False))
-    if recurse:
-        supported_dtypes = _nested_get(
-            fn, supported_dtypes, set.intersection, function_supported_dtypes
-        )
-
-    return tuple(supported_dtypes)
 
 
 @handle_exceptions
@@ -1626,6 +1803,29 @@ def function_unsupported_dtypes(fn: Callable, recurse: bool = True) -> Tuple:
     >>> print(ivy.function_unsupported_dtypes(ivy.acosh))
     ('float16','uint16','uint32','uint64')
     """
+    return _cached_support(
+        fn, "unsupported_dtypes", recurse, _function_unsupported_dtypes
+    )
+
+
+def _function_supported_dtypes(fn, recurse):
+    ivy.utils.assertions.check_true(
+        _is_valid_dtypes_attributes(fn),
+        (
+            "supported_dtypes and unsupported_dtypes attributes cannot both exist "
+            "in a particular backend"
+        ),
+    )
+    supported_dtypes = set(_get_dtypes(fn, complement=False))
+    if recurse:
+        supported_dtypes = _nested_get(
+            fn, supported_dtypes, set.intersection, function_supported_dtypes
+        )
+
+    return tuple(supported_dtypes)
+
+
+def _function_unsupported_dtypes(fn, recurse):
     ivy.utils.assertions.check_true(
         _is_valid_dtypes_attributes(fn),
         (
@@ -2352,7 +2552,12 @@ def promote_types_of_inputs(
         # check for float number and integer array case
         return isinstance(a1, float) and "int" in str(a2.dtype)
 
-    if hasattr(x1, "dtype") and not hasattr(x2, "dtype"):
+    backend = current_backend(x1, x2)
+    if type(x2) in _PYTHON_SCALARS and backend.is_native_array(x1):
+        x2 = _scalar_to_native_array(backend, x2, x1)
+    elif type(x1) in _PYTHON_SCALARS and backend.is_native_array(x2):
+        x1 = _scalar_to_native_array(backend, x1, x2)
+    elif hasattr(x1, "dtype") and not hasattr(x2, "dtype"):
         device = ivy.default_device(item=x1, as_native=True)
         if x1.dtype == bool and not isinstance(x2, bool):
             x2 = (
@@ -2385,13 +2590,15 @@ def promote_types_of_inputs(
         x2 = ivy.asarray(x2)
 
     if x1.dtype != x2.dtype:
-        promoted = promote_types(
-            x1.dtype, x2.dtype, array_api_promotion=array_api_promotion
+        promoted = _promote_native_dtypes(
+            backend, x1.dtype, x2.dtype, array_api_promotion
         )
-        x1 = ivy.astype(x1, promoted, copy=False)
-        x2 = ivy.astype(x2, promoted, copy=False)
+        x1 = _astype_native(backend, x1, promoted)
+        x2 = _astype_native(backend, x2, promoted)
 
     ivy.utils.assertions._check_jax_x64_flag(x1.dtype)
+    if backend.is_native_array(x1) and backend.is_native_array(x2):
+        return x1, x2
     return ivy.to_native(x1), ivy.to_native(x2)
 
 
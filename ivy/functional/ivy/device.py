@@ -4,9 +4,12 @@
 import os
 import gc
 import abc
+import json
 import math
+import time
 import psutil
 import warnings
+import threading
 import types
 from typing import Type, Optional, Tuple
 
@@ -36,9 +39,10 @@ from ivy.func_wrapper import (
     handle_nestable,
     handle_array_like_without_promotion,
 )
+from ivy.utils.context import ContextStack
 from ivy.utils.exceptions import handle_exceptions
 
-default_device_stack = list()
+default_device_stack = ContextStack("default_device_stack")
 dev_handles = dict()
 split_factors = dict()
 max_chunk_sizes = dict()
@@ -1167,6 +1171,12 @@ def function_supported_devices(fn: Callable, recurse: bool = True) -> Tuple:
     >>> print(ivy.function_supported_devices(ivy.ones))
     ('cpu', 'gpu')
     """
+    return ivy.functional.data_type._cached_support(
+        fn, "supported_devices", recurse, _function_supported_devices
+    )
+
+
+def _function_supported_devices(fn, recurse):
     ivy.utils.assertions.check_true(
         _is_valid_devices_attributes(fn),
         (
@@ -1208,6 +1218,12 @@ def function_unsupported_devices(fn: Callable, recurse: bool = True) -> Tuple:
     >>> print(ivy.function_unsupported_devices(ivy.ones))
     ()
     """
+    return ivy.functional.data_type._cached_support(
+        fn, "unsupported_devices", recurse, _function_unsupported_devices
+    )
+
+
+def _function_unsupported_devices(fn, recurse):
     ivy.utils.assertions.check_true(
         _is_valid_devices_attributes(fn),
         (
@@ -1232,14 +1248,106 @@ class Profiler(abc.ABC):
     """
     The profiler class is used to profile the execution of some code.
 
+    Besides the native trace of each backend, the profilers record a timeline of the
+    ivy functions called and of samples of the live memory, which is saved to
+    ``timeline.json`` in the save directory in the Chrome trace event format, and
+    can be opened with chrome://tracing or Perfetto. The calls of the ivy functions
+    are not recorded while an :class:`ivy.utils.profiler.FunctionProfiler` is
+    already running.
+
     Parameters
     ----------
     save_dir
         The directory to save the profile data to.
+    sample_interval
+        The interval in seconds between the samples of the live memory. Default is
+        ``0.01``.
     """
 
-    def __init__(self, save_dir: str):
+    def __init__(self, save_dir: str, *, sample_interval: float = 0.01):
         self._save_dir = save_dir
+        self._sample_interval = sample_interval
+        self._function_profiler = None
+        self._memory_samples = list()
+        self._sampler = None
+        self._stop_sampling = threading.Event()
+
+    def _live_memory(self) -> dict:
+        """
+        Sample the live memory for the timeline.
+
+        Backends override this with the memory of their devices where they can
+        measure it, and the resident memory of the process is sampled otherwise.
+
+        Returns
+        -------
+        ret
+            Dict from the name of each memory measured to its size in bytes.
+        """
+        return {"rss": psutil.Process(os.getpid()).memory_info().rss}
+
+    def _sample_memory(self):
+        self._memory_samples.append((time.perf_counter(), self._live_memory()))
+
+    def _sample_memory_periodically(self):
+        while not self._stop_sampling.wait(self._sample_interval):
+            self._sample_memory()
+
+    def _start_timeline(self):
+        from ivy.utils.profiler import FunctionProfiler
+
+        self._function_profiler = FunctionProfiler(signatures=False, trace=True)
+        try:
+            self._function_profiler.start()
+        except ivy.utils.exceptions.IvyException:
+            self._function_profiler = None
+        self._memory_samples = list()
+        self._sample_memory()
+        self._stop_sampling.clear()
+        self._sampler = threading.Thread(
+            target=self._sample_memory_periodically, daemon=True
+        )
+        self._sampler.start()
+
+    def _stop_timeline(self):
+        self._stop_sampling.set()
+        self._sampler.join()
+        self._sampler = None
+        self._sample_memory()
+        if self._function_profiler is None:
+            start_time, events = self._memory_samples[0][0], list()
+        else:
+            self._function_profiler.stop()
+            start_time = self._function_profiler._start_time
+            events = self._function_profiler._trace_events()
+        pid = os.getpid()
+        events += [
+            {
+                "name": "memory",
+                "cat": "memory",
+                "ph": "C",
+                "ts": (sample_time - start_time) * 1e6,
+                "pid": pid,
+                "args": {name + "_mb": size / 1e6 for name, size in sample.items()},
+            }
+            for sample_time, sample in self._memory_samples
+        ]
+        os.makedirs(self._save_dir, exist_ok=True)
+        with open(os.path.join(self._save_dir, "timeline.json"), "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+    @property
+    def memory_samples(self) -> list:
+        """
+        The samples of the live memory recorded by the last run of the profiler.
+
+        Returns
+        -------
+        ret
+            List of the ``time.perf_counter`` time of each sample and the dict from
+            the name of each memory measured to its size in bytes.
+        """
+        return list(self._memory_samples)
 
     @abc.abstractmethod
     def start(self):
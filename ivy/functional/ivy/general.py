@@ -2,8 +2,12 @@
 
 # global
 import gc
+import hashlib
 import inspect
 import math
+import sys
+import time
+from collections import OrderedDict
 from functools import wraps
 from numbers import Number
 from typing import (
@@ -24,6 +28,7 @@ import numpy as np
 # local
 import ivy
 from ivy.utils.backend import current_backend, backend_stack
+from ivy.utils.context import ContextStack
 from ivy.functional.ivy.gradients import _is_variable
 from ivy.utils.exceptions import handle_exceptions
 from ivy.func_wrapper import (
@@ -44,17 +49,19 @@ FN_CACHE = dict()
 INF = float("inf")
 TMP_DIR = "/tmp"
 
-queue_timeout_stack = list()
-array_mode_stack = list()
-shape_array_mode_stack = list()
-nestable_mode_stack = list()
-exception_trace_mode_stack = list()
+queue_timeout_stack = ContextStack("queue_timeout_stack")
+array_mode_stack = ContextStack("array_mode_stack")
+shape_array_mode_stack = ContextStack("shape_array_mode_stack")
+nestable_mode_stack = ContextStack("nestable_mode_stack")
+dispatch_cache_mode_stack = ContextStack("dispatch_cache_mode_stack")
+raw_mode_stack = ContextStack("raw_mode_stack")
+exception_trace_mode_stack = ContextStack("exception_trace_mode_stack")
 trace_mode_dict = dict()
 trace_mode_dict["frontend"] = "ivy/functional/frontends"
 trace_mode_dict["ivy"] = "ivy/"
 trace_mode_dict["full"] = ""
 trace_mode_dict["none"] = ""
-show_func_wrapper_trace_mode_stack = list()
+show_func_wrapper_trace_mode_stack = ContextStack("show_func_wrapper_trace_mode_stack")
 
 
 # Extra #
@@ -80,6 +87,24 @@ class ArrayMode:
         return self
 
 
+class RawMode:
+    """Raw Mode Context Manager."""
+
+    # noinspection PyShadowingNames
+    def __init__(self, raw_mode=True):
+        self._raw_mode = raw_mode
+
+    def __enter__(self):
+        set_raw_mode(self._raw_mode)
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        unset_raw_mode()
+        if self and (exc_type is not None):
+            raise exc_val
+        return self
+
+
 def _parse_ellipsis(so, ndims):
     pre = list()
     for s in so:
@@ -380,10 +405,10 @@ def get_array_mode() -> bool:
     >>> ivy.get_array_mode()
     False
     """
-    global array_mode_stack
-    if not array_mode_stack:
+    stack = array_mode_stack.get()
+    if not stack:
         return True
-    return array_mode_stack[-1]
+    return stack[-1]
 
 
 @handle_exceptions
@@ -447,10 +472,153 @@ def get_nestable_mode() -> bool:
     >>> ivy.get_exception_trace_mode()
     False
     """
-    global nestable_mode_stack
-    if not nestable_mode_stack:
+    stack = nestable_mode_stack.get()
+    if not stack:
+        return True
+    return stack[-1]
+
+
+@handle_exceptions
+def set_dispatch_cache_mode(mode: bool) -> None:
+    """
+    Set the mode of whether to run wrapped functions through their cached per-
+    signature dispatch plans, rather than through the full chain of decorators.
+
+    Parameter
+    ---------
+    mode
+        boolean whether to use the cached dispatch plans
+
+    Examples
+    --------
+    >>> ivy.set_dispatch_cache_mode(False)
+    >>> ivy.get_dispatch_cache_mode()
+    False
+
+    >>> ivy.set_dispatch_cache_mode(True)
+    >>> ivy.get_dispatch_cache_mode()
+    True
+    """
+    global dispatch_cache_mode_stack
+    ivy.utils.assertions.check_isinstance(mode, bool)
+    dispatch_cache_mode_stack.append(mode)
+
+
+@handle_exceptions
+def unset_dispatch_cache_mode() -> None:
+    """
+    Reset the mode of whether to use the cached dispatch plans to the previous state.
+
+    Examples
+    --------
+    >>> ivy.set_dispatch_cache_mode(False)
+    >>> ivy.get_dispatch_cache_mode()
+    False
+
+    >>> ivy.unset_dispatch_cache_mode()
+    >>> ivy.get_dispatch_cache_mode()
+    True
+    """
+    global dispatch_cache_mode_stack
+    if dispatch_cache_mode_stack:
+        dispatch_cache_mode_stack.pop(-1)
+
+
+def get_dispatch_cache_mode() -> bool:
+    """
+    Get the current mode of whether to use the cached dispatch plans. Default is
+    ``True``.
+
+    Examples
+    --------
+    >>> ivy.get_dispatch_cache_mode()
+    True
+
+    >>> ivy.set_dispatch_cache_mode(False)
+    >>> ivy.get_dispatch_cache_mode()
+    False
+    """
+    stack = dispatch_cache_mode_stack.get()
+    if not stack:
         return True
-    return nestable_mode_stack[-1]
+    return stack[-1]
+
+
+@handle_exceptions
+def set_raw_mode(mode: bool) -> None:
+    """
+    Set the mode of whether calls made with native arrays go straight to the backend
+    implementation, without container handling, ivy.Array conversion, nan handling or
+    exception re-wrapping. Only dtype and device inference is kept.
+
+    A call is only dispatched raw if at least one argument is a native array and no
+    argument is an ivy.Array or ivy.Container, checking the top level and one level
+    into lists and tuples. Otherwise the full wrapping is used.
+
+    Raw mode only applies to functions whose backend implementation is wrapped by
+    ivy when the backend is set. Compositional functions, mixed functions and
+    backend implementations which are already decorated always use the full
+    wrapping. Outputs are native arrays in this mode.
+
+    Parameter
+    ---------
+    mode
+        boolean whether to bypass the function wrapping for native inputs
+
+    Examples
+    --------
+    >>> ivy.set_raw_mode(True)
+    >>> ivy.get_raw_mode()
+    True
+
+    >>> ivy.set_raw_mode(False)
+    >>> ivy.get_raw_mode()
+    False
+    """
+    global raw_mode_stack
+    ivy.utils.assertions.check_isinstance(mode, bool)
+    raw_mode_stack.append(mode)
+
+
+@handle_exceptions
+def unset_raw_mode() -> None:
+    """
+    Reset the mode of whether to bypass the function wrapping for native inputs to
+    the previous state.
+
+    Examples
+    --------
+    >>> ivy.set_raw_mode(True)
+    >>> ivy.get_raw_mode()
+    True
+
+    >>> ivy.unset_raw_mode()
+    >>> ivy.get_raw_mode()
+    False
+    """
+    global raw_mode_stack
+    if raw_mode_stack:
+        raw_mode_stack.pop(-1)
+
+
+def get_raw_mode() -> bool:
+    """
+    Get the current mode of whether to bypass the function wrapping for native
+    inputs. Default is ``False``.
+
+    Examples
+    --------
+    >>> ivy.get_raw_mode()
+    False
+
+    >>> with ivy.RawMode():
+    ...     ivy.get_raw_mode()
+    True
+    """
+    stack = raw_mode_stack.get()
+    if not stack:
+        return False
+    return stack[-1]
 
 
 @handle_exceptions
@@ -513,10 +681,10 @@ def get_exception_trace_mode() -> str:
     >>> ivy.get_exception_trace_mode()
     'full'
     """
-    global exception_trace_mode_stack
-    if not exception_trace_mode_stack:
+    stack = exception_trace_mode_stack.get()
+    if not stack:
         return "full"
-    return exception_trace_mode_stack[-1]
+    return stack[-1]
 
 
 @handle_exceptions
@@ -580,10 +748,10 @@ def get_show_func_wrapper_trace_mode() -> bool:
     >>> ivy.get_show_func_wrapper_trace_mode()
     False
     """
-    global show_func_wrapper_trace_mode_stack
-    if not show_func_wrapper_trace_mode_stack:
+    stack = show_func_wrapper_trace_mode_stack.get()
+    if not stack:
         return True
-    return show_func_wrapper_trace_mode_stack[-1]
+    return stack[-1]
 
 
 @handle_exceptions
@@ -1690,23 +1858,158 @@ def match_kwargs(
     return split_kwargs
 
 
+def _cache_key(x):
+    # arrays are keyed on their shape, dtype and a digest of their content rather
+    # than their string representation, which is both slow and truncated
+    if isinstance(x, ivy.Array):
+        x = x.data
+    if ivy.is_native_array(x):
+        np_x = np.ascontiguousarray(ivy.to_numpy(x))
+        return (
+            "array",
+            ivy.current_backend_str(),
+            np_x.shape,
+            str(np_x.dtype),
+            hashlib.blake2b(np_x.view(np.uint8)).digest(),
+        )
+    if isinstance(x, np.ndarray):
+        x = np.ascontiguousarray(x)
+        return (
+            "ndarray",
+            x.shape,
+            str(x.dtype),
+            hashlib.blake2b(x.view(np.uint8)).digest(),
+        )
+    if isinstance(x, ivy.Container):
+        return ("container",) + tuple(
+            (kc, _cache_key(v)) for kc, v in x.cont_to_iterator()
+        )
+    if isinstance(x, (list, tuple)):
+        return (type(x),) + tuple(_cache_key(v) for v in x)
+    if isinstance(x, dict):
+        return (type(x),) + tuple((k, _cache_key(v)) for k, v in x.items())
+    try:
+        hash(x)
+    except TypeError:
+        return (type(x), str(x))
+    # the type distinguishes values which compare equal, such as 1, 1.0 and True
+    return (type(x), x)
+
+
+def _cache_nbytes(x):
+    if isinstance(x, ivy.Array):
+        x = x.data
+    if isinstance(x, np.ndarray):
+        return x.nbytes
+    if ivy.is_native_array(x):
+        nbytes = getattr(x, "nbytes", None)
+        return nbytes if isinstance(nbytes, int) else ivy.to_numpy(x).nbytes
+    if isinstance(x, ivy.Container):
+        return sum(_cache_nbytes(v) for _, v in x.cont_to_iterator())
+    if isinstance(x, (list, tuple)):
+        return sum(_cache_nbytes(v) for v in x)
+    if isinstance(x, dict):
+        return sum(_cache_nbytes(v) for v in x.values())
+    return sys.getsizeof(x)
+
+
+class _FnCache:
+    # the cached outputs of a function, least recently used first, each stored with
+    # its size in bytes and the time it was computed
+    def __init__(self, max_entries=None, max_bytes=None, ttl=None):
+        self.entries = OrderedDict()
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is not None and self.ttl is not None:
+            if time.monotonic() - entry[2] >= self.ttl:
+                self._remove(key)
+                entry = None
+        if entry is None:
+            self.misses += 1
+            return False, None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return True, entry[0]
+
+    def set(self, key, ret):
+        nbytes = _cache_nbytes(ret)
+        if self.max_bytes is not None and nbytes > self.max_bytes:
+            return
+        if key in self.entries:
+            self._remove(key)
+        self.entries[key] = (ret, nbytes, time.monotonic())
+        self.nbytes += nbytes
+        while (
+            self.max_entries is not None and len(self.entries) > self.max_entries
+        ) or (self.max_bytes is not None and self.nbytes > self.max_bytes):
+            self._remove(next(iter(self.entries)))
+            self.evictions += 1
+
+    def _remove(self, key):
+        self.nbytes -= self.entries.pop(key)[1]
+
+    def clear(self):
+        self.entries.clear()
+        self.nbytes = 0
+
+    def info(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self.entries),
+            "nbytes": self.nbytes,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "ttl": self.ttl,
+        }
+
+
 @handle_exceptions
-def cache_fn(func: Callable) -> Callable:
+def cache_fn(
+    func: Optional[Callable] = None,
+    /,
+    *,
+    max_entries: Optional[int] = 1024,
+    max_bytes: Optional[int] = None,
+    ttl: Optional[float] = None,
+) -> Callable:
     """
     Cache function outputs.
 
     A decorator to wrap a function, such that computed outputs are cached to avoid
-    recalculating them later.
+    recalculating them later. The outputs are cached per function, and the least
+    recently used outputs are evicted once the cache exceeds `max_entries` or
+    `max_bytes`. Arrays are keyed on their shape, dtype and content.
 
     Parameters
     ----------
     func
-        The function to wrap, whose output should be cached for later.
+        The function to wrap, whose output should be cached for later. If ``None``,
+        a decorator with the given cache configuration is returned.
+    max_entries
+        The maximum number of outputs to cache for the function. ``None`` for no
+        limit. Default is ``1024``.
+    max_bytes
+        The maximum total size in bytes of the cached outputs. ``None`` for no limit.
+        Default is ``None``.
+    ttl
+        The time in seconds after which a cached output expires. ``None`` for no
+        expiry. Default is ``None``.
 
     Returns
     -------
     ret
-        The newly cache wrapped function.
+        The newly cache wrapped function, with ``cache_info`` and ``cache_clear``
+        methods returning the cache statistics and clearing the cache respectively.
 
     Examples
     --------
@@ -1746,28 +2049,72 @@ def cache_fn(func: Callable) -> Callable:
 
     >>> print(cached_line_eq(5)) # Output is re-computed
     10
+
+    With a bounded cache:
+
+    >>> def my_prod(val1:float, val2:float)->float: return val1 * val2
+    >>> cached_prod = ivy.cache_fn(my_prod, max_entries=1)
+    >>> print(cached_prod(1, 2), cached_prod(2, 3), cached_prod(1, 2))
+    2 6 2
+    >>> print(cached_prod.cache_info()["evictions"])
+    2
     """
+    if func is None:
+        return lambda fn: cache_fn(
+            fn, max_entries=max_entries, max_bytes=max_bytes, ttl=ttl
+        )
     global FN_CACHE
     if func not in FN_CACHE:
-        FN_CACHE[func] = dict()
+        FN_CACHE[func] = _FnCache(max_entries, max_bytes, ttl)
+    else:
+        cache = FN_CACHE[func]
+        cache.max_entries, cache.max_bytes, cache.ttl = max_entries, max_bytes, ttl
 
     @wraps(func)
     def cached_fn(*args, **kwargs):
-        key = "".join(
-            [str(i) + ", " for i in args]
-            + [" kw, "]
-            + [str(i) + ", " for i in sorted(kwargs.items())]
+        key = (
+            tuple(_cache_key(i) for i in args),
+            tuple((k, _cache_key(v)) for k, v in sorted(kwargs.items())),
         )
         cache = FN_CACHE[func]
-        if key in cache:
-            return cache[key]
+        found, ret = cache.get(key)
+        if found:
+            return ret
         ret = func(*args, **kwargs)
-        cache[key] = ret
+        cache.set(key, ret)
         return ret
 
+    cached_fn.cache_info = lambda: FN_CACHE[func].info()
+    cached_fn.cache_clear = lambda: clear_fn_cache(func)
     return cached_fn
 
 
+def clear_fn_cache(func: Optional[Callable] = None, /) -> None:
+    """
+    Clear the outputs cached by :func:`ivy.cache_fn`.
+
+    Parameters
+    ----------
+    func
+        The function whose cached outputs should be cleared. If ``None``, the cached
+        outputs of all functions are cleared. Default is ``None``.
+
+    Examples
+    --------
+    >>> def my_sum(val1:float, val2:float)->float: return val1 + val2
+    >>> cached_sum = ivy.cache_fn(my_sum)
+    >>> print(cached_sum(3, 5))
+    8
+    >>> ivy.clear_fn_cache(my_sum)
+    >>> print(cached_sum.cache_info()["entries"])
+    0
+    """
+    caches = FN_CACHE.values() if func is None else [FN_CACHE.get(func)]
+    for cache in caches:
+        if cache is not None:
+            cache.clear()
+
+
 @handle_exceptions
 def current_backend_str() -> Union[str, None]:
     """
@@ -2405,10 +2752,10 @@ def get_queue_timeout() -> float:
     >>> print(y)
     10.0
     """
-    global queue_timeout_stack
-    if not queue_timeout_stack:
+    stack = queue_timeout_stack.get()
+    if not stack:
         return 15.0
-    return queue_timeout_stack[-1]
+    return stack[-1]
 
 
 @handle_exceptions
@@ -3392,10 +3739,10 @@ def shape_array_mode() -> bool:
     >>> ivy.shape_array_mode()
     True
     """
-    global shape_array_mode_stack
-    if not shape_array_mode_stack:
+    stack = shape_array_mode_stack.get()
+    if not stack:
         return False
-    return shape_array_mode_stack[-1]
+    return stack[-1]
 
 
 @handle_nestable
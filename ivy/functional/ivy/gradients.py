@@ -703,7 +703,8 @@ def adam_step(
         b: ivy.array([0.216, 0.384, 0.6])
     })
     """
-    step = float(step)
+    # the optimizers count their steps in an array of shape (1,)
+    step = float(ivy.to_scalar(step) if ivy.is_array(step) else step)
     mw = ivy.add(beta1 * mw, (1 - beta1) * dcdw)
     dcdw_sqrd = dcdw**2
     vw = ivy.add(ivy.multiply(beta2, vw), (1 - beta2) * dcdw_sqrd)
@@ -844,6 +845,7 @@ def optimizer_update(
 
 
 @handle_exceptions
+@handle_nestable
 @handle_array_like_without_promotion
 @inputs_to_ivy_arrays
 @handle_array_function
@@ -937,6 +939,7 @@ def gradient_descent_update(
 
 
 @handle_exceptions
+@handle_nestable
 @handle_array_like_without_promotion
 @inputs_to_ivy_arrays
 @handle_array_function
@@ -988,6 +991,7 @@ def lars_update(
 
 
 @handle_exceptions
+@handle_nestable
 @handle_array_like_without_promotion
 @inputs_to_ivy_arrays
 @handle_array_function
@@ -1153,6 +1157,7 @@ adam_update.out_index = 0
 
 
 @handle_exceptions
+@handle_nestable
 @handle_array_like_without_promotion
 @inputs_to_ivy_arrays
 @handle_array_function
@@ -1312,7 +1317,8 @@ def lamb_update(
         r2 = ivy.vector_norm(eff_grads + decay_lambda * w)
     else:
         r2 = ivy.vector_norm(eff_grads)
-    r = ivy.minimum(ivy.stable_divide(r1, r2), ivy.array(max_trust_ratio))
+    r = ivy.stable_divide(r1, r2)
+    r = ivy.minimum(r, ivy.array(max_trust_ratio, dtype=r.dtype))
     lr = r * lr
     return (
         ivy.optimizer_update(w, eff_grads, lr, stop_gradients=stop_gradients, out=out),
@@ -1898,10 +1898,15 @@ def lstm_update(
     *,
     bias: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
     recurrent_bias: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
+    mask: Optional[Union[ivy.Array, ivy.NativeArray]] = None,
 ) -> Tuple[ivy.Array, ivy.Array]:
     """
     Perform long-short term memory update by unrolling time dimension of input array.
 
+    The input projections of all timesteps are computed in a single matrix
+    multiplication, and each timestep then needs a single matrix multiplication with
+    the recurrent kernel for all four gates.
+
     Parameters
     ----------
     x
@@ -1918,6 +1923,10 @@ def lstm_update(
         bias for cell kernel *[4 x out]*. (Default value = None)
     recurrent_bias
         bias for cell recurrent kernel *[4 x out]*. (Default value = None)
+    mask
+        boolean mask of the valid timesteps *[batch_shape, t]*, for sequences of
+        different lengths. The states are carried over unchanged through the masked
+        timesteps, whose outputs repeat the last valid output. (Default value = None)
 
     Returns
     -------
@@ -1925,58 +1934,37 @@ def lstm_update(
         hidden state for all timesteps *[batch_shape,t,out]* and cell state for last
         timestep *[batch_shape,out]*
     """
-    # get shapes
-    x_shape = list(x.shape)
-    batch_shape = x_shape[:-2]
-    timesteps = x_shape[-2]
-    input_channels = x_shape[-1]
-    x_flat = ivy.reshape(x, (-1, input_channels))
-
-    # input kernel
-    Wi = kernel
-    Wi_x = ivy.reshape(
-        ivy.matmul(x_flat, Wi) + (bias if bias is not None else 0),
-        batch_shape + [timesteps, -1],
-    )
-    Wii_x, Wif_x, Wig_x, Wio_x = ivy.split(Wi_x, num_or_size_splits=4, axis=-1)
-
-    # recurrent kernel
-    Wh = recurrent_kernel
+    timesteps = x.shape[-2]
+    # the recurrent bias is folded into the input projections, which are computed
+    # for all timesteps at once and stored time-major *[t, batch_shape, 4 x out]*
+    Wi_x = ivy.matmul(ivy.moveaxis(x, -2, 0), kernel)
+    for b in (bias, recurrent_bias):
+        Wi_x = Wi_x + b if b is not None else Wi_x
+    if mask is not None:
+        mask = ivy.unstack(ivy.expand_dims(ivy.moveaxis(mask, -1, 0), axis=-1))
 
     # lstm states
     ht = init_h
     ct = init_c
 
-    # lstm outputs
-    hts_list = list()
-
-    # unrolled time dimension with lstm steps
-    for Wii_xt, Wif_xt, Wig_xt, Wio_xt in zip(
-        ivy.unstack(Wii_x, axis=-2),
-        ivy.unstack(Wif_x, axis=-2),
-        ivy.unstack(Wig_x, axis=-2),
-        ivy.unstack(Wio_x, axis=-2),
-    ):
-        htm1 = ht
-        ctm1 = ct
-
-        Wh_htm1 = ivy.matmul(htm1, Wh) + (
-            recurrent_bias if recurrent_bias is not None else 0
-        )
-        Whi_htm1, Whf_htm1, Whg_htm1, Who_htm1 = ivy.split(
-            Wh_htm1, num_or_size_splits=4, axis=-1
-        )
+    # lstm outputs, stacked once the time dimension has been unrolled
+    hts = list()
+    for t, Wi_xt in enumerate(ivy.unstack(Wi_x)):
+        gates = Wi_xt + ivy.matmul(ht, recurrent_kernel)
+        i, f, g, o = ivy.split(gates, num_or_size_splits=4, axis=-1)
+        ct_new = ivy.sigmoid(f) * ct + ivy.sigmoid(i) * ivy.tanh(g)
+        ht_new = ivy.sigmoid(o) * ivy.tanh(ct_new)
+        if mask is None:
+            ht, ct = ht_new, ct_new
+        else:
+            ht = ivy.where(mask[t], ht_new, ht)
+            ct = ivy.where(mask[t], ct_new, ct)
+        hts.append(ht)
 
-        it = ivy.sigmoid(Wii_xt + Whi_htm1)
-        ft = ivy.sigmoid(Wif_xt + Whf_htm1)
-        gt = ivy.tanh(Wig_xt + Whg_htm1)
-        ot = ivy.sigmoid(Wio_xt + Who_htm1)
-        ct = ft * ctm1 + it * gt
-        ht = ot * ivy.tanh(ct)
+    return ivy.stack(hts, axis=-2), ct
 
-        hts_list.append(ivy.expand_dims(ht, axis=-2))
 
-    return ivy.concat(hts_list, axis=-2), ct
+lstm_update.mixed_function = True
 
 
 # Helpers #
@@ -1429,7 +1429,7 @@ class LSTM(Module):
         return {"input": input_weights, "recurrent": recurrent_weights}
 
     @handle_nestable
-    def _forward(self, inputs, initial_state=None):
+    def _forward(self, inputs, initial_state=None, mask=None):
         """
         Perform forward pass of the LSTM layer.
 
@@ -1441,6 +1441,10 @@ class LSTM(Module):
             2-tuple of lists of the hidden states h and c for each layer,
             each of dimension *[batch_shape,out]*.
             Created internally if None. (Default value = None)
+        mask
+            boolean mask of the valid timesteps *[batch_shape, t]*, for sequences of
+            different lengths. The final states of each sequence are those of its
+            last valid timestep. (Default value = None)
 
         Returns
         -------
@@ -1462,7 +1466,7 @@ class LSTM(Module):
             self.v.recurrent.items(),
         ):
             h_t, c_n = ivy.lstm_update(
-                h_t, h_0, c_0, lstm_input_var.w, lstm_recurrent_var.w
+                h_t, h_0, c_0, lstm_input_var.w, lstm_recurrent_var.w, mask=mask
             )
             h_n_list.append(h_t[..., -1, :])
             c_n_list.append(c_n)
@@ -519,14 +519,51 @@ class Module(ModuleConverters, ModuleHelpers):
         Parameters
         ----------
         weights_path
-            The hdf5 file for saving the weights.
+            The file for saving the weights. Files with the ``.safetensors``
+            extension are saved in the safetensors format, which can be memory-mapped
+            and partially loaded, and other files as hdf5.
 
         Returns
         -------
         None
         """
-        os.makedirs("/".join(weights_path.split("/")[:-1]), exist_ok=True)
-        self.v.cont_to_disk_as_hdf5(weights_path)
+        os.makedirs(os.path.dirname(weights_path) or ".", exist_ok=True)
+        if weights_path.endswith(".safetensors"):
+            self.v.cont_to_disk_as_safetensors(weights_path)
+        else:
+            self.v.cont_to_disk_as_hdf5(weights_path)
+
+    def load_weights(self, weights_path, /, *, prefixes=None):
+        """
+        Load the weights saved by :meth:`save_weights` into the Module.
+
+        Parameters
+        ----------
+        weights_path
+            The file the weights were saved to, in the safetensors format if it has the
+            ``.safetensors`` extension, and as hdf5 otherwise.
+        prefixes
+            Key-chain prefix, or list of prefixes, of the weights to load, which is only
+            supported for the safetensors format. The other weights are left
+            unchanged. Default is ``None``, which loads all of the weights in the file.
+
+        Returns
+        -------
+        ret
+            The weights of the Module, after loading.
+        """
+        if weights_path.endswith(".safetensors"):
+            v = Container.cont_from_disk_as_safetensors(weights_path, prefixes)
+        elif prefixes is not None:
+            raise ivy.utils.exceptions.IvyException(
+                "Loading the weights by key-chain prefixes is only supported for the "
+                "safetensors format."
+            )
+        else:
+            v = Container.cont_from_disk_as_hdf5(weights_path)
+        self.v.cont_assert_contains_sub_structure(v, partial=True)
+        self.v = self.v.cont_set_at_key_chains(v)
+        return self.v
 
     def build(
         self,
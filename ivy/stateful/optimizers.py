@@ -7,6 +7,103 @@ from typing import Union, Optional, Callable
 
 # local
 import ivy
+from ivy.data_classes.container.base import ContainerBase
+from ivy.data_classes.container.gradients import (
+    _FlatLayout,
+    _multi_tensor_columns,
+    _segment_norms,
+)
+
+
+# Helpers #
+# --------#
+
+
+def _adam_step_inplace(dcdw, mw, vw, step, beta1, beta2, epsilon):
+    # ivy.adam_step, with the moments mw and vw updated in-place
+    ivy.multiply(mw, beta1, out=mw)
+    ivy.add(mw, (1 - beta1) * dcdw, out=mw)
+    ivy.multiply(vw, beta2, out=vw)
+    ivy.add(vw, (1 - beta2) * dcdw**2, out=vw)
+    alpha = (1 - beta2**step) ** 0.5 / (1 - beta1**step + epsilon)
+    return ivy.divide(alpha * mw, ivy.maximum(vw, 0.0) ** 0.5 + epsilon)
+
+
+class _FlatMoments:
+    """
+    The first and second moments of the Adam based optimizers, kept in flat buffers
+    with one buffer for each dtype and device of the variables. The buffers are
+    allocated on the first step and then updated in-place, rather than being rebuilt
+    as new containers at each step.
+    """
+
+    def __init__(self, v, mw, vw=None):
+        self.layout = _FlatLayout(mw)
+        # the structure of the variables, with the same tree as v
+        self._template = v.cont_from_flat_list([None] * len(mw))
+        self.mw = self.layout.flatten(mw)
+        if vw is None:
+            self.vw = [buffer**2 for buffer in self.mw]
+        else:
+            self.vw = self.layout.flatten(vw)
+
+    def matches(self, v, columns):
+        # whether the flat leaves of v and the other containers fit the buffers
+        return (
+            columns is not None
+            and ContainerBase._cont_flat_columns([self._template, v]) is not None
+            and self.layout.matches(columns)
+        )
+
+    def update(self, v, columns, update_fn, stop_gradients, segmented=False):
+        # applies update_fn to the flat variables, gradients and moments of each
+        # group, which updates the moments in-place and returns the new variables
+        args = [self.layout.flatten(column) for column in columns]
+        args += [self.mw, self.vw]
+        if segmented:
+            args.append(self.layout.segment_ids())
+        new_ws = [update_fn(*group_args) for group_args in zip(*args)]
+        new_ws = self.layout.unflatten(
+            new_ws, stop_gradients=stop_gradients, like=columns[0]
+        )
+        return v.cont_from_flat_list(new_ws)
+
+    def containers(self):
+        # copies of the moments, as containers with the structure of the variables
+        return [
+            self._template.cont_from_flat_list(
+                self.layout.unflatten([ivy.copy_array(x) for x in buffers])
+            )
+            for buffers in (self.mw, self.vw)
+        ]
+
+    def load(self, mw, vw):
+        for buffers, leaves in ((self.mw, mw), (self.vw, vw)):
+            for buffer, values in zip(buffers, self.layout.flatten(leaves)):
+                ivy.inplace_update(buffer, values)
+
+
+def _set_moments_state(optimizer, state):
+    # loads the moments into the flat buffers of the optimizer in-place if they fit,
+    # and otherwise into new buffers, or containers if the moments cannot be flat
+    columns = _multi_tensor_columns([state.mw, state.vw], 0.0)
+    moments = optimizer._moments
+    if moments is not None and moments.matches(state.mw, columns):
+        moments.load(*columns)
+    elif columns is not None:
+        optimizer._moments = _FlatMoments(state.mw, *columns)
+    else:
+        optimizer._moments = None
+        optimizer._mw = state.mw
+        optimizer._vw = state.vw
+    optimizer._first_pass = False
+
+
+def _moments_state(optimizer):
+    if optimizer._moments is not None:
+        mw, vw = optimizer._moments.containers()
+        return ivy.Container({"mw": mw, "vw": vw})
+    return ivy.Container({"mw": optimizer._mw, "vw": optimizer._vw})
 
 
 # Base #
@@ -355,6 +452,7 @@ class Adam(Optimizer):
         self._epsilon = epsilon
         self._mw = None
         self._vw = None
+        self._moments = None
         self._first_pass = True
         self._should_compile = False
 
@@ -381,15 +479,39 @@ class Adam(Optimizer):
         ret
             The updated variables, following Adam update step.
         """
+        lr = self._lr if isinstance(self._lr, float) else self._lr()
+        columns = _multi_tensor_columns([v, grads], lr)
         if self._first_pass:
-            self._mw = grads
-            self._vw = grads**2
+            if columns is None:
+                self._mw = grads
+                self._vw = grads**2
+            else:
+                self._moments = _FlatMoments(v, columns[1])
             self._first_pass = False
+        elif self._moments is not None and not self._moments.matches(v, columns):
+            self._mw, self._vw = self._moments.containers()
+            self._moments = None
+
+        if self._moments is not None:
+            step = float(ivy.to_scalar(self._count))
+            return self._moments.update(
+                v,
+                columns,
+                lambda w, dcdw, mw, vw: ivy.optimizer_update(
+                    w,
+                    _adam_step_inplace(
+                        dcdw, mw, vw, step, self._beta1, self._beta2, self._epsilon
+                    ),
+                    lr,
+                    stop_gradients=False,
+                ),
+                self._stop_gradients,
+            )
 
         new_v, self._mw, self._vw = ivy.adam_update(
             v,
             grads,
-            self._lr if isinstance(self._lr, float) else self._lr(),
+            lr,
             self._mw,
             self._vw,
             self._count,
@@ -404,17 +526,20 @@ class Adam(Optimizer):
         """
         Set state of the optimizer.
 
+        The moments are copied into the existing buffers of the optimizer in-place
+        when they have the same structure, shapes, dtypes and devices.
+
         Parameters
         ----------
         state
-            Nested state to update.
+            Nested state to update, with the first and second moments ``mw`` and
+            ``vw``, as returned by :attr:`state`.
         """
-        self._mw = state.mw
-        self._vw = state.vw
+        _set_moments_state(self, state)
 
     @property
     def state(self):
-        return ivy.Container({"mw": self._mw, "vw": self._vw})
+        return _moments_state(self)
 
 
 class LAMB(Optimizer):
@@ -472,6 +597,7 @@ class LAMB(Optimizer):
         self._epsilon = epsilon
         self._mw = None
         self._vw = None
+        self._moments = None
         self._max_trust_ratio = max_trust_ratio
         self._decay_lambda = decay_lambda
         self._first_pass = True
@@ -495,15 +621,45 @@ class LAMB(Optimizer):
         ret
             The updated variables, following LAMB update step.
         """
+        lr = self._lr if isinstance(self._lr, float) else self._lr()
+        columns = None
+        if self._stop_gradients:
+            columns = _multi_tensor_columns([v, grads], lr)
         if self._first_pass:
-            self._mw = grads
-            self._vw = grads**2
+            if columns is None:
+                self._mw = grads
+                self._vw = grads**2
+            else:
+                self._moments = _FlatMoments(v, columns[1])
             self._first_pass = False
+        elif self._moments is not None and not self._moments.matches(v, columns):
+            self._mw, self._vw = self._moments.containers()
+            self._moments = None
+
+        if self._moments is not None:
+            step = float(ivy.to_scalar(self._count))
+
+            def _lamb_update(w, dcdw, mw, vw, segment_ids):
+                eff_grads = _adam_step_inplace(
+                    dcdw, mw, vw, step, self._beta1, self._beta2, self._epsilon
+                )
+                r1 = _segment_norms(w, segment_ids)
+                if self._decay_lambda > 0:
+                    r2 = _segment_norms(eff_grads + self._decay_lambda * w, segment_ids)
+                else:
+                    r2 = _segment_norms(eff_grads, segment_ids)
+                r = ivy.stable_divide(r1, r2)
+                r = ivy.minimum(r, ivy.array(self._max_trust_ratio, dtype=r.dtype))
+                return ivy.optimizer_update(w, eff_grads, r * lr, stop_gradients=False)
+
+            return self._moments.update(
+                v, columns, _lamb_update, self._stop_gradients, segmented=True
+            )
 
         new_v, self._mw, self._vw = ivy.lamb_update(
             v,
             grads,
-            self._lr if isinstance(self._lr, float) else self._lr(),
+            lr,
             self._mw,
             self._vw,
             self._count,
@@ -520,14 +676,17 @@ class LAMB(Optimizer):
         """
         Set state of the optimizer.
 
+        The moments are copied into the existing buffers of the optimizer in-place
+        when they have the same structure, shapes, dtypes and devices.
+
         Parameters
         ----------
         state
-            Nested state to update.
+            Nested state to update, with the first and second moments ``mw`` and
+            ``vw``, as returned by :attr:`state`.
         """
-        self._mw = state.mw
-        self._vw = state.vw
+        _set_moments_state(self, state)
 
     @property
     def state(self):
-        return ivy.Container({"mw": self._mw, "vw": self._vw})
+        return _moments_state(self)
@@ -6,7 +6,7 @@ import ivy
 import importlib
 import functools
 import numpy as np
-import gc
+import weakref
 from ivy.utils import _importlib, verbosity
 
 # local
@@ -19,6 +19,39 @@ _compiled_backends_ids = {}
 implicit_backend = "numpy"
 ivy_original_dict = ivy.__dict__.copy()
 ivy_original_fn_dict = dict()
+# the wrapped namespaces of each backend set globally, reused across set_backend calls
+_wrapped_namespaces = dict()
+
+
+class _WeakRegistry:
+    # weak references to the registered objects, the references to collected objects
+    # are pruned lazily once the registry has doubled in size
+    def __init__(self, prune_size=1024):
+        self._refs = list()
+        self._min_prune_size = prune_size
+        self._prune_size = prune_size
+
+    def add(self, obj):
+        self._refs.append(weakref.ref(obj))
+        if len(self._refs) > self._prune_size:
+            self._prune()
+
+    def _prune(self):
+        self._refs = [ref for ref in self._refs if ref() is not None]
+        self._prune_size = max(self._min_prune_size, 2 * len(self._refs))
+
+    def objects(self):
+        self._prune()
+        objs = dict()
+        for ref in self._refs:
+            obj = ref()
+            if obj is not None:
+                objs[id(obj)] = obj
+        return list(objs.values())
+
+
+# the arrays and containers to convert when the backend is set dynamically
+_dynamic_backend_objects = _WeakRegistry()
 
 
 class ContextManager:
@@ -243,22 +276,33 @@ def current_backend(*args, **kwargs):
 
 
 def _set_backend_as_ivy(
-    original_dict, target, backend, invalid_dtypes=None, backend_str=None
+    original_dict,
+    target,
+    backend,
+    invalid_dtypes=None,
+    backend_str=None,
+    namespaces=None,
 ):
     invalid_dtypes = (
         backend.invalid_dtypes if invalid_dtypes is None else invalid_dtypes
     )
     backend_str = backend.current_backend_str() if backend_str is None else backend_str
+    # record the updates of every namespace, so that they can be replayed later
+    assigned, removed = dict(), list()
+    if namespaces is not None:
+        namespaces.append((target.__dict__, assigned, removed))
     for k, v in original_dict.items():
         compositional = k not in backend.__dict__
         if k not in backend.__dict__:
             if k in invalid_dtypes and k in target.__dict__:
                 del target.__dict__[k]
+                removed.append(k)
                 continue
             backend.__dict__[k] = v
         target.__dict__[k] = _wrap_function(
             key=k, to_wrap=backend.__dict__[k], original=v, compositional=compositional
         )
+        assigned[k] = target.__dict__[k]
         if (
             isinstance(v, types.ModuleType)
             and "ivy.functional." in v.__name__
@@ -270,9 +314,67 @@ def _set_backend_as_ivy(
                 backend.__dict__[k],
                 invalid_dtypes=invalid_dtypes,
                 backend_str=backend_str,
+                namespaces=namespaces,
             )
 
 
+def _same_namespace(original_dict, other_dict):
+    return len(original_dict) == len(other_dict) and all(
+        other_dict.get(k, _same_namespace) is v for k, v in original_dict.items()
+    )
+
+
+def _get_wrapped_namespaces(backend):
+    # the cached namespaces are only valid if ivy has not been modified since
+    backend_str = backend.current_backend_str()
+    if backend_str not in _wrapped_namespaces:
+        return None
+    original_dict, namespaces = _wrapped_namespaces[backend_str]
+    if not _same_namespace(original_dict, ivy_original_dict):
+        del _wrapped_namespaces[backend_str]
+        return None
+    return namespaces
+
+
+def _set_wrapped_namespaces(backend):
+    """
+    Set ivy's namespaces to the wrapped functions of `backend`, wrapping them only the
+    first time the backend is set, and swapping in the cached wrappers afterwards.
+
+    Parameters
+    ----------
+    backend
+        the backend module to set ivy's namespaces to.
+    """
+    namespaces = _get_wrapped_namespaces(backend)
+    if namespaces is None:
+        namespaces = list()
+        _set_backend_as_ivy(ivy_original_dict, ivy, backend, namespaces=namespaces)
+        _wrapped_namespaces[backend.current_backend_str()] = (
+            ivy_original_dict,
+            namespaces,
+        )
+        return
+    for namespace, assigned, removed in namespaces:
+        for k in removed:
+            namespace.pop(k, None)
+        namespace.update(assigned)
+
+
+def clear_backend_cache():
+    """
+    Clear the wrapped backend namespaces cached by `ivy.set_backend`, so that the
+    backend functions are wrapped again the next time each backend is set.
+
+    Examples
+    --------
+    >>> ivy.set_backend("numpy")
+    >>> ivy.previous_backend()
+    >>> ivy.clear_backend_cache()
+    """
+    _wrapped_namespaces.clear()
+
+
 def _handle_backend_specific_vars(target, backend):
     if backend.current_backend_str() == "numpy":
         target.set_default_device("cpu")
@@ -280,7 +382,51 @@ def _handle_backend_specific_vars(target, backend):
         target.set_global_attr("RNG", target.functional.backends.jax.random.RNG)
 
 
-def convert_from_source_backend_to_numpy(variable_ids, numpy_objs, devices):
+# the modules providing from_dlpack for each backend, which can import the arrays of
+# any other backend implementing the DLPack protocol
+_dlpack_importers = {
+    "numpy": "numpy",
+    "jax": "jax.dlpack",
+    "tensorflow": "tensorflow.experimental.dlpack",
+    "torch": "torch.utils.dlpack",
+    "paddle": "paddle.utils.dlpack",
+}
+
+
+def _supports_dlpack_migration(x, target_backend):
+    # numpy arrays are passed to the target backend as they are, and numpy can only
+    # import arrays which live on the cpu
+    if isinstance(x, np.ndarray) or target_backend not in _dlpack_importers:
+        return False
+    if not hasattr(x, "__dlpack__") or not hasattr(x, "__dlpack_device__"):
+        return False
+    return target_backend != "numpy" or x.__dlpack_device__()[0] == 1
+
+
+def _from_dlpack(x, target_backend):
+    module = importlib.import_module(_dlpack_importers[target_backend])
+    if target_backend == "numpy":
+        return module.from_dlpack(x)
+    return module.from_dlpack(x.__dlpack__())
+
+
+def _to_target_native(x, device):
+    # arrays kept in the source backend are imported without a copy using DLPack,
+    # falling back to a copy through numpy if the target backend cannot import them
+    x = x.data if isinstance(x, ivy.Array) else x
+    if not isinstance(x, np.ndarray) and hasattr(x, "__dlpack__"):
+        try:
+            return ivy.to_ivy(
+                _from_dlpack(x, current_backend().current_backend_str())
+            )
+        except (BufferError, RuntimeError, TypeError, ValueError):
+            x = np.asarray(x)
+    return current_backend().asarray(x, device=device)
+
+
+def convert_from_source_backend_to_numpy(
+    variable_ids, numpy_objs, devices, target_backend=None
+):
     # Dynamic Backend
     from ivy.functional.ivy.gradients import _is_variable, _variable_data
 
@@ -327,14 +473,22 @@ def convert_from_source_backend_to_numpy(variable_ids, numpy_objs, devices):
 
         return list(new_objs.values())
 
-    # get all ivy array and container instances in the project scope
-    array_list, container_list = [
-        [obj for obj in gc.get_objects() if isinstance(obj, obj_type)]
-        for obj_type in (ivy.Array, ivy.Container)
-    ]
+    def _to_migratable(x):
+        # numpy arrays, and arrays the target backend can import using DLPack, are
+        # kept as they are, all other arrays are copied to numpy
+        if not ivy.is_array(x):
+            return x
+        native = x.data if isinstance(x, ivy.Array) else x
+        if isinstance(native, np.ndarray) or _supports_dlpack_migration(
+            native, target_backend
+        ):
+            return native
+        return ivy.to_numpy(x)
 
-    # filter uninitialized arrays
-    array_list = [arr for arr in array_list if arr.__dict__]
+    # get all ivy array and container instances registered for the dynamic backend
+    objs = _dynamic_backend_objects.objects()
+    array_list = [obj for obj in objs if isinstance(obj, ivy.Array)]
+    container_list = [obj for obj in objs if isinstance(obj, ivy.Container)]
 
     # remove numpy intermediate objects
     new_objs = _remove_intermediate_arrays(array_list, container_list)
@@ -352,8 +506,10 @@ def convert_from_source_backend_to_numpy(variable_ids, numpy_objs, devices):
                 native_var = _variable_data(obj)
                 np_data = ivy.to_numpy(native_var)
 
+            elif isinstance(obj, ivy.Container):
+                np_data = obj.cont_map(lambda x, kc: _to_migratable(x))
             else:
-                np_data = obj.to_numpy()
+                np_data = _to_migratable(obj)
 
             if isinstance(obj, ivy.Container):
                 obj.cont_inplace_update(np_data)
@@ -384,7 +540,7 @@ def convert_from_numpy_to_target_backend(variable_ids, numpy_objs, devices):
         else:
             new_data = ivy.nested_map(
                 np_arr,
-                lambda x: current_backend().asarray(x, device=device),
+                lambda x: _to_target_native(x, device),
                 include_derived=True,
                 shallow=False,
             )
@@ -432,7 +588,12 @@ def set_backend(backend: str, dynamic: bool = False):
 
     if dynamic:
         variable_ids, numpy_objs, devices = convert_from_source_backend_to_numpy(
-            variable_ids, numpy_objs, devices
+            variable_ids,
+            numpy_objs,
+            devices,
+            target_backend=(
+                backend if isinstance(backend, str) else backend.current_backend_str()
+            ),
         )
 
     # update the global dict with the new backend
@@ -455,7 +616,7 @@ def set_backend(backend: str, dynamic: bool = False):
             ivy.set_global_attr("RNG", ivy.functional.backends.jax.random.RNG)
         backend_stack.append(backend)
         set_backend_to_specific_version(backend)
-        _set_backend_as_ivy(ivy_original_dict, ivy, backend)
+        _set_wrapped_namespaces(backend)
 
         if dynamic:
             convert_from_numpy_to_target_backend(variable_ids, numpy_objs, devices)
@@ -571,13 +732,20 @@ def previous_backend():
         new_backend_dict = (
             backend_stack[-1].__dict__ if backend_stack else ivy_original_dict
         )
-        # wrap backend functions if there still is a backend, and add functions
-        # to ivy namespace
-        for k, v in new_backend_dict.items():
-            if backend_stack and k in ivy_original_dict:
-                v = _wrap_function(k, v, ivy_original_dict[k])
-            if k in ivy_original_dict:
-                ivy.__dict__[k] = v
+        namespaces = (
+            _get_wrapped_namespaces(backend_stack[-1]) if backend_stack else None
+        )
+        if namespaces is not None:
+            # swap in the wrapped functions cached when the backend was first set
+            _set_wrapped_namespaces(backend_stack[-1])
+        else:
+            # wrap backend functions if there still is a backend, and add functions
+            # to ivy namespace
+            for k, v in new_backend_dict.items():
+                if backend_stack and k in ivy_original_dict:
+                    v = _wrap_function(k, v, ivy_original_dict[k])
+                if k in ivy_original_dict:
+                    ivy.__dict__[k] = v
     if verbosity.level > 0:
         verbosity.cprint("backend stack: {}".format(backend_stack))
     return backend
@@ -0,0 +1,93 @@
+"""Stacks of global settings which are local to each thread and asyncio task."""
+
+# global
+import contextvars
+
+
+class ContextStack:
+    """
+    A stack of global settings, such as the default dtype or the array mode, which is
+    local to the current thread and asyncio task.
+
+    The stack supports the list methods used for the global settings. The values are
+    stored as a tuple in a ``contextvars.ContextVar``, which is replaced rather than
+    mutated, so that a setting pushed within one thread or task never leaks into
+    another. New threads start with an empty stack, and asyncio tasks start with the
+    stack of the context they were created in.
+
+    Parameters
+    ----------
+    name
+        the name of the context variable holding the stack.
+    values
+        the initial values of the stack in the current context. Default is ``()``.
+
+    Examples
+    --------
+    >>> stack = ContextStack("example_stack")
+    >>> stack.append("float32")
+    >>> stack[-1]
+    'float32'
+    >>> stack.pop(-1)
+    'float32'
+    >>> stack
+    []
+    """
+
+    __slots__ = ("_var", "get")
+
+    def __init__(self, name, values=()):
+        self._var = contextvars.ContextVar(name, default=())
+        # returns the values of the stack in the current context as a tuple, bound
+        # directly to the context variable as it is read on every function call
+        self.get = self._var.get
+        if values:
+            self._var.set(tuple(values))
+
+    def append(self, value):
+        self._var.set(self._var.get() + (value,))
+
+    def extend(self, values):
+        self._var.set(self._var.get() + tuple(values))
+
+    def pop(self, index=-1):
+        values = list(self._var.get())
+        value = values.pop(index)
+        self._var.set(tuple(values))
+        return value
+
+    def clear(self):
+        self._var.set(())
+
+    def __getitem__(self, index):
+        return self._var.get()[index]
+
+    def __len__(self):
+        return len(self._var.get())
+
+    def __bool__(self):
+        return bool(self._var.get())
+
+    def __iter__(self):
+        return iter(self._var.get())
+
+    def __contains__(self, value):
+        return value in self._var.get()
+
+    def __eq__(self, other):
+        if isinstance(other, ContextStack):
+            other = other.get()
+        if isinstance(other, (list, tuple)):
+            return self._var.get() == tuple(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return repr(list(self._var.get()))
+
+    def __copy__(self):
+        return ContextStack(self._var.name, self._var.get())
+
+    def __deepcopy__(self, memo):
+        return ContextStack(self._var.name, self._var.get())
@@ -1,10 +1,17 @@
+import collections
 import cProfile
+import json
+import os
 import pstats
 import subprocess
 import logging
+import threading
+import time
 from tempfile import NamedTemporaryFile
 from importlib.util import find_spec
 
+import ivy
+
 is_snakeviz = find_spec("snakeviz")
 
 
@@ -54,3 +61,192 @@ class Profiler(cProfile.Profile):
 
             if self.print_stats:
                 stats.print_stats()
+
+
+def _describe(x):
+    # the dtype and shape of arrays, and the type of anything else
+    if isinstance(x, (list, tuple)):
+        return "{}[{}]".format(type(x).__name__, ", ".join(_describe(i) for i in x))
+    if isinstance(x, dict):
+        return type(x).__name__
+    if isinstance(x, ivy.Array):
+        x = x.data
+    if hasattr(x, "shape") and hasattr(x, "dtype"):
+        return "{}{}".format(x.dtype, list(x.shape))
+    return type(x).__name__
+
+
+def _signature(args, kwargs):
+    return ", ".join(
+        [_describe(arg) for arg in args]
+        + ["{}={}".format(k, _describe(v)) for k, v in kwargs.items()]
+    )
+
+
+class FunctionProfiler:
+    """
+    Count and time the calls of the ivy functions while it is running.
+
+    Every ivy function wrapped for the backend is instrumented, and records its
+    calls only while a function profiler is running, so that the instrumentation
+    costs a single check per call otherwise. The time of each call is split into the
+    time of the backend implementation and the time of the ivy wrapping around it,
+    and the calls are counted for each signature of the dtypes and shapes of the
+    arrays passed. The times are inclusive of the ivy functions called within.
+
+    Parameters
+    ----------
+    signatures
+        Whether to count the calls for each signature of their arguments. Default
+        is ``True``.
+    trace
+        Whether to record each call, for :meth:`to_chrome_trace`. Default is
+        ``False``.
+    max_trace_events
+        The maximum number of calls recorded for the trace. Default is ``1000000``.
+
+    Examples
+    --------
+    >>> from ivy.utils.profiler import FunctionProfiler
+    >>> x = ivy.array([1.0, 2.0])
+    >>> with FunctionProfiler() as profiler:
+    ...     y = ivy.add(x, x)
+    >>> profiler.stats["add"]["calls"]
+    1
+    """
+
+    def __init__(self, signatures=True, trace=False, max_trace_events=1000000):
+        self._signatures = signatures
+        self._trace = trace
+        self._max_trace_events = max_trace_events
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Clear the calls recorded so far."""
+        self._stats = dict()
+        self._events = list()
+        self._start_time = time.perf_counter()
+
+    def start(self):
+        """Start recording the calls of the ivy functions."""
+        from ivy import func_wrapper
+
+        if func_wrapper._active_profiler not in (None, self):
+            raise ivy.utils.exceptions.IvyException(
+                "another function profiler is already running"
+            )
+        func_wrapper._active_profiler = self
+
+    def stop(self):
+        """Stop recording the calls of the ivy functions."""
+        from ivy import func_wrapper
+
+        if func_wrapper._active_profiler is self:
+            func_wrapper._active_profiler = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _record(self, name, start, end, backend_time, args, kwargs):
+        signature = _signature(args, kwargs) if self._signatures or self._trace else ""
+        with self._lock:
+            stats = self._stats.get(name)
+            if stats is None:
+                stats = self._stats[name] = [0, 0.0, 0.0, collections.Counter()]
+            stats[0] += 1
+            stats[1] += end - start
+            stats[2] += backend_time
+            if self._signatures:
+                stats[3][signature] += 1
+            if self._trace and len(self._events) < self._max_trace_events:
+                self._events.append(
+                    (name, start, end, backend_time, signature, threading.get_ident())
+                )
+
+    @property
+    def stats(self):
+        """
+        The calls recorded for each ivy function.
+
+        Returns
+        -------
+        ret
+            Dict from the name of each function called to a dict of its number of
+            ``calls``, its ``total_time``, ``backend_time`` and ``wrapper_time`` in
+            seconds, and the number of calls of each of its ``signatures``.
+        """
+        with self._lock:
+            return {
+                name: {
+                    "calls": calls,
+                    "total_time": total_time,
+                    "backend_time": backend_time,
+                    "wrapper_time": total_time - backend_time,
+                    "signatures": dict(signatures.most_common()),
+                }
+                for name, (calls, total_time, backend_time, signatures) in sorted(
+                    self._stats.items(), key=lambda item: -item[1][1]
+                )
+            }
+
+    def to_json(self, path=None):
+        """
+        Export the statistics of the calls as json.
+
+        Parameters
+        ----------
+        path
+            The file to write the json to. Default is ``None``, in which case the
+            json is only returned.
+
+        Returns
+        -------
+        ret
+            The json string of :attr:`stats`.
+        """
+        ret = json.dumps(self.stats, indent=2)
+        if path is not None:
+            with open(path, "w") as f:
+                f.write(ret)
+        return ret
+
+    def to_chrome_trace(self, path):
+        """
+        Export the calls recorded to a trace in the Chrome trace event format, which
+        can be opened with chrome://tracing or Perfetto. The profiler must have been
+        created with ``trace=True``.
+
+        Parameters
+        ----------
+        path
+            The file to write the trace to.
+        """
+        if not self._trace:
+            raise ivy.utils.exceptions.IvyException(
+                "the calls are only recorded for the trace with trace=True"
+            )
+        with open(path, "w") as f:
+            json.dump({"traceEvents": self._trace_events(), "displayTimeUnit": "ms"}, f)
+
+    def _trace_events(self):
+        # the calls recorded, as complete events timed from the start of the profiler
+        pid = os.getpid()
+        with self._lock:
+            return [
+                {
+                    "name": name,
+                    "cat": "ivy",
+                    "ph": "X",
+                    "ts": (start - self._start_time) * 1e6,
+                    "dur": (end - start) * 1e6,
+                    "pid": pid,
+                    "tid": tid,
+                    "args": {"backend_us": backend_time * 1e6, "signature": signature},
+                }
+                for name, start, end, backend_time, signature, tid in self._events
+            ]
@@ -2,6 +2,7 @@
 
 # global
 import io
+import json
 import multiprocessing
 import os
 import re
@@ -417,6 +418,22 @@ def test_profiler(*, backend_fw):
     # Should have content in folder
     assert len(os.listdir(fw_log_dir)) != 0, "Profiler did not log anything"
 
+    # the timeline of the ivy functions and of the live memory
+    timelines = [
+        os.path.join(root, "timeline.json")
+        for root, _, files in os.walk(fw_log_dir)
+        if "timeline.json" in files
+    ]
+    assert len(timelines) == 1, "Profiler did not save the timeline"
+    with open(timelines[0]) as f:
+        events = json.load(f)["traceEvents"]
+    assert "add" in [event["name"] for event in events if event["ph"] == "X"]
+    memory_events = [event for event in events if event["ph"] == "C"]
+    assert len(memory_events) >= 2
+    assert len(profiler.memory_samples) == len(memory_events)
+    for event in memory_events:
+        assert event["args"]["rss_mb"] > 0
+
     # Remove old content including the logging folder
     _empty_dir(fw_log_dir, False)
 
@@ -3,6 +3,10 @@
 # global
 import numpy as np
 import importlib
+import json
+import os
+import tempfile
+import weakref
 from hypothesis import strategies as st
 import typing
 
@@ -727,6 +731,43 @@ def test_promote_types(
     )
 
 
+# promote_types_of_inputs
+@handle_test(
+    fn_tree="functional.ivy.promote_types",  # dummy fn_tree
+    type1=helpers.get_dtypes("numeric", full=False),
+    type2=helpers.get_dtypes("numeric", full=False),
+)
+def test_promote_types_of_inputs(*, type1, type2):
+    x1 = ivy.native_array([1, 0], dtype=type1[0])
+    x2 = ivy.native_array([1, 0], dtype=type2[0])
+    # arrays of the same dtype are returned as they are
+    y1, y2 = ivy.promote_types_of_inputs(x1, x1)
+    assert y1 is x1 and y2 is x1
+
+    promoted = ivy.promote_types(type1[0], type2[0])
+    for _ in range(2):
+        # the second call reads the promoted dtype from the cache
+        y1, y2 = ivy.promote_types_of_inputs(x1, x2)
+        assert ivy.is_native_array(y1) and ivy.is_native_array(y2)
+        assert ivy.as_ivy_dtype(y1.dtype) == ivy.as_ivy_dtype(y2.dtype) == promoted
+
+    # python scalars take the dtype of the array, other than floats with integer
+    # arrays, and other than numbers with boolean arrays
+    for scalar in (True, 2, 2.5):
+        for args in ((x1, scalar), (scalar, x1)):
+            y1, y2 = ivy.promote_types_of_inputs(*args)
+            assert ivy.is_native_array(y1) and ivy.is_native_array(y2)
+            assert ivy.as_ivy_dtype(y1.dtype) == ivy.as_ivy_dtype(y2.dtype)
+            expected = ivy.as_ivy_dtype(x1.dtype)
+            if isinstance(scalar, float) and ivy.is_int_dtype(x1):
+                expected = ivy.promote_types(x1.dtype, "float64")
+            elif expected == "bool" and not isinstance(scalar, bool):
+                expected = ivy.promote_types(
+                    "bool", ivy.default_dtype(item=scalar, as_native=False)
+                )
+            assert ivy.as_ivy_dtype(y1.dtype) == expected
+
+
 # type_promote_arrays
 # TODO: fix container method
 @handle_test(
@@ -941,6 +982,43 @@ def test_function_unsupported_dtypes(*, func):
     assert set(tuple(exp)) == set(res)
 
 
+# function_support_table
+@handle_test(fn_tree="functional.ivy.function_unsupported_dtypes")  # dummy fn_tree
+def test_function_support_table():
+    data_type = importlib.import_module("ivy.functional.ivy.data_type")
+    table = data_type._generate_support_table(["acosh", "linear"])
+    assert table["backend"] == ivy.backend
+    assert set(table["functions"]) == {"acosh", "linear"}
+    entry = table["functions"]["linear"]
+    expected = ivy.function_unsupported_dtypes(ivy.linear)
+    assert set(entry["unsupported_dtypes"]) == set(str(x) for x in expected)
+    assert set(entry["supported_devices"]) == set(
+        ivy.function_supported_devices(ivy.linear)
+    )
+
+    attributes = ("_SUPPORT_TABLES_DIR", "_support_tables", "_support_cache")
+    saved = {attr: getattr(data_type, attr) for attr in attributes}
+    try:
+        with tempfile.TemporaryDirectory() as tables_dir:
+            data_type._SUPPORT_TABLES_DIR = tables_dir
+            path = os.path.join(tables_dir, "{}.json".format(ivy.backend))
+            # the functions in the table for the backend version are looked up in it
+            entry["unsupported_dtypes"] = ["float16"]
+            for version, result in [
+                (table["version"], ("float16",)),
+                ("0.0.0", expected),
+            ]:
+                with open(path, "w") as f:
+                    json.dump(dict(table, version=version), f)
+                data_type._support_tables = dict()
+                data_type._support_cache = weakref.WeakKeyDictionary()
+                res = ivy.function_unsupported_dtypes(ivy.linear)
+                assert set(res) == set(result)
+    finally:
+        for attr, value in saved.items():
+            setattr(data_type, attr, value)
+
+
 # function_dtype_versioning
 @handle_test(
     fn_tree="functional.ivy.function_unsupported_dtypes",  # dummy fn_tree
@@ -982,6 +982,56 @@ def test_cache_fn_with_args():
     assert ret0 is not ret1
 
 
+def test_cache_fn_eviction():
+    def func(x):
+        return x * 2
+
+    cached_fn = ivy.cache_fn(func, max_entries=2)
+    cached_fn(0)
+    cached_fn(1)
+    cached_fn(0)
+    # 1 is the least recently used output, and is evicted
+    cached_fn(2)
+    cached_fn(0)
+    info = cached_fn.cache_info()
+    assert info["entries"] == 2
+    assert info["evictions"] == 1
+    assert info["hits"] == 2 and info["misses"] == 3
+
+    cached_fn.cache_clear()
+    assert cached_fn.cache_info()["entries"] == 0
+
+
+def test_cache_fn_array_keys():
+    def func(x):
+        return ivy.random_uniform()
+
+    cached_fn = ivy.cache_fn(func)
+    x = ivy.arange(2000)
+    # arrays differing past the values shown in their truncated string
+    # representation have different keys
+    y = ivy.concat([ivy.arange(1999), ivy.array([0])])
+    assert cached_fn(x) is cached_fn(ivy.arange(2000))
+    assert cached_fn(x) is not cached_fn(y)
+    assert cached_fn(1) is not cached_fn(1.0)
+
+
+def test_cache_fn_limits():
+    def func(x):
+        return ivy.zeros((x,), dtype="float32")
+
+    cached_fn = ivy.cache_fn(func, max_bytes=64)
+    cached_fn(8)
+    cached_fn(8)
+    cached_fn(32)
+    info = cached_fn.cache_info()
+    # outputs larger than the whole cache are not cached
+    assert info["entries"] == 1 and info["nbytes"] == 32
+
+    cached_fn = ivy.cache_fn(func, ttl=0)
+    assert cached_fn(4) is not cached_fn(4)
+
+
 def test_framework_setting_with_threading():
     if ivy.current_backend_str() == "jax":
         # Numpy is the conflicting framework being tested against
@@ -2143,6 +2193,61 @@ def test_vmap(func, dtype_and_arrays_and_axes, in_axes_as_cont):
         assert False, "One of the results is None while other isn't"
 
 
+def test_vmap_traced():
+    x = ivy.native_array(np.random.uniform(size=(6, 3, 4)).astype("float32"))
+    y = ivy.native_array(np.random.uniform(size=(6, 4, 2)).astype("float32"))
+    v = ivy.native_array(np.random.uniform(size=(4,)).astype("float32"))
+
+    def _loop(func, *args, in_axes=0):
+        if not isinstance(in_axes, (list, tuple)):
+            in_axes = [in_axes] * len(args)
+        rets = [
+            func(*[a if ax is None else a[i] for a, ax in zip(args, in_axes)])
+            for i in range(6)
+        ]
+        return np.stack([ivy.to_numpy(ret) for ret in rets])
+
+    cases = [
+        (lambda a, b: ivy.add(ivy.sin(a), 1.0), (x, x), 0),
+        (ivy.matmul, (x, y), 0),
+        (lambda a: ivy.sum(a, axis=-1), (x,), 0),
+        (lambda a: ivy.max(ivy.mean(a, axis=0)), (x,), 0),
+        (ivy.matmul, (x, v), (0, None)),
+        # not covered by the batching rules, so the loop is used instead
+        (lambda a, b: ivy.vecdot(a, b), (x, x), 0),
+    ]
+    for func, args, in_axes in cases:
+        vmapped_func = ivy.vmap(func, in_axes=in_axes, out_axes=0)
+        expected = _loop(func, *args, in_axes=in_axes)
+        # the second call skips the trace when the first one failed
+        for _ in range(2):
+            ret = ivy.to_numpy(vmapped_func(*args))
+            assert ret.shape == expected.shape
+            assert np.allclose(ret, expected, rtol=1e-5, atol=1e-5)
+
+
+def test_vmap_escaped():
+    # operations converting the batched array to a plain one must not be traced
+    x = ivy.native_array(np.arange(12, dtype="float32").reshape(4, 3))
+    cases = [
+        (lambda a: ivy.sum(ivy.divide(a, 2.0)), [1.5, 6.0, 10.5, 15.0]),
+        (
+            lambda a: ivy.sum(ivy.add(a, ivy.native_array(np.asarray(a * 1.0)))),
+            [6.0, 24.0, 42.0, 60.0],
+        ),
+        (
+            lambda a: ivy.sum(ivy.native_array(np.asarray(a * 1.0))),
+            [3.0, 12.0, 21.0, 30.0],
+        ),
+    ]
+    for func, expected in cases:
+        vmapped_func = ivy.vmap(func)
+        # the outputs of the first call are not reused for other values
+        vmapped_func(ivy.zeros_like(x))
+        ret = ivy.to_numpy(vmapped_func(x))
+        assert np.allclose(ret, expected)
+
+
 @st.composite
 def _isin_data_generation_helper(draw):
     assume_unique = draw(st.booleans())
@@ -7,6 +7,7 @@ import numpy as np
 
 # local
 import ivy
+from ivy.data_classes.container import gradients as container_gradients
 from ivy.functional.ivy.gradients import _variable
 import ivy_tests.test_ivy.helpers as helpers
 from ivy_tests.test_ivy.helpers import handle_test
@@ -539,3 +540,72 @@ def test_lamb_update(
         decay_lambda=decay_lambda,
         stop_gradients=stop_gradients,
     )
+
+
+# multi-tensor updates
+@pytest.mark.parametrize(
+    "fn_name", ["gradient_descent_update", "lars_update", "adam_update", "lamb_update"]
+)
+@pytest.mark.parametrize("case", ["flat", "container_lr", "mismatched_dtypes"])
+def test_multi_tensor_update(fn_name, case, monkeypatch):
+    rng = np.random.default_rng(0)
+
+    def _container(scale):
+        # leaves of two dtypes, including a scalar and an empty one
+        return ivy.Container(
+            a=ivy.array(rng.uniform(-1, 1, (3, 4)).astype("float32") * scale),
+            b={
+                "c": ivy.array(rng.uniform(-1, 1, (5,)).astype("float32") * scale),
+                "d": ivy.array(rng.uniform(-1, 1, ()).astype("float64") * scale),
+                "e": ivy.zeros((0, 2)),
+            },
+        )
+
+    w, dcdw = _container(1.0), _container(0.1)
+    lr = 0.1
+    # the updates are only applied to flat buffers when the learning rate is a
+    # scalar and the leaves of all of the containers match, and leaf by leaf
+    # otherwise
+    if case == "container_lr":
+        lr = w.cont_map(lambda x, _: 0.1)
+    elif case == "mismatched_dtypes":
+        dcdw.b.c = dcdw.b.c.astype("float64")
+    args = [w, dcdw, lr]
+    kwargs = dict()
+    if fn_name in ["adam_update", "lamb_update"]:
+        args += [_container(0.01), _container(0.01) ** 2, 3]
+    if fn_name in ["lars_update", "lamb_update"]:
+        kwargs["decay_lambda"] = 0.1
+    assert (container_gradients._multi_tensor_columns(args[:2], lr) is not None) == (
+        case == "flat"
+    )
+    flat_updates = list()
+
+    def _multi_tensor_update(*update_args, **update_kwargs):
+        flat_updates.append(update_args)
+        return multi_tensor_update(*update_args, **update_kwargs)
+
+    multi_tensor_update = container_gradients._multi_tensor_update
+    monkeypatch.setattr(
+        container_gradients, "_multi_tensor_update", _multi_tensor_update
+    )
+    ret = getattr(ivy, fn_name)(*args, **kwargs)
+    assert len(flat_updates) == (1 if case == "flat" else 0)
+    monkeypatch.undo()
+    ret = getattr(ivy, fn_name)(*args, **kwargs)
+    for key_chain in w.cont_all_key_chains():
+        leaf_args = [
+            x.cont_at_key_chain(key_chain) if ivy.is_ivy_container(x) else x
+            for x in args
+        ]
+        expected = getattr(ivy, fn_name)(*leaf_args, **kwargs)
+        if fn_name in ["adam_update", "lamb_update"]:
+            leaves = [r.cont_at_key_chain(key_chain) for r in ret]
+        else:
+            leaves, expected = [ret.cont_at_key_chain(key_chain)], [expected]
+        for leaf, leaf_expected in zip(leaves, expected):
+            assert leaf.shape == leaf_expected.shape
+            assert leaf.dtype == leaf_expected.dtype
+            assert np.allclose(
+                ivy.to_numpy(leaf), ivy.to_numpy(leaf_expected), rtol=1e-5, atol=1e-6
+            )
@@ -1,9 +1,11 @@
 """Collection of tests for unified neural network layers."""
 
 # global
+import numpy as np
 from hypothesis import strategies as st, assume
 
 # local
+import ivy
 import ivy_tests.test_ivy.helpers as helpers
 from ivy_tests.test_ivy.helpers import handle_test
 from ivy.functional.ivy.layers import _deconv_length
@@ -846,6 +848,61 @@ def test_conv_general_transpose(
     )
 
 
+def _reference_conv(x, filters, strides, feature_group_count):
+    # VALID channel-last convolution summing over the kernel offsets one at a time
+    dims = filters.ndim - 2
+    out_shape = [
+        (x.shape[i + 1] - filters.shape[i]) // strides + 1 for i in range(dims)
+    ]
+    group_in = filters.shape[-2]
+    group_out = filters.shape[-1] // feature_group_count
+    res = np.zeros([x.shape[0], *out_shape, filters.shape[-1]], "float64")
+    for offset in np.ndindex(*filters.shape[:dims]):
+        window = x[
+            (slice(None),)
+            + tuple(
+                slice(k, k + (o - 1) * strides + 1, strides)
+                for k, o in zip(offset, out_shape)
+            )
+        ]
+        for g in range(feature_group_count):
+            res[..., g * group_out : (g + 1) * group_out] += np.tensordot(
+                window[..., g * group_in : (g + 1) * group_in],
+                filters[offset][:, g * group_out : (g + 1) * group_out],
+                1,
+            )
+    return res
+
+
+def test_conv_general_dilated_algorithms():
+    rng = np.random.default_rng(0)
+    cases = [
+        # input shape, filter shape, strides, feature group count
+        ((2, 9, 4), (3, 4, 6), 1, 1),
+        ((2, 8, 7, 4), (3, 3, 4, 6), 2, 1),
+        ((2, 8, 7, 4), (3, 3, 2, 6), 1, 2),
+        # depthwise, with a channel multiplier of 2
+        ((2, 8, 7, 3), (3, 3, 1, 6), 2, 3),
+        # large kernels with few channels
+        ((2, 20, 20, 2), (9, 9, 2, 3), 1, 1),
+        ((2, 6, 5, 7, 2), (3, 2, 3, 2, 4), 1, 1),
+    ]
+    for x_shape, filter_shape, strides, feature_group_count in cases:
+        x = rng.standard_normal(x_shape)
+        filters = rng.standard_normal(filter_shape)
+        ret = ivy.conv_general_dilated(
+            ivy.array(x),
+            ivy.array(filters),
+            strides,
+            "VALID",
+            dims=len(filter_shape) - 2,
+            feature_group_count=feature_group_count,
+        )
+        expected = _reference_conv(x, filters, strides, feature_group_count)
+        assert ret.shape == expected.shape
+        assert np.allclose(ivy.to_numpy(ret), expected, rtol=1e-4, atol=1e-4)
+
+
 # LSTM #
 # -----#
 
@@ -956,3 +1013,34 @@ def test_lstm_update(
         bias=bias,
         recurrent_bias=recurrent_bias,
     )
+
+
+def test_lstm_update_mask():
+    rng = np.random.default_rng(0)
+    x = ivy.array(rng.standard_normal((3, 6, 4)), dtype="float32")
+    init_h = ivy.array(rng.standard_normal((3, 5)), dtype="float32")
+    init_c = ivy.array(rng.standard_normal((3, 5)), dtype="float32")
+    kernel = ivy.array(rng.standard_normal((4, 20)), dtype="float32")
+    recurrent_kernel = ivy.array(rng.standard_normal((5, 20)), dtype="float32")
+    bias = ivy.array(rng.standard_normal((20,)), dtype="float32")
+    lengths = [6, 3, 1]
+    mask = ivy.arange(6) < ivy.expand_dims(ivy.array(lengths), axis=-1)
+    hts, ct = ivy.lstm_update(
+        x, init_h, init_c, kernel, recurrent_kernel, bias=bias, mask=mask
+    )
+    assert hts.shape == (3, 6, 5) and ct.shape == (3, 5)
+    for i, length in enumerate(lengths):
+        # a masked sequence matches the same sequence cut to its valid length
+        expected_hts, expected_ct = ivy.lstm_update(
+            x[i : i + 1, :length],
+            init_h[i : i + 1],
+            init_c[i : i + 1],
+            kernel,
+            recurrent_kernel,
+            bias=bias,
+        )
+        expected_hts = ivy.to_numpy(expected_hts[0])
+        assert np.allclose(ivy.to_numpy(hts[i, :length]), expected_hts, atol=1e-5)
+        # the outputs of the masked timesteps repeat the last valid output
+        assert np.allclose(ivy.to_numpy(hts[i, length:]), expected_hts[-1], atol=1e-5)
+        assert np.allclose(ivy.to_numpy(ct[i]), ivy.to_numpy(expected_ct[0]), atol=1e-5)
@@ -70,6 +70,27 @@ def test_array_function():
     assert all(y1 == ivy.array([1, 1]))
 
 
+def test_array_lazy_metadata():
+    x = ivy.array([[1.0, 2.0], [3.0, 4.0]], dtype="float32")
+    # the metadata is only computed on first access
+    assert x._dtype is None and x._size is None and x._dev_str is None
+    assert x.dtype == ivy.float32
+    assert x.size == 4
+    assert x.itemsize == 4
+    assert x.device == ivy.dev(x.data)
+    assert x._dtype is not None and x._size == 4
+    assert repr(x).startswith("ivy.array([[1., 2.],")
+    # in-place updates reset the cached dtype
+    x[0, 0] = 5
+    assert x.dtype == ivy.float32
+    assert float(x[0, 0]) == 5.0
+    # the slotted attributes survive pickling
+    y = x.__class__.__new__(x.__class__)
+    y.__setstate__(x.__getstate__())
+    assert y.dtype == ivy.float32
+    assert np.allclose(ivy.to_numpy(y), ivy.to_numpy(x))
+
+
 # TODO: avoid using dummy fn_tree in property tests
 
 
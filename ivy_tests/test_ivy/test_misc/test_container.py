@@ -1296,6 +1296,51 @@ def test_container_set_at_key_chains(on_device):
     assert np.allclose(ivy.to_numpy(new_container["b"]["d"]), np.array([3]))
 
 
+def test_container_key_chain_index(on_device):
+    container = Container(
+        {
+            "a": ivy.array([1], device=on_device),
+            "b": {
+                "c": ivy.array([2], device=on_device),
+                "d": {"e": ivy.array([3], device=on_device)},
+            },
+        }
+    )
+    # the batched queries index the key chains once, which later queries reuse
+    sub_container = container.cont_at_key_chains(["a", "b/d/e", "b.c"])
+    assert list(sub_container.cont_to_iterator_keys()) == ["a", "b/c", "b/d/e"]
+    assert np.allclose(ivy.to_numpy(container["b/d/e"]), np.array([3]))
+
+    # the index is dropped once a sub-container is modified
+    container.b.d.e = ivy.array([4], device=on_device)
+    assert np.allclose(ivy.to_numpy(container["b/d/e"]), np.array([4]))
+    container.cont_at_key_chains(["a"])
+    container["b/d"] = ivy.array([5], device=on_device)
+    assert np.allclose(ivy.to_numpy(container["b/d"]), np.array([5]))
+    assert container.cont_all_key_chains() == ["a", "b/c", "b/d"]
+
+    # leaves are replaced in place, and new key chains are added key by key
+    target = {
+        "a": ivy.array([6], device=on_device),
+        "f/g": ivy.array([7], device=on_device),
+    }
+    container.cont_set_at_key_chains(target, inplace=True)
+    assert np.allclose(ivy.to_numpy(container["a"]), np.array([6]))
+    assert np.allclose(ivy.to_numpy(container["f/g"]), np.array([7]))
+    assert container.cont_all_key_chains() == ["a", "b/c", "b/d", "f/g"]
+    # leaves can be added to existing sub-containers, but not to missing ones
+    target = {"b": {"h": ivy.array([8], device=on_device)}}
+    container.cont_set_at_key_chains(target, inplace=True)
+    assert container.cont_all_key_chains() == ["a", "b/c", "b/d", "b/h", "f/g"]
+    with pytest.raises(KeyError):
+        container.cont_set_at_key_chains({"n": {"m": ivy.array([9])}}, inplace=True)
+    assert "n" not in container
+
+    # pruning the leaves of a sub-container prunes the sub-container
+    pruned = container.cont_prune_key_chains(["b/c", "b/d", "b/h", "f/g"])
+    assert list(pruned.cont_to_iterator_keys()) == ["a"]
+
+
 def test_container_overwrite_at_key_chains(on_device):
     container = Container(
         {
@@ -1900,6 +1945,46 @@ def test_container_from_flat_list(on_device):
     assert np.allclose(ivy.to_numpy(container.b.d), np.array([6]))
 
 
+def test_container_structure_cache(on_device):
+    container = Container(
+        {
+            "a": ivy.array([1], device=on_device),
+            "b": {"c": ivy.array([2], device=on_device), "d": {}},
+        }
+    )
+    assert container.cont_all_key_chains() == ["a", "b/c"]
+    mapped = container.cont_map(lambda x, _: x + 1)
+    assert list(mapped.b.keys()) == ["c", "d"]
+    assert mapped.cont_all_key_chains() == ["a", "b/c"]
+    added = container + mapped
+    assert np.allclose(ivy.to_numpy(added.b.c), np.array([5]))
+    # empty sub-containers are dropped when mapping several containers
+    assert "d" not in added.b
+    # each node of the mapped container has its own config
+    assert mapped.cont_config is not mapped.b.cont_config
+    mapped.b.cont_with_ivy_backend("numpy", inplace=True)
+    assert mapped.b.cont_config["ivyh"] == "numpy"
+    assert mapped.cont_config["ivyh"] is None
+
+    # modifying any sub-container drops the cached structure of its parents
+    container.b.e = ivy.array([3], device=on_device)
+    assert container.cont_all_key_chains() == ["a", "b/c", "b/e"]
+    del container.b["c"]
+    assert container.cont_all_key_chains() == ["a", "b/e"]
+    container.b.pop("e")
+    container.b.update(f=ivy.array([4], device=on_device))
+    assert container.cont_all_key_chains() == ["a", "b/f"]
+    assert np.allclose(ivy.to_numpy(container.cont_to_flat_list()[1]), np.array([4]))
+
+    # keys added after construction are still sorted in the mapped containers
+    container.b["0"] = ivy.array([5], device=on_device)
+    assert list(container.b.keys()) == ["d", "f", "0"]
+    assert list(container.cont_map(lambda x, _: x).b.keys()) == ["0", "d", "f"]
+    flat_list = [1, 2, 3, 4]
+    rebuilt = container.cont_from_flat_list(flat_list)
+    assert rebuilt.cont_to_flat_list() == [1, 3, 2] and flat_list == [4]
+
+
 @pytest.mark.parametrize("inplace", [True, False])
 def test_container_map(inplace, on_device):
     # without key_chains specification
@@ -2049,6 +2134,45 @@ def test_container_map_sub_conts(inplace, on_device):
     assert np.array_equal(ivy.to_numpy(container_mapped.b.e), np.array([4]))
 
 
+def test_container_multi_map_in_function(on_device):
+    container0 = Container(
+        {
+            "a": ivy.array([1.0, 2.0], device=on_device),
+            "b": {
+                "c": ivy.array([3.0, 4.0], device=on_device),
+                "d": ivy.array([[5.0], [6.0]], device=on_device),
+            },
+        }
+    )
+    container1 = container0 * 2
+
+    # containers within nested arguments
+    concatenated = ivy.concat([container0, container1], axis=0)
+    assert np.allclose(ivy.to_numpy(concatenated.a), np.array([1, 2, 2, 4]))
+    assert concatenated.b.d.shape == (4, 1)
+
+    # leaves with the same shape and dtype are mapped with a single call
+    calls = []
+
+    def _add(x1, x2):
+        calls.append(x1.shape)
+        return ivy.add(x1, x2)
+
+    for stack_leaves in (True, False):
+        calls.clear()
+        added = Container.cont_multi_map_in_function(
+            _add, container0, container1, stack_leaves=stack_leaves
+        )
+        assert np.allclose(ivy.to_numpy(added.a), np.array([3, 6]))
+        assert np.allclose(ivy.to_numpy(added.b.c), np.array([9, 12]))
+        assert np.allclose(ivy.to_numpy(added.b.d), np.array([[15], [18]]))
+        assert len(calls) == (2 if stack_leaves else 3)
+
+    # functions which do not keep the leading axis are applied to each leaf
+    summed = Container.cont_multi_map_in_function("sum", container0, stack_leaves=True)
+    assert np.allclose(ivy.to_numpy(summed.b.c), np.array(7))
+
+
 def test_container_multi_map(on_device):
     # without key_chains specification
     container0 = Container(
@@ -2287,6 +2411,44 @@ def test_container_identical_structure(on_device):
     )
 
 
+def test_container_structure_signature(on_device):
+    container0 = Container(
+        {
+            "a": ivy.array([1], device=on_device),
+            "b": {"c": ivy.array([2], device=on_device), "d": "d"},
+        }
+    )
+    container1 = Container(
+        {
+            "a": ivy.array([3], device=on_device),
+            "b": {"c": ivy.array([4], device=on_device), "d": "e"},
+        }
+    )
+    # containers with the same structure share the same signature
+    assert ivy.Container.cont_identical_structure([container0, container1])
+    ivy.Container.cont_assert_identical_structure([container0, container1])
+    assert not ivy.Container.cont_structural_diff(
+        container0, container1, mode="diff_only"
+    )
+
+    # modifying a sub-container drops the signatures of the containers holding it
+    container1.b.c = ivy.array([4, 5], device=on_device)
+    assert not ivy.Container.cont_identical_structure([container0, container1])
+    with pytest.raises(IvyException):
+        ivy.Container.cont_assert_identical_structure([container0, container1])
+    diff = ivy.Container.cont_structural_diff(container0, container1, mode="diff_only")
+    assert list(diff.cont_to_iterator_keys()) == ["b/c/diff_0", "b/c/diff_1"]
+
+    # containers with different signatures may still be identical in structure
+    container1.b.c = ivy.array([4.0], device=on_device)
+    assert ivy.Container.cont_identical_structure([container0, container1])
+    container2 = Container(
+        {"b": container0.b, "a": ivy.array([1], device=on_device)},
+        alphabetical_keys=False,
+    )
+    assert ivy.Container.cont_identical_structure([container0, container2])
+
+
 def test_container_identical_configs(on_device):
     container0 = Container({"a": ivy.array([1], device=on_device)}, print_limit=5)
     container1 = Container({"a": ivy.array([1], device=on_device)}, print_limit=5)
@@ -2580,6 +2742,102 @@ def test_container_to_disk_shuffle_and_from_disk_as_hdf5(on_device):
     os.remove(save_filepath)
 
 
+def test_container_hdf5_lazy_and_batched_loading(on_device):
+    if ivy.current_backend_str() == "tensorflow":
+        # container disk saving requires eager execution
+        pytest.skip()
+    save_filepath = "container_on_disk.hdf5"
+    x = np.arange(60, dtype=np.float32).reshape((10, 3, 2))
+    y = np.arange(10, dtype=np.int32)
+    container = Container(
+        {
+            "a": ivy.array(x, device=on_device),
+            "b": {"c": ivy.array(y, device=on_device)},
+        }
+    )
+
+    # saving contiguously, and loading through a memory map
+    container.cont_to_disk_as_hdf5(save_filepath, chunks=False)
+    loaded_container = Container.cont_from_disk_as_hdf5(save_filepath, mmap=True)
+    assert np.array_equal(ivy.to_numpy(loaded_container.a), x)
+    assert np.array_equal(ivy.to_numpy(loaded_container.b.c), y)
+    # contiguous datasets have a fixed size, so they can be overwritten but not
+    # appended to
+    container.cont_to_disk_as_hdf5(save_filepath)
+    with pytest.raises(ivy.utils.exceptions.IvyException):
+        container.cont_to_disk_as_hdf5(save_filepath, starting_index=3)
+
+    # lazy loading of a slice
+    lazy_container = Container.cont_from_disk_as_hdf5(
+        save_filepath, slice(2, 9), lazy=True
+    )
+    assert lazy_container.a.shape == (7, 3, 2)
+    for query in [1, -1, slice(None, None, -2), slice(4, 2), (Ellipsis, 1), [0, 3]]:
+        assert np.array_equal(ivy.to_numpy(lazy_container.a[query]), x[2:9][query])
+    assert np.array_equal(np.asarray(lazy_container.b.c), y[2:9])
+
+    # iterating over batches
+    batches = list(Container.cont_batches_from_disk_as_hdf5(save_filepath, 4))
+    assert [len(batch.b.c) for batch in batches] == [4, 4, 2]
+    assert np.array_equal(ivy.to_numpy(batches[1].a), x[4:8])
+    assert np.array_equal(ivy.to_numpy(batches[2].b.c), y[8:])
+    os.remove(save_filepath)
+
+    # appending compressed batches with the chunk shapes of each leaf
+    chunks = Container({"a": (4, 3, 2), "b": {"c": True}})
+    for i in range(3):
+        container.cont_to_disk_as_hdf5(
+            save_filepath, starting_index=i * 10, chunks=chunks, compression="gzip"
+        )
+    loaded_container = Container.cont_from_disk_as_hdf5(save_filepath)
+    assert np.array_equal(ivy.to_numpy(loaded_container.a), np.concatenate([x] * 3))
+    assert np.array_equal(ivy.to_numpy(loaded_container.b.c), np.concatenate([y] * 3))
+    os.remove(save_filepath)
+
+
+def test_container_to_and_from_disk_as_safetensors(on_device):
+    if ivy.current_backend_str() == "tensorflow":
+        # container disk saving requires eager execution
+        pytest.skip()
+    save_filepath = "container_on_disk.safetensors"
+    container = Container(
+        {
+            "a": ivy.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]], device=on_device),
+            "b": {
+                "c": ivy.array([True, False, True], device=on_device),
+                "d": ivy.array(3, dtype="int64", device=on_device),
+                "e": ivy.zeros((0, 2), device=on_device),
+            },
+            "bc": ivy.ones((2,), dtype="float16", device=on_device),
+        }
+    )
+
+    # saving
+    container.cont_to_disk_as_safetensors(save_filepath, metadata={"step": 3})
+    assert os.path.exists(save_filepath)
+
+    # loading through a memory map, and into memory
+    for mmap in [True, False]:
+        loaded_container = Container.cont_from_disk_as_safetensors(
+            save_filepath, mmap=mmap
+        )
+        assert loaded_container.cont_all_key_chains() == container.cont_all_key_chains()
+        for key_chain, value in container.cont_to_iterator():
+            loaded_value = loaded_container.cont_at_key_chain(key_chain)
+            assert loaded_value.dtype == value.dtype
+            assert np.array_equal(ivy.to_numpy(loaded_value), ivy.to_numpy(value))
+
+    # loading by key-chain prefixes
+    loaded_container = Container.cont_from_disk_as_safetensors(save_filepath, "b")
+    assert loaded_container.cont_all_key_chains() == ["b/c", "b/d", "b/e"]
+    loaded_container = Container.cont_from_disk_as_safetensors(
+        save_filepath, ["a", "b/d"]
+    )
+    assert loaded_container.cont_all_key_chains() == ["a", "b/d"]
+
+    os.remove(save_filepath)
+
+
 def test_container_pickle(on_device):
     dict_in = {
         "a": ivy.array([np.float32(1.0)], device=on_device),
@@ -2763,6 +3021,97 @@ def test_jax_pytree_compatibility(on_device):
         assert np.array_equal(ivy.to_numpy(cont_values[i]), ivy.to_numpy(true_val))
 
 
+def _prefetcher_load_fn(i):
+    if i == 5:
+        raise StopIteration
+    return {"a": np.full((2, 3), i, dtype=np.float32), "b": {"c": np.arange(i, i + 2)}}
+
+
+@pytest.mark.parametrize(
+    ("num_workers", "use_processes", "use_shared_memory"),
+    [(1, False, False), (3, False, False), (2, True, True)],
+)
+def test_container_prefetcher(num_workers, use_processes, use_shared_memory):
+    if use_processes and ivy.current_backend_str() != "numpy":
+        # the other frameworks may not support forked subprocesses
+        pytest.skip()
+    with ivy.ContainerPrefetcher(
+        _prefetcher_load_fn,
+        num_workers=num_workers,
+        buffer_size=3,
+        use_processes=use_processes,
+        use_shared_memory=use_shared_memory,
+    ) as prefetcher:
+        batches = list(prefetcher)
+    assert len(batches) == 5
+    for i, batch in enumerate(batches):
+        assert isinstance(batch, Container)
+        assert np.array_equal(ivy.to_numpy(batch.a), np.full((2, 3), i))
+        assert np.array_equal(ivy.to_numpy(batch.b.c), np.arange(i, i + 2))
+    stats = prefetcher.stats
+    assert stats["batches"] == 5
+    assert stats["batches_per_second"] > 0
+    assert stats["stall_time"] >= 0 and stats["load_time"] >= 0
+
+    # errors raised by the loading function are raised when reaching the batch
+    def _load_fn(i):
+        if i == 1:
+            raise ValueError
+        return {"a": np.full((2,), i)}
+
+    prefetcher = ivy.ContainerPrefetcher(_load_fn, num_batches=3)
+    assert np.array_equal(ivy.to_numpy(next(prefetcher).a), np.full((2,), 0))
+    with pytest.raises(ValueError):
+        next(prefetcher)
+    assert np.array_equal(ivy.to_numpy(next(prefetcher).a), np.full((2,), 2))
+    prefetcher.close()
+
+
+def test_container_shared_memory(on_device):
+    container = Container(
+        a=ivy.array([1.0, 2.0], device=on_device),
+        b={"c": ivy.array([[3, 4, 5]], device=on_device), "d": "d"},
+        e=3,
+    )
+    # only the header of the shared memory block is pickled
+    handle = pickle.loads(pickle.dumps(ivy.to_shared_memory(container)))
+    assert handle.nbytes >= 2 * 4 + 3 * 4
+    assert len(pickle.dumps(handle)) < 1024
+    loaded = ivy.from_shared_memory(handle)
+    assert isinstance(loaded, Container)
+    assert list(loaded.cont_to_iterator_keys()) == ["a", "b/c", "b/d", "e"]
+    assert np.allclose(ivy.to_numpy(loaded.a), np.array([1.0, 2.0]))
+    assert np.array_equal(ivy.to_numpy(loaded.b.c), np.array([[3, 4, 5]]))
+    assert loaded.b.d == "d" and loaded.e == 3
+
+    # handles can be read more than once without unlinking the block
+    handle = ivy.to_shared_memory(ivy.arange(6, device=on_device))
+    x = ivy.from_shared_memory(handle, unlink=False)
+    y = ivy.from_shared_memory(handle, copy=True)
+    assert np.array_equal(ivy.to_numpy(x), np.arange(6))
+    assert np.array_equal(ivy.to_numpy(y), np.arange(6))
+    handle.free()
+    with pytest.raises(FileNotFoundError):
+        ivy.from_shared_memory(handle)
+
+
+def test_container_queue_cache_size(on_device):
+    queues = list()
+    for i in range(3):
+        q = queue.Queue()
+        q.put({"a": [ivy.array([float(i)], device=on_device)]})
+        queues.append(q)
+    container = Container(
+        queues=queues,
+        queue_load_sizes=[1, 1, 1],
+        queue_timeout=0.25,
+        queue_cache_size=1,
+    )
+    for i in range(3):
+        assert np.allclose(ivy.to_numpy(container[i].a), np.array([float(i)]))
+        assert list(container._loaded_containers_from_queues) == [i]
+
+
 @pytest.mark.skip("Prevents PyTest from Terminating.")
 def test_container_from_queues(on_device):
     if "gpu" in on_device:
@@ -0,0 +1,56 @@
+# global
+import asyncio
+import threading
+
+# local
+import ivy
+from ivy.utils.context import ContextStack
+
+
+def test_context_stack():
+    stack = ContextStack("test_stack")
+    assert not stack and stack == []
+    stack.append("float32")
+    stack.append("float64")
+    assert len(stack) == 2 and stack[-1] == "float64"
+    assert stack == ["float32", "float64"]
+    assert stack.pop(-1) == "float64"
+    assert list(stack) == ["float32"]
+    stack.clear()
+    assert stack == []
+
+
+def test_context_stack_threads():
+    ivy.set_default_float_dtype("float16")
+    seen = dict()
+
+    def _worker(name, dtype):
+        ivy.set_default_float_dtype(dtype)
+        seen[name] = ivy.default_float_dtype()
+        ivy.unset_default_float_dtype()
+
+    threads = [
+        threading.Thread(target=_worker, args=(name, dtype))
+        for name, dtype in (("a", "float32"), ("b", "float64"))
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert seen == {"a": "float32", "b": "float64"}
+    # the settings of the threads do not leak into the main thread
+    assert ivy.default_float_dtype() == "float16"
+    ivy.unset_default_float_dtype()
+
+
+def test_context_stack_tasks():
+    async def _task(mode):
+        ivy.set_nestable_mode(mode)
+        await asyncio.sleep(0)
+        return ivy.get_nestable_mode()
+
+    async def _main():
+        return await asyncio.gather(_task(True), _task(False))
+
+    assert asyncio.run(_main()) == [True, False]
+    assert ivy.get_nestable_mode() is True
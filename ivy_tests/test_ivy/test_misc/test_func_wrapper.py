@@ -145,3 +145,172 @@ def test_views(array_to_update):
     assert np.allclose(c, c_copy + 1)
     assert np.allclose(d, d_copy + 1)
     assert np.allclose(e[0], e_copy + 1)
+
+
+@pytest.mark.parametrize(
+    ("fn_name", "args", "kwargs"),
+    [
+        ("add", ([1.0, 2.0], [3.0, 4.0]), {}),
+        ("add", ([1.0, 2.0], 3.0), {"alpha": 2}),
+        ("matmul", ([[1.0, 2.0], [3.0, 4.0]], [[1.0], [2.0]]), {}),
+        ("sum", ([[1.0, 2.0], [3.0, 4.0]],), {"axis": 0, "keepdims": True}),
+    ],
+)
+def test_dispatch_cache(fn_name, args, kwargs):
+    fn = ivy.__dict__[fn_name]
+    args = [ivy.array(arg) if isinstance(arg, list) else arg for arg in args]
+    ivy.set_dispatch_cache_mode(False)
+    expected = fn(*args, **kwargs)
+    ivy.unset_dispatch_cache_mode()
+    ivy.clear_dispatch_cache()
+    for _ in range(2):
+        ret = fn(*args, **kwargs)
+        assert isinstance(ret, ivy.Array)
+        assert np.allclose(ivy.to_numpy(ret), ivy.to_numpy(expected))
+    assert hasattr(fn, "dispatch_plans")
+    assert len(fn.dispatch_plans) == 1
+    assert all(plan is not None for plan in fn.dispatch_plans.values())
+
+
+def test_dispatch_cache_fallback():
+    x = ivy.array([1.0, 2.0])
+    ivy.clear_dispatch_cache()
+    cont = ivy.Container(a=x)
+    ret = ivy.add(x, cont)
+    assert isinstance(ret, ivy.Container)
+    assert hasattr(ivy.add, "dispatch_plans")
+    # containers can't be dispatched through a collapsed plan
+    signature = ivy.func_wrapper._dispatch_signature((x, cont), {})
+    assert ivy.add.dispatch_plans[signature] is None
+    out = ivy.zeros_like(x)
+    ret = ivy.add(x, x, out=out)
+    assert ret is out
+    assert np.allclose(ivy.to_numpy(out), [2.0, 4.0])
+
+
+def test_dispatch_cache_array_mode():
+    x = ivy.array([1.0, 2.0])
+    ivy.clear_dispatch_cache()
+    assert isinstance(ivy.add(x, x), ivy.Array)
+    # the cached plan must still respect the array mode set after it was built
+    ivy.set_array_mode(False)
+    try:
+        ret = ivy.add(x.data, x.data)
+        assert ivy.is_native_array(ret)
+    finally:
+        ivy.unset_array_mode()
+    assert isinstance(ivy.add(x, x), ivy.Array)
+
+
+@pytest.mark.parametrize("fn_name", ["sort", "add"])
+def test_dispatch_cache_out(fn_name):
+    fn = ivy.__dict__[fn_name]
+    x = ivy.array([3.0, 1.0, 2.0])
+    args = (x,) if fn_name == "sort" else (x, x)
+    ivy.set_dispatch_cache_mode(False)
+    expected = fn(*args)
+    ivy.unset_dispatch_cache_mode()
+    ivy.clear_dispatch_cache()
+    for _ in range(2):
+        out = ivy.zeros_like(x)
+        ret = fn(*args, out=out)
+        assert ret is out
+        assert np.allclose(ivy.to_numpy(out), ivy.to_numpy(expected))
+    assert all(plan is not None for plan in fn.dispatch_plans.values())
+
+
+def test_raw_mode():
+    x = ivy.native_array([1.0, 2.0])
+    with ivy.RawMode():
+        assert ivy.get_raw_mode()
+        ret = ivy.add(x, x)
+        # native inputs skip the ivy.Array conversion of the outputs
+        assert ivy.is_native_array(ret)
+        # ivy arrays still go through the wrapped path
+        assert isinstance(ivy.add(ivy.array(x), x), ivy.Array)
+    assert not ivy.get_raw_mode()
+    assert isinstance(ivy.add(x, x), ivy.Array)
+
+
+def test_raw_mode_creation():
+    x = ivy.native_array([1.0, 2.0, 3.0])
+    with ivy.RawMode():
+        # no native array inputs, so the full wrapping infers dtype and device
+        assert isinstance(ivy.zeros((2,)), ivy.Array)
+        assert isinstance(ivy.arange(3), ivy.Array)
+        # dtype and device are still inferred on the raw path
+        ret = ivy.ones_like(x)
+        assert ivy.is_native_array(ret)
+        assert np.allclose(ivy.to_numpy(ret), [1.0, 1.0, 1.0])
+
+
+def test_raw_mode_sequences():
+    x = ivy.native_array([1.0, 2.0])
+    with ivy.RawMode():
+        # ivy arrays inside sequences are converted by the wrapped path
+        ret = ivy.concat([ivy.array(x), ivy.array(x)])
+        assert isinstance(ret, ivy.Array)
+        assert ret.shape == (4,)
+        ret = ivy.stack([x, x])
+        assert ivy.is_native_array(ret)
+        assert ret.shape == (2, 2)
+
+
+def _fn8(x, y=None):
+    return x * 2
+
+
+@pytest.mark.parametrize(
+    ("check", "x", "y", "raises"),
+    [
+        ("inputs", [1.0, float("nan")], None, True),
+        ("inputs", [1.0, 2.0], {"a": [float("nan")]}, True),
+        ("inputs", [1.0, 2.0], float("nan"), True),
+        ("inputs", [1.0, 2.0], [1, 2], False),
+        ("outputs", [1.0, float("nan")], None, True),
+        ("outputs", [1.0, 2.0], {"a": [float("nan")]}, False),
+        ("all", [1.0, 2.0], {"a": [float("nan")]}, True),
+    ],
+)
+def test_handle_nans(check, x, y, raises):
+    fn = ivy.handle_nans(_fn8)
+    x = ivy.native_array(x)
+    if isinstance(y, dict):
+        y = ivy.Container({k: ivy.array(v) for k, v in y.items()})
+    elif isinstance(y, list):
+        y = ivy.native_array(y)
+    ivy.set_nan_policy("raise_exception", check=check)
+    try:
+        if raises:
+            with pytest.raises(ivy.utils.exceptions.IvyException):
+                fn(x, y=y)
+        else:
+            fn(x, y=y)
+    finally:
+        ivy.unset_nan_policy()
+    # nothing is checked with the default policy
+    assert ivy.get_nan_policy() == "nothing"
+    fn(x, y=y)
+
+
+def test_handle_nans_sampled():
+    fn = ivy.handle_nans(_fn8)
+    x = ivy.native_array([float("nan")])
+    ivy.set_nan_policy("raise_exception", sample_every=3)
+    try:
+        raised = list()
+        for _ in range(6):
+            try:
+                fn(x)
+                raised.append(False)
+            except ivy.utils.exceptions.IvyException:
+                raised.append(True)
+        assert raised == [True, False, False, True, False, False]
+    finally:
+        ivy.unset_nan_policy()
+    with pytest.raises(ivy.utils.exceptions.IvyException):
+        ivy.set_nan_policy("warns", sample_rate=0)
+    # the warn level can still be passed by keyword
+    ivy.set_nan_policy(warn_level="warns")
+    assert ivy.get_nan_policy() == "warns"
+    ivy.unset_nan_policy()
@@ -0,0 +1,64 @@
+# global
+import json
+import os
+import tempfile
+
+import pytest
+
+# local
+import ivy
+from ivy.utils.profiler import FunctionProfiler
+
+
+def test_function_profiler():
+    x = ivy.array([1.0, 2.0, 3.0])
+    y = ivy.native_array([[1.0], [2.0]])
+    ivy.add(x, x)
+    with FunctionProfiler() as profiler:
+        ivy.add(x, x)
+        ivy.add(x, 1.0)
+        ivy.add(y, y)
+        with ivy.RawMode():
+            ivy.add(y, y)
+    # calls outside of the profiler are not recorded
+    ivy.add(x, x)
+    stats = profiler.stats
+    assert stats["add"]["calls"] == 4
+    assert stats["add"]["signatures"] == {
+        "{}[2, 1], {}[2, 1]".format(y.dtype, y.dtype): 2,
+        "{}[3], {}[3]".format(x.data.dtype, x.data.dtype): 1,
+        "{}[3], float".format(x.data.dtype): 1,
+    }
+    for name in ("total_time", "backend_time", "wrapper_time"):
+        assert stats["add"][name] >= 0
+    assert stats["add"]["total_time"] >= stats["add"]["backend_time"]
+    assert json.loads(profiler.to_json())["add"]["calls"] == 4
+    with pytest.raises(ivy.utils.exceptions.IvyException):
+        profiler.to_chrome_trace("trace.json")
+
+    profiler.reset()
+    assert profiler.stats == dict()
+
+
+def test_function_profiler_trace():
+    x = ivy.array([1.0, 2.0, 3.0])
+    with FunctionProfiler(signatures=False, trace=True) as profiler:
+        ivy.mean(ivy.multiply(x, x))
+    assert profiler.stats["multiply"]["signatures"] == dict()
+    # the decorators applied while instrumenting the functions are not recorded
+    assert not any(name in ivy.func_wrapper.FN_DECORATORS for name in profiler.stats)
+    with tempfile.TemporaryDirectory() as trace_dir:
+        path = os.path.join(trace_dir, "trace.json")
+        profiler.to_chrome_trace(path)
+        with open(path) as f:
+            events = json.load(f)["traceEvents"]
+    names = [event["name"] for event in events]
+    assert "multiply" in names and "mean" in names
+    for event in events:
+        assert event["ph"] == "X" and event["dur"] >= 0
+        assert event["args"]["backend_us"] <= event["dur"]
+
+    # only one profiler can run at a time
+    with FunctionProfiler():
+        with pytest.raises(ivy.utils.exceptions.IvyException):
+            FunctionProfiler().start()
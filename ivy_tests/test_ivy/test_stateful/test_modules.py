@@ -220,6 +220,28 @@ def test_module_w_partial_v(batch_shape, input_channels, output_channels, on_dev
     module(x)
 
 
+# module weights saving and loading
+def test_module_save_and_load_weights(tmp_path, on_device):
+    module = TrainableModule(4, 5, device=on_device)
+    weights_path = str(tmp_path / "weights.safetensors")
+    module.save_weights(weights_path)
+
+    # partial loading
+    loaded_module = TrainableModule(4, 5, device=on_device)
+    v = loaded_module.v.cont_copy()
+    loaded_module.load_weights(weights_path, prefixes="linear1")
+    for key_chain, value in loaded_module.v.cont_to_iterator():
+        expected = module.v if key_chain.startswith("linear1/") else v
+        assert np.array_equal(
+            ivy.to_numpy(value), ivy.to_numpy(expected.cont_at_key_chain(key_chain))
+        )
+
+    # loading all of the weights
+    loaded_module.load_weights(weights_path)
+    x = ivy.random_uniform(shape=(2, 4), device=on_device)
+    assert np.allclose(ivy.to_numpy(loaded_module(x)), ivy.to_numpy(module(x)))
+
+
 class ModuleWithNoneAttribute(ivy.Module):
     def __init__(self, device=None, hidden_size=64):
         self.some_attribute = None
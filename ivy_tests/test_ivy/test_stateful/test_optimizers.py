@@ -3,8 +3,11 @@
 
 # global
 from hypothesis import strategies as st
+import pytest
+import numpy as np
 
 # local
+import ivy
 import ivy_tests.test_ivy.helpers as helpers
 from ivy_tests.test_ivy.helpers import handle_method
 from ivy_tests.test_ivy.test_functional.test_core.test_gradients import (
@@ -244,3 +247,66 @@ def test_lamb_optimizer(
         xs_grad_idxs=xs_grad_idxs,
         on_device=on_device,
     )
+
+
+# flat moments
+@pytest.mark.parametrize("optimizer_name", ["Adam", "LAMB"])
+def test_optimizer_flat_moments(optimizer_name):
+    rng = np.random.default_rng(0)
+
+    def _container(scale):
+        # leaves of two dtypes, including a scalar
+        return ivy.Container(
+            a=ivy.array(rng.uniform(-1, 1, (3, 4)).astype("float32") * scale),
+            b={
+                "c": ivy.array(rng.uniform(-1, 1, (5,)).astype("float32") * scale),
+                "d": ivy.array(rng.uniform(-1, 1, ()).astype("float64") * scale),
+            },
+        )
+
+    def _assert_allclose(x, y):
+        for key_chain, leaf in x.cont_to_iterator():
+            expected = y.cont_at_key_chain(key_chain)
+            assert leaf.shape == expected.shape
+            assert leaf.dtype == expected.dtype
+            assert np.allclose(
+                ivy.to_numpy(leaf), ivy.to_numpy(expected), rtol=1e-5, atol=1e-6
+            )
+
+    fn = ivy.adam_update if optimizer_name == "Adam" else ivy.lamb_update
+    optimizer = getattr(ivy, optimizer_name)(lr=0.1)
+    v = expected_v = _container(1.0)
+    for step in range(1, 4):
+        grads = _container(0.1)
+        if step == 1:
+            mw, vw = grads, grads**2
+        v = optimizer.step(v, grads)
+        rets = {
+            key_chain: fn(
+                w,
+                grads.cont_at_key_chain(key_chain),
+                0.1,
+                mw.cont_at_key_chain(key_chain),
+                vw.cont_at_key_chain(key_chain),
+                step,
+            )
+            for key_chain, w in expected_v.cont_to_iterator()
+        }
+        expected_v, mw, vw = [
+            expected_v.cont_map(lambda _, key_chain, i=i: rets[key_chain][i])
+            for i in range(3)
+        ]
+        _assert_allclose(v, expected_v)
+
+    # the state is a copy of the moments, which are loaded back in-place
+    state = optimizer.state
+    _assert_allclose(state.mw, mw)
+    _assert_allclose(state.vw, vw)
+    optimizer.step(v, grads)
+    optimizer.set_state(state)
+    _assert_allclose(optimizer.state.mw, mw)
+    _assert_allclose(optimizer.state.vw, vw)
+    restored = getattr(ivy, optimizer_name)(lr=0.1)
+    restored.set_state(state)
+    _assert_allclose(restored.state.mw, mw)
+    _assert_allclose(restored.state.vw, vw)
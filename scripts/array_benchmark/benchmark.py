@@ -0,0 +1,53 @@
+"""
+Benchmark the allocation time and memory footprint of ivy.Array wrappers.
+
+Each wrapper is created around an existing native array, so that the numbers only
+reflect the cost of the ivy.Array object itself and not of the native allocation.
+
+Usage: python scripts/array_benchmark/benchmark.py [backend] [num_arrays]
+"""
+import sys
+import time
+import tracemalloc
+
+import ivy
+
+
+def benchmark(backend="numpy", num_arrays=1000000):
+    ivy.set_backend(backend)
+    native = ivy.random_uniform(shape=(4,)).data
+
+    start = time.perf_counter()
+    for _ in range(num_arrays):
+        ivy.Array(native)
+    elapsed = time.perf_counter() - start
+
+    # keep the wrappers alive to measure their retained memory
+    tracemalloc.start()
+    arrays = [ivy.Array(native) for _ in range(num_arrays)]
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    # accessing the metadata fills in the lazily computed fields
+    start = time.perf_counter()
+    for x in arrays[: num_arrays // 10]:
+        x.dtype, x.device, x.size
+    metadata = time.perf_counter() - start
+    del arrays
+
+    print("arrays:                  {}".format(num_arrays))
+    print("allocation (us/array):   {:.3f}".format(elapsed / num_arrays * 1e6))
+    print("retained (bytes/array):  {:.1f}".format(retained / num_arrays))
+    print(
+        "metadata access (us/array): {:.3f}".format(
+            metadata / max(num_arrays // 10, 1) * 1e6
+        )
+    )
+    ivy.previous_backend()
+
+
+if __name__ == "__main__":
+    benchmark(
+        backend=sys.argv[1] if len(sys.argv) > 1 else "numpy",
+        num_arrays=int(sys.argv[2]) if len(sys.argv) > 2 else 1000000,
+    )
@@ -0,0 +1,44 @@
+"""
+Benchmark the latency of repeatedly switching the global backend, with the wrapped
+backend namespaces rebuilt on every switch and with them cached across switches.
+
+Usage: python scripts/backend_switch_benchmark/benchmark.py [backends] [num_switches]
+
+where backends is a comma separated list, e.g. numpy,torch
+"""
+import sys
+import time
+
+import ivy
+
+
+def _time_per_switch(backends, num_switches, cached):
+    # one switch sets a backend and then returns to the previous one
+    times = list()
+    for i in range(num_switches):
+        if not cached:
+            ivy.clear_backend_cache()
+        backend = backends[i % len(backends)]
+        start = time.perf_counter()
+        ivy.set_backend(backend)
+        ivy.previous_backend()
+        times.append(time.perf_counter() - start)
+    return sum(times) / num_switches * 1e3
+
+
+def benchmark(backends=("numpy",), num_switches=50):
+    ivy.set_backend(backends[0])
+    uncached = _time_per_switch(backends, num_switches, cached=False)
+    cached = _time_per_switch(backends, num_switches, cached=True)
+    print("backends:         {}".format(", ".join(backends)))
+    print("uncached (ms):    {:.3f}".format(uncached))
+    print("cached (ms):      {:.3f}".format(cached))
+    print("speedup:          {:.1f}x".format(uncached / cached))
+    ivy.previous_backend()
+
+
+if __name__ == "__main__":
+    benchmark(
+        backends=tuple(sys.argv[1].split(",")) if len(sys.argv) > 1 else ("numpy",),
+        num_switches=int(sys.argv[2]) if len(sys.argv) > 2 else 50,
+    )
@@ -0,0 +1,90 @@
+"""
+Benchmark leaf-wise operations on a large ivy.Container of model parameters.
+
+The container mimics the parameters of a model with many layers, each holding a few
+sub-modules of small weight arrays, so that the timings are dominated by the
+traversal of the container rather than by the arrays themselves.
+
+Usage: python scripts/container_benchmark/benchmark.py [backend] [num_leaves]
+"""
+import sys
+import time
+
+import ivy
+
+
+def _make_params(num_leaves):
+    # the leaves are native arrays, shared between the sub-modules
+    weights = [ivy.to_native(ivy.ones((4,)) * k) for k in range(10)]
+    layers = dict()
+    for i in range(num_leaves // 100):
+        layers["layer_{}".format(i)] = {
+            "sub_{}".format(j): {"w_{}".format(k): w for k, w in enumerate(weights)}
+            for j in range(10)
+        }
+    return ivy.Container(layers)
+
+
+def _time(fn, repeats=5):
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) / repeats
+
+
+def benchmark(backend="numpy", num_leaves=10000):
+    ivy.set_backend(backend)
+    params = _make_params(int(num_leaves))
+    grads = params.cont_map(lambda x, kc: x * 0.1)
+    flat = params.cont_to_flat_list()
+    print("leaves: {}".format(len(flat)))
+    # the key chains of every tenth leaf, as queried when masking gradients
+    key_chains = params.cont_all_key_chains()[::10]
+    masked = {kc: flat[0] for kc in key_chains}
+    timings = [
+        ("cont_to_flat_list", lambda: params.cont_to_flat_list()),
+        ("cont_from_flat_list", lambda: params.cont_from_flat_list(list(flat))),
+        ("cont_map (identity)", lambda: params.cont_map(lambda x, kc: x)),
+        ("cont_multi_map (add)", lambda: params + grads),
+        (
+            "gradient descent step",
+            lambda: ivy.Container.cont_multi_map(
+                lambda xs, _: xs[0] - 0.1 * xs[1], [params, grads]
+            ),
+        ),
+        ("ivy.multiply", lambda: ivy.multiply(params, grads)),
+        ("cont_at_key_chains", lambda: params.cont_at_key_chains(key_chains)),
+        (
+            "cont_set_at_key_chains",
+            lambda: grads.cont_set_at_key_chains(masked, inplace=True),
+        ),
+        ("cont_prune_key_chains", lambda: params.cont_prune_key_chains(key_chains)),
+        ("__getitem__ (key chains)", lambda: [params[kc] for kc in key_chains]),
+        (
+            "cont_identical_structure",
+            lambda: ivy.Container.cont_identical_structure([params, grads]),
+        ),
+        (
+            "cont_assert_identical_structure",
+            lambda: ivy.Container.cont_assert_identical_structure([params, grads]),
+        ),
+        (
+            "cont_structural_diff",
+            lambda: ivy.Container.cont_structural_diff(
+                params, grads, mode="diff_only"
+            ),
+        ),
+        (
+            "ivy.multiply (stacked)",
+            lambda: ivy.Container.cont_multi_map_in_function(
+                "multiply", params, grads, stack_leaves=True
+            ),
+        ),
+    ]
+    for name, fn in timings:
+        print("{:32}{:>10.2f} ms".format(name, _time(fn) * 1e3))
+
+
+if __name__ == "__main__":
+    benchmark(*sys.argv[1:])
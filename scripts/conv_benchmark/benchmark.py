@@ -0,0 +1,115 @@
+"""
+Benchmark the numpy backend convolutions against the previous tiled implementation.
+
+The previous implementation multiplied the strided windows of the input with the
+filters after tiling them across the output channels, which materialized a
+B x OH x OW x KH x KW x I x O tensor. The current one selects between an im2col
+matrix multiplication, an FFT and a direct accumulation for depthwise filters.
+
+Usage: python scripts/conv_benchmark/benchmark.py [repeats]
+"""
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+import ivy
+from ivy.functional.backends.numpy import layers
+
+
+def _tiled_conv(x, filters, strides, padding, dims, feature_group_count=1):
+    # the previous implementation, kept here as the reference point
+    strides = [strides] * dims
+    x, filters = layers._dilate_pad_conv(x, filters, strides, padding, dims, [1] * dims)
+    filter_shape = list(filters.shape[0:dims])
+    input_dim = filters.shape[-2]
+    output_dim = filters.shape[-1] // feature_group_count
+    new_shape = [
+        (x.shape[i + 1] - filter_shape[i]) // strides[i] + 1 for i in range(dims)
+    ]
+    new_shape = [x.shape[0], *new_shape] + filter_shape + [input_dim]
+    res = []
+    for i, j in zip(
+        range(0, x.shape[-1], input_dim), range(0, filters.shape[-1], output_dim)
+    ):
+        sliced_x = x[..., i : i + input_dim]
+        sliced_filters = filters[..., j : j + output_dim]
+        normal_strides = [sliced_x.strides[k] for k in range(1, dims + 2)]
+        changed_strides = [
+            sliced_x.strides[k] * strides[k - 1] for k in range(1, dims + 1)
+        ]
+        sub_matrices = np.lib.stride_tricks.as_strided(
+            sliced_x,
+            new_shape,
+            (x.strides[0], *changed_strides, *normal_strides),
+            writeable=False,
+        )
+        tiled = np.tile(
+            np.expand_dims(sub_matrices, -1), [1] * (dims * 2 + 2) + [output_dim]
+        )
+        mult = tiled * sliced_filters.reshape(
+            [1] * (dims + 1) + filter_shape + [input_dim, output_dim]
+        )
+        res.append(np.sum(mult, tuple(range(dims + 1, dims * 2 + 2))))
+    return np.concatenate(res, axis=-1)
+
+
+def _measure(fn, repeats):
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    elapsed = (time.perf_counter() - start) / repeats
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def benchmark(repeats=3):
+    ivy.set_backend("numpy")
+    rng = np.random.default_rng(0)
+    cases = [
+        # name, input shape, filter shape, strides, dims, feature group count
+        ("conv1d 3 x 64->256", (8, 512, 64), (3, 64, 256), 1, 1, 1),
+        ("conv2d 3x3 64->256", (4, 32, 32, 64), (3, 3, 64, 256), 1, 2, 1),
+        ("conv2d 3x3 s2 64->256", (4, 32, 32, 64), (3, 3, 64, 256), 2, 2, 1),
+        ("conv2d 11x11 3->64", (4, 64, 64, 3), (11, 11, 3, 64), 1, 2, 1),
+        ("conv2d 9x9 32->32", (2, 48, 48, 32), (9, 9, 32, 32), 1, 2, 1),
+        ("conv2d 15x15 3->8 (fft)", (16, 64, 64, 3), (15, 15, 3, 8), 1, 2, 1),
+        ("depthwise 3x3 x 128", (4, 32, 32, 128), (3, 3, 1, 128), 1, 2, 128),
+        ("conv3d 3x3x3 16->64", (2, 16, 16, 16, 16), (3, 3, 3, 16, 64), 1, 3, 1),
+    ]
+    print(
+        "{:24}{:>12}{:>12}{:>10}{:>12}{:>12}".format(
+            "case", "tiled (ms)", "new (ms)", "speedup", "tiled (MB)", "new (MB)"
+        )
+    )
+    for name, x_shape, filter_shape, strides, dims, groups in cases:
+        x = rng.standard_normal(x_shape).astype("float32")
+        filters = rng.standard_normal(filter_shape).astype("float32")
+        tiled_time, tiled_peak = _measure(
+            lambda: _tiled_conv(x, filters, strides, "SAME", dims, groups), repeats
+        )
+        new_time, new_peak = _measure(
+            lambda: layers.conv_general_dilated(
+                x, filters, strides, "SAME", dims=dims, feature_group_count=groups
+            ),
+            repeats,
+        )
+        print(
+            "{:24}{:>12.2f}{:>12.2f}{:>9.1f}x{:>12.1f}{:>12.1f}".format(
+                name,
+                tiled_time * 1e3,
+                new_time * 1e3,
+                tiled_time / new_time,
+                tiled_peak / 2**20,
+                new_peak / 2**20,
+            )
+        )
+
+
+if __name__ == "__main__":
+    benchmark(*[int(arg) for arg in sys.argv[1:]])
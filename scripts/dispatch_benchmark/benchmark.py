@@ -0,0 +1,64 @@
+"""
+Benchmark the per-call overhead of the wrapped ivy functions, with and without the
+cached dispatch plans.
+
+The overhead is reported as the time of the wrapped ivy call minus the time of the
+raw backend call on the equivalent native arrays.
+
+Usage: python scripts/dispatch_benchmark/benchmark.py [backend] [num_calls]
+"""
+import sys
+import timeit
+
+import ivy
+
+
+def _time_per_call(fn, num_calls):
+    # best of several repeats, in microseconds
+    return min(timeit.repeat(fn, number=num_calls, repeat=5)) / num_calls * 1e6
+
+
+def benchmark(backend="numpy", num_calls=2000):
+    ivy.set_backend(backend)
+    backend_module = ivy.current_backend()
+    x = ivy.random_uniform(shape=(4,))
+    y = ivy.random_uniform(shape=(4,))
+    m = ivy.random_uniform(shape=(4, 4))
+    cases = {
+        "add": (
+            lambda: ivy.add(x, y),
+            lambda: backend_module.add(x.data, y.data),
+        ),
+        "matmul": (
+            lambda: ivy.matmul(m, m),
+            lambda: backend_module.matmul(m.data, m.data),
+        ),
+        "sum": (
+            lambda: ivy.sum(m),
+            lambda: backend_module.sum(m.data),
+        ),
+    }
+    print(
+        "{:<8}{:>12}{:>16}{:>16}{:>10}".format(
+            "fn", "raw (us)", "uncached (us)", "cached (us)", "speedup"
+        )
+    )
+    for name, (wrapped, raw) in cases.items():
+        raw_time = _time_per_call(raw, num_calls)
+        ivy.set_dispatch_cache_mode(False)
+        uncached = _time_per_call(wrapped, num_calls) - raw_time
+        ivy.unset_dispatch_cache_mode()
+        cached = _time_per_call(wrapped, num_calls) - raw_time
+        print(
+            "{:<8}{:>12.2f}{:>16.2f}{:>16.2f}{:>9.2f}x".format(
+                name, raw_time, uncached, cached, uncached / cached
+            )
+        )
+    ivy.previous_backend()
+
+
+if __name__ == "__main__":
+    benchmark(
+        backend=sys.argv[1] if len(sys.argv) > 1 else "numpy",
+        num_calls=int(sys.argv[2]) if len(sys.argv) > 2 else 2000,
+    )
@@ -0,0 +1,56 @@
+"""
+Benchmark the cost of reading the global mode stacks, which are now local to each
+thread and asyncio task, against reading a plain list as the stacks used to be.
+
+Usage: python scripts/global_modes_benchmark/benchmark.py [num_reads]
+"""
+import sys
+import timeit
+
+import ivy
+from ivy.utils.context import ContextStack
+
+
+def _time_per_read(fn, num_reads):
+    # best of several repeats, in nanoseconds
+    return min(timeit.repeat(fn, number=num_reads, repeat=5)) / num_reads * 1e9
+
+
+def benchmark(num_reads=1000000):
+    plain_stack = list()
+    context_stack = ContextStack("benchmark_stack")
+
+    def _read_plain():
+        if not plain_stack:
+            return True
+        return plain_stack[-1]
+
+    def _read_context():
+        stack = context_stack.get()
+        if not stack:
+            return True
+        return stack[-1]
+
+    cases = {
+        "plain list": _read_plain,
+        "context stack": _read_context,
+        "ivy.get_dynamic_backend": ivy.get_dynamic_backend,
+        "ivy.get_nestable_mode": ivy.get_nestable_mode,
+    }
+    print("{:<28}{:>12}{:>12}".format("read", "empty (ns)", "set (ns)"))
+    for name, fn in cases.items():
+        empty = _time_per_read(fn, num_reads)
+        plain_stack.append(False)
+        context_stack.append(False)
+        ivy.set_dynamic_backend(False)
+        ivy.set_nestable_mode(False)
+        pushed = _time_per_read(fn, num_reads)
+        plain_stack.pop(-1)
+        context_stack.pop(-1)
+        ivy.unset_dynamic_backend()
+        ivy.unset_nestable_mode()
+        print("{:<28}{:>12.1f}{:>12.1f}".format(name, empty, pushed))
+
+
+if __name__ == "__main__":
+    benchmark(num_reads=int(sys.argv[1]) if len(sys.argv) > 1 else 1000000)
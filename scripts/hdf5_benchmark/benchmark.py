@@ -0,0 +1,81 @@
+"""
+Benchmark loading a container of large arrays saved to disk as an hdf5 file.
+
+The previous loader converted each dataset into a list of its rows before creating
+the array from it. The current one reads each dataset directly into an array, or
+through a memory map of the file for contiguous datasets, and can also load the
+datasets lazily or one batch at a time.
+
+Usage: python scripts/hdf5_benchmark/benchmark.py [size_mb] [repeats]
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import h5py
+
+import ivy
+
+
+def _list_load(filepath):
+    # the previous implementation, kept here as the reference point
+    with h5py.File(filepath, "r") as h5_obj:
+        return ivy.Container(
+            {
+                key: ivy.array(list(value[:]), dtype=str(value[:].dtype))
+                for key, value in h5_obj.items()
+            }
+        )
+
+
+def _iterate_batches(filepath):
+    for batch in ivy.Container.cont_batches_from_disk_as_hdf5(filepath, 1024):
+        pass
+
+
+def _measure(fn, repeats):
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    elapsed = (time.perf_counter() - start) / repeats
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def benchmark(size_mb=64, repeats=3):
+    ivy.set_backend("numpy")
+    rows = int(size_mb) * 2**20 // (4 * 256 * 4)
+    container = ivy.Container(
+        {"x_{}".format(i): ivy.random_normal(shape=(rows, 256)) for i in range(4)}
+    )
+    filepath = os.path.join(tempfile.mkdtemp(), "container.hdf5")
+    container.cont_to_disk_as_hdf5(filepath, chunks=False)
+    cases = [
+        ("list of rows", lambda: _list_load(filepath)),
+        ("direct", lambda: ivy.Container.cont_from_disk_as_hdf5(filepath)),
+        (
+            "memory map",
+            lambda: ivy.Container.cont_from_disk_as_hdf5(filepath, mmap=True),
+        ),
+        (
+            "lazy",
+            lambda: ivy.Container.cont_from_disk_as_hdf5(filepath, lazy=True),
+        ),
+        ("batches of 1024", lambda: _iterate_batches(filepath)),
+    ]
+    print("{} MB in 4 datasets of shape ({}, 256)".format(size_mb, rows))
+    print("{:18}{:>12}{:>16}".format("loading", "time (ms)", "peak (MB)"))
+    for name, fn in cases:
+        elapsed, peak = _measure(fn, int(repeats))
+        print("{:18}{:>12.2f}{:>16.1f}".format(name, elapsed * 1e3, peak / 2**20))
+    os.remove(filepath)
+
+
+if __name__ == "__main__":
+    benchmark(*sys.argv[1:])
@@ -0,0 +1,60 @@
+"""
+Benchmark how ivy.lstm_update and the stateful LSTM layer scale with sequence length.
+
+Usage: python scripts/lstm_benchmark/benchmark.py [backend] [batch_size] [channels]
+"""
+import sys
+import time
+
+import ivy
+
+
+def _time(fn, repeats=5):
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) / repeats
+
+
+def benchmark(backend="numpy", batch_size=16, channels=64):
+    ivy.set_backend(backend)
+    batch_size, channels = int(batch_size), int(channels)
+    init_h = ivy.zeros((batch_size, channels))
+    init_c = ivy.zeros((batch_size, channels))
+    kernel = ivy.random_normal(shape=(channels, 4 * channels)) * 0.1
+    recurrent_kernel = ivy.random_normal(shape=(channels, 4 * channels)) * 0.1
+    bias = ivy.zeros((4 * channels,))
+    layer = ivy.LSTM(channels, channels, num_layers=2, return_state=False)
+
+    print("batch size {}, {} channels".format(batch_size, channels))
+    print(
+        "{:>10}{:>18}{:>18}{:>18}".format(
+            "timesteps", "update (ms)", "masked (ms)", "2-layer LSTM (ms)"
+        )
+    )
+    for timesteps in (16, 64, 256, 1024):
+        x = ivy.random_normal(shape=(batch_size, timesteps, channels))
+        mask = ivy.arange(timesteps) < ivy.expand_dims(
+            ivy.arange(batch_size) % timesteps + 1, axis=-1
+        )
+        update = _time(
+            lambda: ivy.lstm_update(
+                x, init_h, init_c, kernel, recurrent_kernel, bias=bias
+            )
+        )
+        masked = _time(
+            lambda: ivy.lstm_update(
+                x, init_h, init_c, kernel, recurrent_kernel, bias=bias, mask=mask
+            )
+        )
+        stacked = _time(lambda: layer(x))
+        print(
+            "{:>10}{:>18.2f}{:>18.2f}{:>18.2f}".format(
+                timesteps, update * 1e3, masked * 1e3, stacked * 1e3
+            )
+        )
+
+
+if __name__ == "__main__":
+    benchmark(*sys.argv[1:])
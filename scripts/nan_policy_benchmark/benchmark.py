@@ -0,0 +1,50 @@
+"""
+Benchmark the overhead of the nan checks of the functions handling nans.
+
+A function concatenating a list of arrays is decorated with ivy.handle_nans, and is
+timed with each nan policy. The previous check, which reduced and synchronized each
+array separately, is timed as well.
+
+Usage: python scripts/nan_policy_benchmark/benchmark.py [backend] [num_arrays]
+"""
+import sys
+import timeit
+
+import ivy
+
+
+def _time_per_call(fn, num_calls=200):
+    # best of several repeats, in microseconds
+    return min(timeit.repeat(fn, number=num_calls, repeat=5)) / num_calls * 1e6
+
+
+def _per_array_check(x):
+    return ivy.nested_any(x, lambda a: ivy.is_array(a) and bool(ivy.isnan(a).any()))
+
+
+def benchmark(backend="numpy", num_arrays=32):
+    ivy.set_backend(backend)
+    backend_module = ivy.current_backend()
+    arrays = [ivy.random_uniform(shape=(256,)).data for _ in range(int(num_arrays))]
+    fn = ivy.handle_nans(lambda x: backend_module.concat(x))
+    print("{} arrays".format(num_arrays))
+    print("{:<40}{:>14}".format("policy", "call (us)"))
+    previous = _time_per_call(lambda: _per_array_check(arrays))
+    print("{:<40}{:>14.2f}".format("previous check, without the call", previous))
+    policies = [
+        ("nothing", dict()),
+        ("warns", dict()),
+        ("warns, outputs", dict(check="outputs")),
+        ("warns, all", dict(check="all")),
+        ("warns, sample_every=100", dict(sample_every=100)),
+        ("warns, sample_rate=0.01", dict(sample_rate=0.01)),
+    ]
+    for name, kwargs in policies:
+        ivy.set_nan_policy(name.split(",")[0], **kwargs)
+        print("{:<40}{:>14.2f}".format(name, _time_per_call(lambda: fn(arrays))))
+        ivy.unset_nan_policy()
+    ivy.previous_backend()
+
+
+if __name__ == "__main__":
+    benchmark(*sys.argv[1:])
@@ -0,0 +1,76 @@
+"""
+Benchmark the step time of the ivy optimizers on a model with many parameters.
+
+Each optimizer step is timed with the update function mapped over each of the
+parameters in turn, with the multi-tensor update function, which updates the
+parameters of each dtype and device together in flat buffers, and with the step of the
+optimizer, which also keeps the moments of Adam and LAMB in persistent flat buffers
+rather than rebuilding them as containers at each step.
+
+Usage: python scripts/optimizer_benchmark/benchmark.py [backend] [num_params]
+"""
+import logging
+import sys
+import time
+
+import ivy
+
+
+def _make_params(num_params):
+    # pairs of weights and biases of a stack of dense layers with varying widths
+    params = dict()
+    for i in range(num_params // 2):
+        channels = 16 * (i % 8 + 1)
+        params["layer_{}".format(i)] = {
+            "w": ivy.random_normal(shape=(channels, 64)),
+            "b": ivy.random_normal(shape=(channels,)),
+        }
+    return ivy.Container(params)
+
+
+def _time(fn, repeats=5):
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) / repeats
+
+
+def _per_leaf(fn_name, *args, **kwargs):
+    return ivy.Container.cont_multi_map_in_function(fn_name, *args, **kwargs)
+
+
+def benchmark(backend="numpy", num_params=500):
+    ivy.set_backend(backend)
+    # the numpy backend warns that stop_gradient has no effect on every update
+    logging.disable(logging.WARNING)
+    params = _make_params(int(num_params))
+    grads = params.cont_map(lambda x, kc: x * 0.01)
+    mw, vw = grads * 0.1, grads**2
+    lr = 1e-3
+    cases = [
+        ("SGD", ivy.SGD(lr=lr), "gradient_descent_update", ()),
+        ("LARS", ivy.LARS(lr=lr), "lars_update", ()),
+        ("Adam", ivy.Adam(lr=lr), "adam_update", (mw, vw, 1)),
+        ("LAMB", ivy.LAMB(lr=lr), "lamb_update", (mw, vw, 1)),
+    ]
+    print("{} parameters".format(len(params.cont_to_flat_list())))
+    print(
+        "{:10}{:>18}{:>20}{:>14}".format(
+            "optimizer", "per leaf (ms)", "multi-tensor (ms)", "step (ms)"
+        )
+    )
+    for name, optimizer, fn_name, state in cases:
+        per_leaf_time = _time(lambda: _per_leaf(fn_name, params, grads, lr, *state))
+        multi_tensor_time = _time(
+            lambda: getattr(ivy, fn_name)(params, grads, lr, *state)
+        )
+        step_time = _time(lambda: optimizer.step(params, grads))
+        print(
+            "{:10}{:>18.2f}{:>20.2f}{:>14.2f}".format(
+                name, per_leaf_time * 1e3, multi_tensor_time * 1e3, step_time * 1e3
+            )
+        )
+
+if __name__ == "__main__":
+    benchmark(*sys.argv[1:])
@@ -0,0 +1,69 @@
+"""
+Benchmark the throughput of a training loop fed by ivy.ContainerPrefetcher.
+
+Each batch is loaded with a fixed latency, standing in for reading and decoding files,
+and each step spends a fixed time computing on the batch. Loading the batches
+synchronously adds the two, while prefetching overlaps them.
+
+Usage: python scripts/prefetch_benchmark/benchmark.py [num_batches] [load_ms] [step_ms]
+"""
+import sys
+import time
+
+import numpy as np
+
+import ivy
+
+
+class _Loader:
+    def __init__(self, load_time):
+        self._load_time = load_time
+
+    def __call__(self, i):
+        time.sleep(self._load_time)
+        return {
+            "images": np.full((32, 64, 64, 3), i, dtype=np.float32),
+            "labels": np.arange(32) + i,
+        }
+
+
+def _train(batches, step_time):
+    start = time.perf_counter()
+    num_batches = 0
+    for batch in batches:
+        ivy.mean(batch.images)
+        time.sleep(step_time)
+        num_batches += 1
+    return num_batches / (time.perf_counter() - start)
+
+
+def benchmark(num_batches=50, load_ms=10, step_ms=10):
+    ivy.set_backend("numpy")
+    num_batches = int(num_batches)
+    load_fn = _Loader(float(load_ms) / 1e3)
+    step_time = float(step_ms) / 1e3
+    header = "{} batches, {} ms to load, {} ms per step"
+    print(header.format(num_batches, load_ms, step_ms))
+    print("{:32}{:>14}{:>14}".format("loader", "batches/s", "stall (s)"))
+    synchronous = _train(
+        (ivy.Container(load_fn(i)) for i in range(num_batches)), step_time
+    )
+    print("{:32}{:>14.1f}{:>14}".format("synchronous", synchronous, "-"))
+    cases = [
+        ("1 thread", dict(num_workers=1)),
+        ("4 threads", dict(num_workers=4, buffer_size=8)),
+        ("2 processes", dict(num_workers=2, use_processes=True)),
+        (
+            "2 processes, shared memory",
+            dict(num_workers=2, use_processes=True, use_shared_memory=True),
+        ),
+    ]
+    for name, kwargs in cases:
+        with ivy.ContainerPrefetcher(load_fn, num_batches, **kwargs) as prefetcher:
+            batches_per_second = _train(prefetcher, step_time)
+            stall_time = prefetcher.stats["stall_time"]
+        print("{:32}{:>14.1f}{:>14.3f}".format(name, batches_per_second, stall_time))
+
+
+if __name__ == "__main__":
+    benchmark(*sys.argv[1:])
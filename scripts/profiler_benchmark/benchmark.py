@@ -0,0 +1,65 @@
+"""
+Benchmark the overhead of ivy.utils.profiler.FunctionProfiler, and show the calls it
+records for a small workload.
+
+The per-call time of ivy.add is reported without a profiler running, which only costs
+the check of whether one is running, and with profilers recording the signatures of
+the calls and the trace of the calls.
+
+Usage: python scripts/profiler_benchmark/benchmark.py [backend] [num_calls]
+"""
+import sys
+import timeit
+
+import ivy
+from ivy.utils.profiler import FunctionProfiler
+
+
+def _time_per_call(fn, num_calls):
+    # best of several repeats, in microseconds
+    return min(timeit.repeat(fn, number=num_calls, repeat=5)) / num_calls * 1e6
+
+
+def benchmark(backend="numpy", num_calls=2000):
+    ivy.set_backend(backend)
+    num_calls = int(num_calls)
+    x = ivy.random_uniform(shape=(4,))
+    w = ivy.random_uniform(shape=(8, 4))
+    print("{:<32}{:>12}".format("profiler", "add (us)"))
+    cases = [
+        ("none", None),
+        ("signatures", dict()),
+        ("signatures and trace", dict(trace=True)),
+    ]
+    for name, kwargs in cases:
+        if kwargs is None:
+            elapsed = _time_per_call(lambda: ivy.add(x, x), num_calls)
+        else:
+            with FunctionProfiler(**kwargs):
+                elapsed = _time_per_call(lambda: ivy.add(x, x), num_calls)
+        print("{:<32}{:>12.2f}".format(name, elapsed))
+
+    with FunctionProfiler() as profiler:
+        for _ in range(100):
+            ivy.mean(ivy.relu(ivy.linear(x, w)))
+    print()
+    print(
+        "{:<28}{:>8}{:>14}{:>14}{:>14}".format(
+            "function", "calls", "total (us)", "backend (us)", "wrapper (us)"
+        )
+    )
+    for name, stats in list(profiler.stats.items())[:10]:
+        print(
+            "{:<28}{:>8}{:>14.1f}{:>14.1f}{:>14.1f}".format(
+                name,
+                stats["calls"],
+                stats["total_time"] * 1e6,
+                stats["backend_time"] * 1e6,
+                stats["wrapper_time"] * 1e6,
+            )
+        )
+    ivy.previous_backend()
+
+
+if __name__ == "__main__":
+    benchmark(*sys.argv[1:])
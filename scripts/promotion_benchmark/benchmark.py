@@ -0,0 +1,46 @@
+"""
+Benchmark the overhead of the type promotion of the inputs of binary ops.
+
+The backend implementations of binary ops such as add call ivy.promote_types_of_inputs
+on their inputs before calling the native op, so the time of the promotion is reported
+along with the time of the backend add of small arrays, which it dominates.
+
+Usage: python scripts/promotion_benchmark/benchmark.py [backend] [num_calls]
+"""
+import sys
+import timeit
+
+import ivy
+
+
+def _time_per_call(fn, num_calls):
+    # best of several repeats, in microseconds
+    return min(timeit.repeat(fn, number=num_calls, repeat=5)) / num_calls * 1e6
+
+
+def benchmark(backend="numpy", num_calls=2000):
+    ivy.set_backend(backend)
+    backend_module = ivy.current_backend()
+    num_calls = int(num_calls)
+    x = ivy.native_array([1.0, 2.0, 3.0, 4.0], dtype="float32")
+    y = ivy.native_array([1.0, 2.0, 3.0, 4.0], dtype="float32")
+    i = ivy.native_array([1, 2, 3, 4], dtype="int32")
+    cases = {
+        "array-array, same dtype": (x, y),
+        "array-array, int32-float32": (i, x),
+        "scalar-array, float": (x, 2.0),
+        "scalar-array, int": (2, i),
+        "scalar-array, float-int32": (i, 2.0),
+    }
+    print("{:<30}{:>14}{:>14}".format("inputs", "promote (us)", "add (us)"))
+    for name, (x1, x2) in cases.items():
+        promote_time = _time_per_call(
+            lambda: ivy.promote_types_of_inputs(x1, x2), num_calls
+        )
+        add_time = _time_per_call(lambda: backend_module.add(x1, x2), num_calls)
+        print("{:<30}{:>14.2f}{:>14.2f}".format(name, promote_time, add_time))
+    ivy.previous_backend()
+
+
+if __name__ == "__main__":
+    benchmark(*sys.argv[1:])
@@ -0,0 +1,71 @@
+"""
+Benchmark sending large containers to another process through shared memory.
+
+Pickling a container through a multiprocessing queue copies every array into the pipe
+and out of it again, while ivy.to_shared_memory copies the arrays once into a shared
+memory block and only pickles its header, and ivy.from_shared_memory maps the block
+without copying it.
+
+Usage: python scripts/shared_memory_benchmark/benchmark.py [num_leaves] [leaf_size]
+"""
+import multiprocessing
+import sys
+import time
+
+import numpy as np
+
+import ivy
+
+
+def _consumer(inputs, outputs):
+    ivy.set_backend("numpy")
+    while True:
+        item = inputs.get()
+        if item is None:
+            return
+        if isinstance(item, ivy.SharedMemoryHandle):
+            item = ivy.from_shared_memory(item)
+        outputs.put(float(item.cont_to_flat_list()[-1][0]))
+
+
+def _time(fn, repeats=5):
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) / repeats
+
+
+def benchmark(num_leaves=64, leaf_size=2**18):
+    ivy.set_backend("numpy")
+    num_leaves, leaf_size = int(num_leaves), int(leaf_size)
+    container = ivy.Container(
+        {
+            "layer_{}".format(i): {"w": np.full((leaf_size,), i, dtype=np.float32)}
+            for i in range(num_leaves)
+        }
+    )
+    nbytes = num_leaves * leaf_size * 4
+    inputs, outputs = multiprocessing.Queue(), multiprocessing.Queue()
+    consumer = multiprocessing.Process(target=_consumer, args=(inputs, outputs))
+    consumer.start()
+
+    def _send(item):
+        inputs.put(item)
+        outputs.get()
+
+    print("{} leaves, {:.1f} MB".format(num_leaves, nbytes / 2**20))
+    print("{:24}{:>12}{:>12}".format("transport", "time (ms)", "GB/s"))
+    for name, fn in [
+        ("pickle", lambda: _send(container)),
+        ("shared memory", lambda: _send(ivy.to_shared_memory(container))),
+    ]:
+        elapsed = _time(fn)
+        throughput = nbytes / elapsed / 1e9
+        print("{:24}{:>12.2f}{:>12.2f}".format(name, elapsed * 1e3, throughput))
+    inputs.put(None)
+    consumer.join()
+
+
+if __name__ == "__main__":
+    benchmark(*sys.argv[1:])
@@ -0,0 +1,46 @@
+"""
+Generate the tables of the supported and unsupported dtypes and devices of ivy.
+
+ivy.function_supported_dtypes and the related functions parse the source of each
+function and of the ivy functions it calls to find these, and cache the results once
+computed. The tables generated here are shipped with the package, so that the
+functions of ivy are looked up in them rather than parsed, for the backend versions
+the tables were generated with.
+
+Usage: python scripts/support_tables/generate.py [backend ...]
+"""
+import json
+import os
+import sys
+import time
+
+import ivy
+from ivy.functional.ivy import data_type
+
+
+def generate(*backends):
+    os.makedirs(data_type._SUPPORT_TABLES_DIR, exist_ok=True)
+    for backend in backends or ("numpy", "jax", "tensorflow", "torch", "paddle"):
+        try:
+            ivy.set_backend(backend)
+        except Exception as e:
+            print("{}: skipped, {}".format(backend, e))
+            continue
+        start = time.perf_counter()
+        table = data_type._generate_support_table()
+        path = os.path.join(data_type._SUPPORT_TABLES_DIR, "{}.json".format(backend))
+        with open(path, "w") as f:
+            json.dump(table, f, indent=0, sort_keys=True)
+        print(
+            "{} {}: {} functions in {:.1f} s".format(
+                backend,
+                table["version"],
+                len(table["functions"]),
+                time.perf_counter() - start,
+            )
+        )
+        ivy.previous_backend()
+
+
+if __name__ == "__main__":
+    generate(*sys.argv[1:])
@@ -0,0 +1,50 @@
+"""
+Benchmark ivy.vmap on the numpy backend, tracing the function once with batched
+arrays, against looping over the mapped axis as vmap used to do.
+
+Usage: python scripts/vmap_benchmark/benchmark.py [batch_size]
+"""
+import sys
+import timeit
+
+import numpy as np
+
+import ivy
+
+
+def _time_per_call(fn, number=20):
+    # best of several repeats, in milliseconds
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e3
+
+
+def benchmark(batch_size=256):
+    ivy.set_backend("numpy")
+    x = np.random.uniform(size=(batch_size, 16, 32))
+    y = np.random.uniform(size=(batch_size, 32, 16))
+    cases = {
+        "elementwise": (lambda a, b: ivy.tanh(ivy.add(a, b) * 2.0), (x, x)),
+        "matmul": (lambda a, b: ivy.matmul(a, b), (x, y)),
+        "reduction": (lambda a: ivy.mean(a, axis=-1) + ivy.max(a), (x,)),
+    }
+    print(
+        "{:<14}{:>12}{:>14}{:>10}".format("fn", "loop (ms)", "traced (ms)", "speedup")
+    )
+    for name, (fn, args) in cases.items():
+        vmapped = ivy.vmap(fn)
+        vmapped(*args)
+
+        def _loop():
+            return np.stack([ivy.to_numpy(fn(*arrays)) for arrays in zip(*args)])
+
+        loop = _time_per_call(_loop)
+        traced = _time_per_call(lambda: vmapped(*args))
+        print(
+            "{:<14}{:>12.3f}{:>14.3f}{:>9.1f}x".format(
+                name, loop, traced, loop / traced
+            )
+        )
+    ivy.previous_backend()
+
+
+if __name__ == "__main__":
+    benchmark(batch_size=int(sys.argv[1]) if len(sys.argv) > 1 else 256)
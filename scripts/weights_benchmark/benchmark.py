@@ -0,0 +1,72 @@
+"""
+Benchmark loading the weights of a model saved as hdf5 and in the safetensors format.
+
+The safetensors file holds a json header followed by the bytes of all of the weights
+in one contiguous buffer, which is memory-mapped when loading, so that only the
+weights which are used are read from disk, and loading a few layers by key-chain
+prefix only touches those layers.
+
+Usage: python scripts/weights_benchmark/benchmark.py [size_mb] [num_layers]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import ivy
+
+
+def _time(fn, repeats=3):
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) / repeats
+
+
+def _touch(cont):
+    # reads every weight, so that memory-mapped weights are loaded from disk
+    return sum(float(ivy.sum(x)) for x in cont.cont_to_flat_list())
+
+
+def benchmark(size_mb=256, num_layers=64):
+    ivy.set_backend("numpy")
+    size_mb, num_layers = int(size_mb), int(num_layers)
+    width = int((size_mb * 2**20 / 4 / num_layers) ** 0.5)
+    weights = ivy.Container(
+        {
+            "layer_{}".format(i): {
+                "w": ivy.random_normal(shape=(width, width)),
+                "b": ivy.random_normal(shape=(width,)),
+            }
+            for i in range(num_layers)
+        }
+    )
+    directory = tempfile.mkdtemp()
+    hdf5_path = os.path.join(directory, "weights.hdf5")
+    safetensors_path = os.path.join(directory, "weights.safetensors")
+    weights.cont_to_disk_as_hdf5(hdf5_path)
+    weights.cont_to_disk_as_safetensors(safetensors_path)
+
+    def _safetensors(**kwargs):
+        return ivy.Container.cont_from_disk_as_safetensors(safetensors_path, **kwargs)
+
+    cases = [
+        ("hdf5", lambda: ivy.Container.cont_from_disk_as_hdf5(hdf5_path)),
+        ("safetensors (read)", lambda: _safetensors(mmap=False)),
+        ("safetensors (mmap)", lambda: _safetensors()),
+        ("safetensors (mmap, used)", lambda: _touch(_safetensors())),
+        ("safetensors (1 layer)", lambda: _touch(_safetensors(prefixes="layer_0"))),
+    ]
+    print(
+        "{} MB in {} layers of {}x{} weights".format(size_mb, num_layers, width, width)
+    )
+    print("{:28}{:>12}".format("loading", "time (ms)"))
+    for name, fn in cases:
+        print("{:28}{:>12.2f}".format(name, _time(fn) * 1e3))
+    os.remove(hdf5_path)
+    os.remove(safetensors_path)
+
+
+if __name__ == "__main__":
+    benchmark(*sys.argv[1:])
@@ -103,6 +103,7 @@ setup(
         "Source": "https://github.com/unifyai/ivy",
     },
     packages=setuptools.find_packages(),
+    package_data={"ivy": ["functional/ivy/support_tables/*.json"]},
     install_requires=[
         _strip(line)
         for line in open("requirements/requirements.txt", "r", encoding="utf-8")